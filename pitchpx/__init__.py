@@ -3,24 +3,40 @@
 
 import logging
 import click
+from datetime import datetime as dt
 from pitchpx.mlbam import MlbAm, MlbAmBadParameter
 
 __author__ = 'Shinichi Nakagawa'
 
 
 @click.command()
-@click.option('--start', '-s', required=True, help='Start Day(YYYYMMDD)')
-@click.option('--end', '-e', required=True, help='End Day(YYYYMMDD)')
+@click.option('--start', '-s', default=None, help='Start Day(YYYYMMDD, --live: Game Day, default: today)')
+@click.option('--end', '-e', default=None, help='End Day(YYYYMMDD)')
 @click.option('--out', '-o', required=True, default='.', help='Output directory(default:".")')
-def main(start, end, out):
+@click.option('--cache', '-c', default=None, help='Raw XML cache directory(default:setting.yml)')
+@click.option('--offline', is_flag=True, default=False, help='Replay from cache only')
+@click.option('--resume', is_flag=True, default=False, help='Skip days completed by a previous run')
+@click.option('--live', is_flag=True, default=False, help='Poll in-progress games(new at bats, pitches & actions)')
+@click.option('--revalidate', is_flag=True, default=False, help='Conditional request for cached responses')
+def main(start, end, out, cache, offline, resume, live, revalidate):
     """
     Scrape a MLBAM Data
     :param start: Start Day(YYYYMMDD)
     :param end: End Day(YYYYMMDD)
     :param out: Output directory(default:"../output/mlb")
+    :param cache: Raw XML cache directory(default:setting.yml)
+    :param offline: Replay from cache only
+    :param resume: Skip days completed by a previous run
+    :param live: Poll in-progress games
+    :param revalidate: Conditional request for cached responses
     """
     try:
         logging.basicConfig(level=logging.WARNING)
-        MlbAm.scrape(start, end, out)
+        if live:
+            MlbAm.live(start or dt.now().strftime(MlbAm.DATE_FORMAT), out, cache=cache)
+            return
+        if not start or not end:
+            raise click.UsageError('--start and --end are required.')
+        MlbAm.scrape(start, end, out, cache=cache, offline=offline, resume=resume, revalidate=revalidate)
     except MlbAmBadParameter as e:
         raise click.BadParameter(e)
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+import numpy as np
+from pitchpx.baseball.retrosheet import RetroSheet
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class BaseOutMatrix(object):
+    """
+    Run expectancy(RE24), base-out state transition & win probability matrices(a season)
+    Sums & counts only: matrices are merged by addition(games, workers, runs)
+    Counted games(retro_game_id) are kept with the matrices
+    Base-out state: at bat row start_base_out_state & end_base_out_state(0-23, three outs: 24)
+    """
+    VERSION = 2
+    STATES = RetroSheet.BASE_OUT_STATES
+    END_STATES = RetroSheet.BASE_OUT_STATES + 1
+    INNINGS = 10  # 1-9 & extra innings
+    RUN_DIFF = 10  # batting team run differential(-10 to 10, clipped)
+    ARRAYS = (
+        # RE24: runs to the end of the inning & plate appearances(three out innings only)
+        ('re_runs', (STATES, )),
+        ('re_count', (STATES, )),
+        # start state x end state: plate appearances & runs on the play
+        ('transition_count', (STATES, END_STATES)),
+        ('transition_runs', (STATES, END_STATES)),
+        # inning x bat_home_id x start state x run differential: plate appearances & batting team wins
+        ('wp_count', (INNINGS, 2, STATES, RUN_DIFF * 2 + 1)),
+        ('wp_wins', (INNINGS, 2, STATES, RUN_DIFF * 2 + 1)),
+        ('games', ()),
+    )
+
+    def __init__(self):
+        for name, shape in self.ARRAYS:
+            setattr(self, name, np.zeros(shape, dtype=np.int64))
+        self.game_ids = set()
+
+    def add_game(self, atbats):
+        """
+        Add a game
+        :param atbats: at bat rows of a game(mlbam_atbat)
+        """
+        atbats = sorted(atbats, key=lambda atbat: atbat['ab_number'])
+        if not atbats:
+            return
+        score = [0, 0]  # key: bat_home_id(0: away, 1: home)
+        halves, half_of = [], []  # half inning first plate appearance & half inning of plate appearances
+        starts, ends, runs, innings, bat_home_ids, run_diffs = [], [], [], [], [], []
+        half = None
+        for atbat in atbats:
+            bat_home_id = atbat['bat_home_id']
+            if (atbat['inning_number'], bat_home_id) != half:
+                half = (atbat['inning_number'], bat_home_id)
+                halves.append(len(starts))
+            half_of.append(len(halves) - 1)
+            after = (atbat['away_team_runs'], atbat['home_team_runs'])
+            starts.append(atbat['start_base_out_state'])
+            ends.append(atbat['end_base_out_state'])
+            runs.append(after[bat_home_id] - score[bat_home_id])
+            innings.append(min(atbat['inning_number'], self.INNINGS) - 1)
+            bat_home_ids.append(bat_home_id)
+            run_diffs.append(score[bat_home_id] - score[1 - bat_home_id])
+            score = list(after)
+        starts, ends, runs = np.array(starts), np.array(ends), np.array(runs, dtype=np.int64)
+        # last plate appearance of the half inning
+        last = np.array(halves[1:] + [len(starts)], dtype=np.int64)[half_of] - 1
+        valid = starts < self.STATES
+        complete = valid & (ends[last] == RetroSheet.BASE_OUT_STATE_INNING_END)
+        cumsum = np.cumsum(runs)
+        np.add.at(self.re_runs, starts[complete], (cumsum[last] - cumsum + runs)[complete])
+        np.add.at(self.re_count, starts[complete], 1)
+        np.add.at(self.transition_count, (starts[valid], ends[valid]), 1)
+        np.add.at(self.transition_runs, (starts[valid], ends[valid]), runs[valid])
+        wp_index = (
+            np.array(innings)[valid],
+            np.array(bat_home_ids)[valid],
+            starts[valid],
+            np.clip(run_diffs, -self.RUN_DIFF, self.RUN_DIFF)[valid] + self.RUN_DIFF,
+        )
+        np.add.at(self.wp_count, wp_index, 1)
+        if score[0] != score[1]:
+            # winner: bat_home_id
+            wins = wp_index[1] == int(score[1] > score[0])
+            np.add.at(self.wp_wins, tuple([index[wins] for index in wp_index]), 1)
+        self.games += 1
+        self.game_ids.add(atbats[0]['retro_game_id'])
+
+    def merge(self, other):
+        """
+        Merge a matrix(the same season)
+        :param other: BaseOutMatrix object
+        """
+        for name, _ in self.ARRAYS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.game_ids |= other.game_ids
+
+    def run_expectancy(self):
+        """
+        RE24(reshape(3, 8): outs x bases)
+        :return: expected runs to the end of the inning(numpy.ndarray, no plate appearance: nan)
+        """
+        return self._ratio(self.re_runs, self.re_count)
+
+    def transition_probability(self):
+        """
+        Base-out state transition probability
+        :return: start state x end state(numpy.ndarray, no plate appearance: nan)
+        """
+        return self._ratio(self.transition_count, self.transition_count.sum(axis=1, keepdims=True))
+
+    def win_probability(self):
+        """
+        Batting team win probability
+        :return: inning x bat_home_id x start state x run differential(numpy.ndarray, no plate appearance: nan)
+        """
+        return self._ratio(self.wp_wins, self.wp_count)
+
+    @classmethod
+    def _ratio(cls, values, counts):
+        """
+        values / counts(zero counts: nan)
+        :param values: numpy.ndarray
+        :param counts: numpy.ndarray
+        :return: numpy.ndarray
+        """
+        counts = np.broadcast_to(counts, values.shape)
+        return np.divide(values, counts, out=np.full(values.shape, np.nan), where=counts > 0)
+
+    def save(self, path):
+        """
+        Write a npz file(atomic)
+        :param path: file path
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+        with os.fdopen(fd, mode='wb') as tmp_file:
+            np.savez_compressed(
+                tmp_file,
+                version=self.VERSION,
+                game_ids=np.array(sorted(self.game_ids), dtype=str),
+                **{name: getattr(self, name) for name, _ in self.ARRAYS}
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a npz file
+        :param path: file path
+        :return: BaseOutMatrix object(other version: empty matrix)
+        """
+        matrix = cls()
+        with np.load(path) as data:
+            if 'version' not in data or data['version'] != cls.VERSION:
+                return matrix
+            for name, shape in cls.ARRAYS:
+                if data[name].shape == shape:
+                    setattr(matrix, name, data[name].astype(np.int64))
+            matrix.game_ids = set(data['game_ids'].tolist())
+        return matrix
@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import numpy as np
+
 __author__ = 'Shinichi Nakagawa'
 
 
@@ -21,6 +23,34 @@ class RetroSheet(object):
     EVENT_22_TRIPLE = ('triple', )
     EVENT_23_HOME_RUN = ('home run', )
     EVENT_CD_HITS = (20, 21, 22, 23)
+    EVENT_CD_GENERIC_OUT = 2
+    # battedball class: resolved by the at bat description
+    BATTEDBALL_DESCRIPTION = '*'
+    # normalized(lower) event text: (event_cd, battedball class)
+    EVENTS = dict([
+        (event_tx, event) for events, event in (
+            (EVENT_02_GENERIC_OUT_FLYBALL, (2, 'F')),
+            (EVENT_02_GENERIC_OUT_LINEDRIVE, (2, 'L')),
+            (EVENT_02_GENERIC_OUT_POPUP, (2, 'P')),
+            (EVENT_02_GENERIC_OUT_GROUNDBALL, (2, 'G')),
+            (EVENT_02_GENERIC_OUT_OTHER, (2, BATTEDBALL_DESCRIPTION)),
+            (EVENT_03_STRIKE_OUT, (3, '')),
+            (EVENT_14_WALK, (14, '')),
+            (EVENT_15_INTENT_WALK, (15, '')),
+            (EVENT_16_HIT_BY_PITCH, (16, '')),
+            (EVENT_19_FIELDERS_CHOICE, (19, '')),
+            (EVENT_20_SINGLE, (20, BATTEDBALL_DESCRIPTION)),
+            (EVENT_21_DOUBLE, (21, BATTEDBALL_DESCRIPTION)),
+            (EVENT_22_TRIPLE, (22, BATTEDBALL_DESCRIPTION)),
+            (EVENT_23_HOME_RUN, (23, BATTEDBALL_DESCRIPTION)),
+        ) for event_tx in events
+    ])
+    EVENT_UNKNOWN = (0, '')
+    # base-out state: outs * 8 + bases(1B: 1, 2B: 2, 3B: 4), three outs(end of inning): 24
+    BASE_MASKS = {'1B': 1, '2B': 2, '3B': 4}
+    BASES = ('___', '1__', '_2_', '12_', '__3', '1_3', '_23', '123')
+    BASE_OUT_STATES = 24
+    BASE_OUT_STATE_INNING_END = 24
 
     @classmethod
     def event_cd(cls, event_tx, ab_des):
@@ -31,53 +61,28 @@ class RetroSheet(object):
         :return: event_cd(int)
         """
         _event_tx = event_tx.lower()
-        _ab_des = ab_des.lower()
-        # Generic out(event_cd:2)
-        if _event_tx in cls.EVENT_02_GENERIC_OUT_FLYBALL:
-            return 2
-        elif _event_tx in cls.EVENT_02_GENERIC_OUT_LINEDRIVE:
-            return 2
-        elif _event_tx in cls.EVENT_02_GENERIC_OUT_POPUP:
-            return 2
-        elif _event_tx in cls.EVENT_02_GENERIC_OUT_GROUNDBALL:
-            return 2
-        elif _event_tx in cls.EVENT_02_GENERIC_OUT_OTHER:
-            return 2
-        # Strike out(event_cd:3)
-        elif _event_tx in cls.EVENT_03_STRIKE_OUT:
-            return 3
-        # Walk(event_cd:14)
-        elif _event_tx in cls.EVENT_14_WALK:
-            return 14
-        # Intent Walk(event_cd:15)
-        elif _event_tx in cls.EVENT_15_INTENT_WALK:
-            return 15
-        # Hit By Pitch(event_cd:16)
-        elif _event_tx in cls.EVENT_16_HIT_BY_PITCH:
-            return 16
+        event = cls.EVENTS.get(_event_tx)
+        if event is not None:
+            return event[0]
+        return cls._event_cd(_event_tx, ab_des)
+
+    @classmethod
+    def _event_cd(cls, _event_tx, ab_des):
+        """
+        Event Code for Retrosheet(not in EVENTS: interference, error & runner out)
+        :param _event_tx: Event text(lower)
+        :param ab_des: at bat description
+        :return: event_cd(int)
+        """
         # Interference(event_cd:17)
-        elif _event_tx.lower().count('interference') > 0:
+        if _event_tx.count('interference') > 0:
             return 17
         # Error(event_cd:18)
         elif _event_tx[-5:] == 'error':
             return 18
-        # Fielder's choice(event_cd:19)
-        elif _event_tx in cls.EVENT_19_FIELDERS_CHOICE:
-            return 19
-        # Single(event_cd:20)
-        elif _event_tx in cls.EVENT_20_SINGLE:
-            return 20
-        # 2B(event_cd:21)
-        elif _event_tx in cls.EVENT_21_DOUBLE:
-            return 21
-        # 3B(event_cd:22)
-        elif _event_tx in cls.EVENT_22_TRIPLE:
-            return 22
-        # HR(event_cd:22)
-        elif _event_tx in cls.EVENT_23_HOME_RUN:
-            return 23
         # Runner Out
         elif _event_tx == 'runner out':
+            _ab_des = ab_des.lower()
             # Caught stealing(event_cd:6)
             if _ab_des.count("caught stealing") > 0:
                 return 6
@@ -100,28 +105,47 @@ class RetroSheet(object):
         :param ab_des: at bat description
         :return: battedball_cd(str)
         """
-        _event_tx = event_tx.lower()
-        # Fly Out
-        if _event_tx in cls.EVENT_02_GENERIC_OUT_FLYBALL:
-            return 'F'
-        # Line Out
-        elif _event_tx in cls.EVENT_02_GENERIC_OUT_LINEDRIVE:
-            return 'L'
-        # Pop Out
-        elif _event_tx in cls.EVENT_02_GENERIC_OUT_POPUP:
-            return 'P'
-        # Grounder
-        elif _event_tx in cls.EVENT_02_GENERIC_OUT_GROUNDBALL:
-            return 'G'
-        # Force out, double play, triple play
-        elif _event_tx in cls.EVENT_02_GENERIC_OUT_OTHER:
-            return cls._battedball_cd(ab_des)
+        event = cls.EVENTS.get(event_tx.lower(), cls.EVENT_UNKNOWN)
+        # Fly Out, Line Out, Pop Out, Grounder, Force out, double play, triple play
+        if event[0] == cls.EVENT_CD_GENERIC_OUT:
+            battedball = event[1]
         # Single, 2B, 3B, HR
         elif event_cd in cls.EVENT_CD_HITS:
-            return cls._battedball_cd(ab_des)
+            battedball = cls.BATTEDBALL_DESCRIPTION
         # Unknown
         else:
             return ''
+        if battedball == cls.BATTEDBALL_DESCRIPTION:
+            return cls._battedball_cd(ab_des)
+        return battedball
+
+    @classmethod
+    def classify(cls, event_txs, ab_descs):
+        """
+        Event Code & Batted ball Code(batch, a column of at bats)
+        :param event_txs: Event texts(iterable)
+        :param ab_descs: at bat descriptions(iterable, same length)
+        :return: event_cd list, battedball_cd list
+        """
+        events = {}  # key: event text value: (event_cd, battedball class)
+        event_cds, battedball_cds = [], []
+        for event_tx, ab_des in zip(event_txs, ab_descs):
+            event = events.get(event_tx)
+            if event is None:
+                event = cls.EVENTS.get(event_tx.lower())
+                if event is None:
+                    _event_tx = event_tx.lower()
+                    # runner out: event_cd by the at bat description
+                    event = (None, '') if _event_tx == 'runner out' else (cls._event_cd(_event_tx, ab_des), '')
+                events[event_tx] = event
+            event_cd, battedball = event
+            if event_cd is None:
+                event_cd = cls._event_cd('runner out', ab_des)
+            if battedball == cls.BATTEDBALL_DESCRIPTION:
+                battedball = cls._battedball_cd(ab_des)
+            event_cds.append(event_cd)
+            battedball_cds.append(battedball)
+        return event_cds, battedball_cds
 
     @classmethod
     def _battedball_cd(cls, ab_des):
@@ -150,6 +174,30 @@ class RetroSheet(object):
         else:
             return ''
 
+    @classmethod
+    def base_out_state(cls, outs_ct, base_mask):
+        """
+        Base-out state
+        :param outs_ct: out count
+        :param base_mask: bases(bit mask, 1B: 1, 2B: 2, 3B: 4)
+        :return: 0-23, three outs: 24
+        """
+        if outs_ct >= 3:
+            return cls.BASE_OUT_STATE_INNING_END
+        return outs_ct * 8 + base_mask
+
+    @classmethod
+    def carry_bases(cls, bases, start_mask, end_mask):
+        """
+        Occupied bases before & after an at bat(runner elements list moving runners only)
+        :param bases: occupied bases after the previous at bat of the half inning(bit mask)
+        :param start_mask: runner start bases(bit mask)
+        :param end_mask: runner end bases(bit mask)
+        :return: occupied bases before the at bat, occupied bases after the at bat(bit mask)
+        """
+        start = bases | start_mask
+        return start, (start & ~start_mask) | end_mask
+
     @classmethod
     def ball_count(cls, ball_tally, strike_tally, pitch_res):
         """
@@ -191,3 +239,48 @@ class RetroSheet(object):
         elif pitch_res == 'B' and (event_cd == 14 or event_cd == 15) and ball_tally == 3:
             return True
         return False
+
+    @classmethod
+    def count_states(cls, pitch_res, ab_ids, event_cds):
+        """
+        Ball/Strike count & PA terminal(batch, a column of pitches)
+        Same result as ball_count & is_pa_terminal pitch by pitch(count reset at every at bat)
+        :param pitch_res: pitching results(Retrosheet format, array like)
+        :param ab_ids: at bat ids(array like, same length, an at bat is a run of the same id)
+        :param event_cds: Event codes of the at bat(array like, same length)
+        :return: ball count, strike count(before the pitch) & PA terminal(numpy.ndarray)
+        """
+        pitch_res = np.asarray(pitch_res)
+        ab_ids = np.asarray(ab_ids)
+        event_cds = np.asarray(event_cds)
+        if not (len(pitch_res) == len(ab_ids) == len(event_cds)):
+            raise ValueError('pitch_res, ab_ids and event_cds must have the same length')
+        if len(pitch_res) == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=bool)
+        ball = pitch_res == 'B'
+        strike = (pitch_res == 'S') | (pitch_res == 'C') | (pitch_res == 'X')
+        foul = pitch_res == 'F'
+        # at bat start offset for every pitch
+        new_ab = np.ones(len(ab_ids), dtype=bool)
+        new_ab[1:] = ab_ids[1:] != ab_ids[:-1]
+        ab_start = np.flatnonzero(new_ab)[np.cumsum(new_ab) - 1]
+        # ball: 0/1 steps capped at 4
+        ball_ct = np.minimum(cls._cumsum_before(ball, ab_start), 4)
+        # strike: strikes & fouls count up to 2, a strike at 2 strikes makes 3(fouls never do)
+        strike_ct = np.minimum(cls._cumsum_before(strike | foul, ab_start), 2)
+        strike_ct[cls._cumsum_before(strike & (strike_ct == 2), ab_start) > 0] = 3
+        terminal = (pitch_res == 'X') \
+            | (((pitch_res == 'S') | (pitch_res == 'C')) & (event_cds == 3) & (strike_ct == 2)) \
+            | (ball & ((event_cds == 14) | (event_cds == 15)) & (ball_ct == 3))
+        return ball_ct, strike_ct, terminal
+
+    @classmethod
+    def _cumsum_before(cls, steps, ab_start):
+        """
+        Steps before the pitch in the at bat(segmented exclusive cumulative sum)
+        :param steps: 0/1 steps(numpy.ndarray)
+        :param ab_start: at bat start offset for every pitch(numpy.ndarray)
+        :return: numpy.ndarray
+        """
+        before = np.cumsum(steps, dtype=np.int64) - steps
+        return before - before[ab_start]
@@ -3,6 +3,7 @@
 
 from collections import OrderedDict
 from pitchpx.mlbam_util import MlbamUtil, MlbamConst
+from pitchpx.mlbam_extractor import MlbamField, MlbamExtractor
 
 __author__ = 'Shinichi Nakagawa'
 
@@ -15,6 +16,32 @@ class Game(object):
     TEAM_TYPE_HOME = 'home'
     TEAM_TYPE_AWAY = 'away'
     DOWNLOAD_FILE_NAME = 'mlbam_game_{day}.{extension}'
+    # game attributes
+    FIELDS = (
+        MlbamField('game_type', 'type', None, MlbamConst.UNKNOWN_SHORT),
+        MlbamField('local_game_time', 'local_game_time', None, MlbamConst.UNKNOWN_FULL),
+        MlbamField('game_id', 'game_pk', None, MlbamConst.UNKNOWN_FULL),
+    )
+    _extract = staticmethod(MlbamExtractor.compile(FIELDS, 'game'))
+    # team attributes(home & away)
+    _extract_team = {
+        team_type: MlbamExtractor.compile((
+            MlbamField('{team_type}_team_id'.format(team_type=team_type), 'code', None, MlbamConst.UNKNOWN_FULL),
+            MlbamField('{team_type}_team_lg'.format(team_type=team_type), 'league', None, MlbamConst.UNKNOWN_FULL),
+            MlbamField('{team_type}_team_name'.format(team_type=team_type), 'name', None, MlbamConst.UNKNOWN_FULL),
+            MlbamField(
+                '{team_type}_team_name_full'.format(team_type=team_type), 'name_full', None, MlbamConst.UNKNOWN_FULL
+            ),
+        ), '{team_type}_team'.format(team_type=team_type))
+        for team_type in (TEAM_TYPE_HOME, TEAM_TYPE_AWAY)
+    }
+    # stadium attributes
+    STADIUM_FIELDS = (
+        MlbamField('park_id', 'id', None, MlbamConst.UNKNOWN_FULL),
+        MlbamField('park_name', 'name', None, MlbamConst.UNKNOWN_FULL),
+        MlbamField('park_loc', 'location', None, MlbamConst.UNKNOWN_FULL),
+    )
+    _extract_stadium = staticmethod(MlbamExtractor.compile(STADIUM_FIELDS, 'stadium'))
 
     st_fl = MlbamConst.UNKNOWN_SHORT
     regseason_fl = MlbamConst.UNKNOWN_SHORT
@@ -119,29 +146,21 @@ class Game(object):
         game = Game(timestamp)
 
         # Base Game Data(Spring Training, Regular Season, Play Off, etc...)
-        game.game_type = MlbamUtil.get_attribute(soup.game, 'type', unknown=MlbamConst.UNKNOWN_SHORT)
+        cls._extract(soup.game.attrs, game)
         game.game_type_des = cls._get_game_type_des(game.game_type)
         game.st_fl = cls._get_st_fl(game.game_type)
         game.regseason_fl = cls._get_regseason_fl(game.game_type)
         game.playoff_fl = cls._get_playoff_fl(game.game_type)
-        game.local_game_time = MlbamUtil.get_attribute(soup.game, 'local_game_time', unknown=MlbamConst.UNKNOWN_FULL)
-        game.game_id = MlbamUtil.get_attribute(soup.game, 'game_pk', unknown=MlbamConst.UNKNOWN_FULL)
 
         # Team Data
-        game.home_team_id = cls._get_team_attribute(soup, cls.TEAM_TYPE_HOME, 'code')
-        game.home_team_lg = cls._get_team_attribute(soup, cls.TEAM_TYPE_HOME, 'league')
-        game.away_team_id = cls._get_team_attribute(soup, cls.TEAM_TYPE_AWAY, 'code')
-        game.away_team_lg = cls._get_team_attribute(soup, cls.TEAM_TYPE_AWAY, 'league')
-        game.home_team_name = cls._get_team_attribute(soup, cls.TEAM_TYPE_HOME, 'name')
-        game.away_team_name = cls._get_team_attribute(soup, cls.TEAM_TYPE_AWAY, 'name')
-        game.home_team_name_full = cls._get_team_attribute(soup, cls.TEAM_TYPE_HOME, 'name_full')
-        game.away_team_name_full = cls._get_team_attribute(soup, cls.TEAM_TYPE_AWAY, 'name_full')
+        for team_type, extract in cls._extract_team.items():
+            team = soup.find('team', type=team_type)
+            extract(team.attrs if team else {}, game)
         game.interleague_fl = cls._get_interleague_fl(game.home_team_lg, game.away_team_lg)
 
         # Stadium Data
-        game.park_id = cls._get_stadium_attribute(soup, 'id')
-        game.park_name = cls._get_stadium_attribute(soup, 'name')
-        game.park_loc = cls._get_stadium_attribute(soup, 'location')
+        stadium = soup.find('stadium')
+        cls._extract_stadium(stadium.attrs if stadium else {}, game)
 
         # Retro ID
         game.retro_game_id = cls._get_retro_id(game.home_team_id, timestamp, game_number)
@@ -202,31 +221,6 @@ class Game(object):
             return MlbamConst.FLG_TRUE
         return MlbamConst.FLG_FALSE
 
-    @classmethod
-    def _get_team_attribute(cls, soup, team_type, name):
-        """
-        get team attribute
-        :param soup: Beautifulsoup object
-        :param team_type: team type(home or away)
-        :param name: attribute name
-        :return: attribute value
-        """
-        if soup.find('team'):
-            return soup.find("team", type=team_type)[name]
-        return MlbamConst.UNKNOWN_FULL
-
-    @classmethod
-    def _get_stadium_attribute(cls, soup, name):
-        """
-        get stadium attribute
-        :param soup: Beautifulsoup object
-        :param name: attribute name
-        :return: attribute value
-        """
-        if soup.find('stadium'):
-            return soup.stadium[name]
-        return MlbamConst.UNKNOWN_FULL
-
     @classmethod
     def _get_interleague_fl(cls, home_team_lg, away_team_lg):
         """
@@ -1,16 +1,108 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import io
 import logging
 from collections import OrderedDict
-from pitchpx.mlbam_util import MlbamUtil, MlbamConst
+from lxml import etree
+from pitchpx.mlbam_util import MlbamUtil, MlbamConst, MlbamElement
 from pitchpx.baseball.retrosheet import RetroSheet
+from pitchpx.game.record import Record
+from pitchpx.mlbam_extractor import MlbamField, MlbamExtractor
+from pitchpx.mlbam_stats import MlbamStats
 
 __author__ = 'Shinichi Nakagawa'
 
 
+class PitchSequence(object):
+    """
+    Pitch sequence of a plate appearance(appended per pitch)
+    """
+    TYPE_DELIMITER = '|'
+
+    def __init__(self):
+        self.pitch_seq = ''
+        self.pitch_type_seq = ''
+
+    @classmethod
+    def from_rows(cls, pitch_list):
+        """
+        Sequence from pitch rows
+        :param pitch_list: Pitching
+        :return: PitchSequence object
+        """
+        sequence = PitchSequence()
+        for pitch in pitch_list:
+            sequence.append(pitch['pitch_res'], pitch['pitch_type'])
+        return sequence
+
+    def append(self, pitch_res, pitch_type):
+        """
+        Append a pitch
+        :param pitch_res: pitching result(S or B or X)
+        :param pitch_type: pitch type
+        :return: (pitch sequence, pitch type sequence)
+        """
+        self.pitch_seq += pitch_res
+        if self.pitch_type_seq:
+            self.pitch_type_seq = self.TYPE_DELIMITER.join([self.pitch_type_seq, pitch_type])
+        else:
+            self.pitch_type_seq = pitch_type
+        return self.pitch_seq, self.pitch_type_seq
+
+
 class Pitch(object):
 
     DOWNLOAD_FILE_NAME = 'mlbam_pitch_{day}.{extension}'
+    LAYOUT_WIDE = 'wide'
+    LAYOUT_NORMALIZED = 'normalized'
+    LAYOUTS = (LAYOUT_WIDE, LAYOUT_NORMALIZED)
+    # at bat fields(wide layout only)
+    PA_FIELDS = (
+        'retro_game_id', 'year', 'month', 'day', 'st_fl', 'regseason_fl', 'playoff_fl', 'game_type', 'game_type_des',
+        'local_game_time', 'game_id', 'home_team_id', 'away_team_id', 'home_team_lg', 'away_team_lg',
+        'interleague_fl', 'park_id', 'park_name', 'park_location', 'inning_number', 'bat_home_id', 'outs_ct',
+        'pit_mlbid', 'pit_first_name', 'pit_last_name', 'pit_box_name', 'pit_hand_cd',
+        'bat_mlbid', 'bat_first_name', 'bat_last_name', 'bat_box_name', 'bat_hand_cd',
+        'ab_number', 'start_bases', 'end_bases', 'event_outs_ct',
+    )
+    # foreign key(normalized layout, mlbam_atbat)
+    KEY_FIELDS = ('retro_game_id', 'ab_number')
+    # pitch attributes
+    FIELDS = (
+        MlbamField('pitch_res', 'type', str, MlbamConst.UNKNOWN_FULL),
+        MlbamField('pitch_des', 'des', str, MlbamConst.UNKNOWN_FULL),
+        MlbamField('pitch_id', 'id', int, None),
+        MlbamField('x', data_type=float),
+        MlbamField('y', data_type=float),
+        MlbamField('start_speed', data_type=float),
+        MlbamField('end_speed', data_type=float),
+        MlbamField('sz_top', data_type=float),
+        MlbamField('sz_bot', data_type=float),
+        MlbamField('pfx_x', data_type=float),
+        MlbamField('pfx_z', data_type=float),
+        MlbamField('px', data_type=float),
+        MlbamField('pz', data_type=float),
+        MlbamField('x0', data_type=float),
+        MlbamField('y0', data_type=float),
+        MlbamField('z0', data_type=float),
+        MlbamField('vx0', data_type=float),
+        MlbamField('vy0', data_type=float),
+        MlbamField('vz0', data_type=float),
+        MlbamField('ax', data_type=float),
+        MlbamField('ay', data_type=float),
+        MlbamField('az', data_type=float),
+        MlbamField('break_y', data_type=float),
+        MlbamField('break_angle', data_type=float),
+        MlbamField('break_length', data_type=float),
+        MlbamField('pitch_type', 'pitch_type', str, MlbamConst.UNKNOWN_SHORT),
+        MlbamField('type_confidence', data_type=float),
+        MlbamField('zone', data_type=float),
+        MlbamField('spin_dir', data_type=float),
+        MlbamField('spin_rate', data_type=float),
+        MlbamField('sv_id', 'sv_id', str, None),
+        MlbamField('event_num', 'event_num', int, -1),
+    )
+    _extract = staticmethod(MlbamExtractor.compile(FIELDS, 'pitch'))
 
     @classmethod
     def is_pa_terminal(cls, ball_tally, strike_tally, pitch_res, event_cd):
@@ -27,15 +119,16 @@ class Pitch(object):
         return MlbamConst.FLG_FALSE
 
     @classmethod
-    def row(cls, pitch, pa, pitch_list, ball_tally, strike_tally):
+    def row(cls, pitch, pa, sequence, ball_tally, strike_tally, layout=LAYOUT_WIDE):
         """
         Pitching Result
         Pitch f/x fields: https://fastballs.wordpress.com/category/pitchfx-glossary/
         :param pitch: pitch object(type:Beautifulsoup)
         :param pa: At bat data for pa(dict)
-        :param pitch_list: Pitching
+        :param sequence: PitchSequence object(previous pitches, this pitch is appended)
         :param ball_tally: Ball telly
         :param strike_tally: Strike telly
+        :param layout: wide(with at bat fields) or normalized(retro_game_id & ab_number, without pa_event_cd)
         :return: {
             'retro_game_id': Retrosheet Game id
             'game_type': Game Type(S/R/F/D/L/W)
@@ -115,116 +208,122 @@ class Pitch(object):
             'event_num': Event Sequence Number(atbat, pitch, action)
         }
         """
-        pitch_res = MlbamUtil.get_attribute_stats(pitch, 'type', str, MlbamConst.UNKNOWN_FULL)
-        pitch_seq = [pitch['pitch_res'] for pitch in pitch_list]
-        pitch_seq.extend([pitch_res])
-        pitch_type = MlbamUtil.get_attribute_stats(pitch, 'pitch_type', str, MlbamConst.UNKNOWN_SHORT)
-        pitch_type_seq = [pitch['pitch_type'] for pitch in pitch_list]
-        pitch_type_seq.extend([pitch_type])
-        pitching = OrderedDict()
-        pitching['retro_game_id'] = pa['retro_game_id']
-        pitching['year'] = pa['year']
-        pitching['month'] = pa['month']
-        pitching['day'] = pa['day']
-        pitching['st_fl'] = pa['st_fl']
-        pitching['regseason_fl'] = pa['regseason_fl']
-        pitching['playoff_fl'] = pa['playoff_fl']
-        pitching['game_type'] = pa['game_type']
-        pitching['game_type_des'] = pa['game_type_des']
-        pitching['local_game_time'] = pa['local_game_time']
-        pitching['game_id'] = pa['game_id']
-        pitching['home_team_id'] = pa['home_team_id']
-        pitching['away_team_id'] = pa['away_team_id']
-        pitching['home_team_lg'] = pa['home_team_lg']
-        pitching['away_team_lg'] = pa['away_team_lg']
-        pitching['interleague_fl'] = pa['interleague_fl']
-        pitching['park_id'] = pa['park_id']
-        pitching['park_name'] = pa['park_name']
-        pitching['park_location'] = pa['park_location']
-        pitching['inning_number'] = pa['inning_number']
-        pitching['bat_home_id'] = pa['bat_home_id']
-        pitching['outs_ct'] = pa['outs_ct']
-        pitching['pit_mlbid'] = pa['pit_mlbid']
-        pitching['pit_first_name'] = pa['pit_first_name']
-        pitching['pit_last_name'] = pa['pit_last_name']
-        pitching['pit_box_name'] = pa['pit_box_name']
-        pitching['pit_hand_cd'] = pa['pit_hand_cd']
-        pitching['bat_mlbid'] = pa['bat_mlbid']
-        pitching['bat_first_name'] = pa['bat_first_name']
-        pitching['bat_last_name'] = pa['bat_last_name']
-        pitching['bat_box_name'] = pa['bat_box_name']
-        pitching['bat_hand_cd'] = pa['bat_hand_cd']
-        pitching['ab_number'] = pa['ab_number']
-        pitching['start_bases'] = pa['start_bases']
-        pitching['end_bases'] = pa['end_bases']
-        pitching['event_outs_ct'] = pa['event_outs_ct']
-        pitching['pa_ball_ct'] = ball_tally
-        pitching['pa_strike_ct'] = strike_tally
-        pitching['pitch_seq'] = ''.join(pitch_seq)
-        pitching['pa_terminal_fl'] = cls.is_pa_terminal(ball_tally, strike_tally, pitch_res, pa['event_cd'])
-        pitching['pa_event_cd'] = pa['event_cd']
-        pitching['pitch_res'] = pitch_res
-        pitching['pitch_des'] = MlbamUtil.get_attribute_stats(pitch, 'des', str, MlbamConst.UNKNOWN_FULL)
-        pitching['pitch_id'] = MlbamUtil.get_attribute_stats(pitch, 'id', int, None)
-        pitching['x'] = MlbamUtil.get_attribute_stats(pitch, 'x', float, None)
-        pitching['y'] = MlbamUtil.get_attribute_stats(pitch, 'y', float, None)
-        pitching['start_speed'] = MlbamUtil.get_attribute_stats(pitch, 'start_speed', float, None)
-        pitching['end_speed'] = MlbamUtil.get_attribute_stats(pitch, 'end_speed', float, None)
-        pitching['sz_top'] = MlbamUtil.get_attribute_stats(pitch, 'sz_top', float, None)
-        pitching['sz_bot'] = MlbamUtil.get_attribute_stats(pitch, 'sz_bot', float, None)
-        pitching['pfx_x'] = MlbamUtil.get_attribute_stats(pitch, 'pfx_x', float, None)
-        pitching['pfx_z'] = MlbamUtil.get_attribute_stats(pitch, 'pfx_z', float, None)
-        pitching['px'] = MlbamUtil.get_attribute_stats(pitch, 'px', float, None)
-        pitching['pz'] = MlbamUtil.get_attribute_stats(pitch, 'pz', float, None)
-        pitching['x0'] = MlbamUtil.get_attribute_stats(pitch, 'x0', float, None)
-        pitching['y0'] = MlbamUtil.get_attribute_stats(pitch, 'y0', float, None)
-        pitching['z0'] = MlbamUtil.get_attribute_stats(pitch, 'z0', float, None)
-        pitching['vx0'] = MlbamUtil.get_attribute_stats(pitch, 'vx0', float, None)
-        pitching['vy0'] = MlbamUtil.get_attribute_stats(pitch, 'vy0', float, None)
-        pitching['vz0'] = MlbamUtil.get_attribute_stats(pitch, 'vz0', float, None)
-        pitching['ax'] = MlbamUtil.get_attribute_stats(pitch, 'ax', float, None)
-        pitching['ay'] = MlbamUtil.get_attribute_stats(pitch, 'ay', float, None)
-        pitching['az'] = MlbamUtil.get_attribute_stats(pitch, 'az', float, None)
-        pitching['break_y'] = MlbamUtil.get_attribute_stats(pitch, 'break_y', float, None)
-        pitching['break_angle'] = MlbamUtil.get_attribute_stats(pitch, 'break_angle', float, None)
-        pitching['break_length'] = MlbamUtil.get_attribute_stats(pitch, 'break_length', float, None)
-        pitching['pitch_type'] = pitch_type
-        pitching['pitch_type_seq'] = '|'.join(pitch_type_seq)
-        pitching['type_confidence'] = MlbamUtil.get_attribute_stats(pitch, 'type_confidence', float, None)
-        pitching['zone'] = MlbamUtil.get_attribute_stats(pitch, 'zone', float, None)
-        pitching['spin_dir'] = MlbamUtil.get_attribute_stats(pitch, 'spin_dir', float, None)
-        pitching['spin_rate'] = MlbamUtil.get_attribute_stats(pitch, 'spin_rate', float, None)
-        pitching['sv_id'] = MlbamUtil.get_attribute_stats(pitch, 'sv_id', str, None)
-        pitching['event_num'] = MlbamUtil.get_attribute_stats(pitch, 'event_num', int, -1)
+        if layout == cls.LAYOUT_WIDE:
+            pitching, keys = PitchRecord(), cls.PA_FIELDS
+        else:
+            pitching, keys = NormalizedPitchRecord(), cls.KEY_FIELDS
+        for key in keys:
+            pitching[key] = pa[key]
+        cls._extract(pitch.attrs, pitching)
+        pitching.pitch_seq, pitching.pitch_type_seq = sequence.append(pitching.pitch_res, pitching.pitch_type)
+        pitching.pa_ball_ct = ball_tally
+        pitching.pa_strike_ct = strike_tally
+        pitching.pa_terminal_fl = cls.is_pa_terminal(ball_tally, strike_tally, pitching.pitch_res, pa['event_cd'])
+        if layout == cls.LAYOUT_WIDE:
+            pitching.pa_event_cd = pa['event_cd']
         return pitching
 
+    @classmethod
+    def join(cls, atbats, pitches):
+        """
+        Normalized pitches to wide layout
+        :param atbats: at bat rows(mlbam_atbat)
+        :param pitches: pitch rows(normalized layout)
+        :return: pitch rows(wide layout)
+        """
+        pa_list = {(atbat['retro_game_id'], atbat['ab_number']): atbat for atbat in atbats}
+        rows = []
+        for pitch in pitches:
+            pa = pa_list[(pitch['retro_game_id'], pitch['ab_number'])]
+            pitching = PitchRecord(*[pa[key] for key in cls.PA_FIELDS])
+            pitching.update(pitch)
+            pitching['pa_event_cd'] = pa['event_cd']
+            rows.append(pitching)
+        return rows
+
+
+class PitchRecord(Record):
+    """
+    mlbam_pitch row(wide layout)
+    """
+    __slots__ = FIELDS = Pitch.PA_FIELDS + (
+        'pa_ball_ct', 'pa_strike_ct', 'pitch_seq', 'pa_terminal_fl', 'pa_event_cd', 'pitch_res', 'pitch_des',
+        'pitch_id', 'x', 'y', 'start_speed', 'end_speed', 'sz_top', 'sz_bot', 'pfx_x', 'pfx_z', 'px', 'pz',
+        'x0', 'y0', 'z0', 'vx0', 'vy0', 'vz0', 'ax', 'ay', 'az', 'break_y', 'break_angle', 'break_length',
+        'pitch_type', 'pitch_type_seq', 'type_confidence', 'zone', 'spin_dir', 'spin_rate', 'sv_id', 'event_num',
+    )
+
+
+class NormalizedPitchRecord(Record):
+    """
+    mlbam_pitch row(normalized layout)
+    """
+    __slots__ = FIELDS = Pitch.KEY_FIELDS + (
+        'pa_ball_ct', 'pa_strike_ct', 'pitch_seq', 'pa_terminal_fl', 'pitch_res', 'pitch_des',
+        'pitch_id', 'x', 'y', 'start_speed', 'end_speed', 'sz_top', 'sz_bot', 'pfx_x', 'pfx_z', 'px', 'pz',
+        'x0', 'y0', 'z0', 'vx0', 'vy0', 'vz0', 'ax', 'ay', 'az', 'break_y', 'break_angle', 'break_length',
+        'pitch_type', 'pitch_type_seq', 'type_confidence', 'zone', 'spin_dir', 'spin_rate', 'sv_id', 'event_num',
+    )
+
+
+class AtBatRecord(Record):
+    """
+    mlbam_atbat row
+    """
+    __slots__ = FIELDS = Pitch.PA_FIELDS + (
+        'ab_des', 'event_tx', 'event_cd', 'hit_x', 'hit_y', 'event_num', 'home_team_runs', 'away_team_runs',
+        'ball_ct', 'strike_ct', 'pitch_seq', 'pitch_type_seq', 'battedball_cd',
+        'start_base_out_state', 'end_base_out_state',
+    )
+
+
+class ActionRecord(Record):
+    """
+    mlbam_action row
+    """
+    __slots__ = FIELDS = (
+        'retro_game_id', 'year', 'month', 'day', 'st_fl', 'regseason_fl', 'playoff_fl', 'game_type', 'game_type_des',
+        'local_game_time', 'game_id', 'home_team_id', 'away_team_id', 'home_team_lg', 'away_team_lg',
+        'interleague_fl', 'park_id', 'park_name', 'inning_number', 'home_id', 'park_location', 'b', 's', 'o',
+        'des', 'event', 'player_mlbid', 'player_first_name', 'player_last_name', 'player_box_name', 'pitch',
+        'event_num', 'home_team_runs', 'away_team_runs',
+    )
+
 
 class AtBat(object):
 
     DOWNLOAD_FILE_NAME = 'mlbam_atbat_{day}.{extension}'
+    # at bat attributes
+    FIELDS = (
+        MlbamField('ab_des', 'des', str, MlbamConst.UNKNOWN_FULL),
+        MlbamField('event_tx', 'event', str, MlbamConst.UNKNOWN_FULL),
+        MlbamField('event_outs_ct', 'o', int, 0),
+        MlbamField('pit_mlbid', 'pitcher', str, MlbamConst.UNKNOWN_FULL),
+        MlbamField('bat_mlbid', 'batter', str, MlbamConst.UNKNOWN_FULL),
+        MlbamField('pit_hand_cd', 'p_throws', str, MlbamConst.UNKNOWN_FULL),
+        MlbamField('bat_hand_cd', 'stand', str, MlbamConst.UNKNOWN_FULL),
+        MlbamField('ab_number', 'num', int, None),
+        MlbamField('event_num', 'event_num', int, -1),
+        MlbamField('home_team_runs', 'home_team_runs', int, 0),
+        MlbamField('away_team_runs', 'away_team_runs', int, 0),
+    )
+    _extract = staticmethod(MlbamExtractor.compile(FIELDS, 'atbat'))
 
     @classmethod
     def _get_bases(cls, ab):
         """
-        Start Bases & End Bases
+        Start Bases & End Bases(a runner pass)
         :param ab: at bat object(type:Beautifulsoup)
-        :param attribute_name: attribute name
-        :return: start base, end base
+        :return: start bases mask, end bases mask(1B: 1, 2B: 2, 3B: 4)
         """
-        start_bases, end_bases = [], []
-        for base in ('1B', '2B', '3B'):
-            if ab.find('runner', start=base):
-                start_bases.append(base[0:1])
-            else:
-                start_bases.append('_')
-            if ab.find('runner', end=base):
-                end_bases.append(base[0:1])
-            else:
-                end_bases.append('_')
-        return ''.join(start_bases), ''.join(end_bases)
+        start_mask, end_mask = 0, 0
+        for runner in ab.find_all('runner'):
+            start_mask |= RetroSheet.BASE_MASKS.get(runner.get('start'), 0)
+            end_mask |= RetroSheet.BASE_MASKS.get(runner.get('end'), 0)
+        return start_mask, end_mask
 
     @classmethod
-    def pa(cls, ab, game, rosters, inning_number, inning_id, out_ct, hit_location):
+    def pa(cls, ab, game, rosters, inning_number, inning_id, out_ct, hit_location, bases=0):
         """
         plate appearance data
         :param ab: at bat object(type:Beautifulsoup)
@@ -235,6 +334,7 @@ class AtBat(object):
         :param pitch_list: Pitching
         :param out_ct: out count
         :param hit_location: Hitlocation data(dict)
+        :param bases: occupied bases after the previous at bat of the half inning(bit mask)
         :return: {
             'retro_game_id': Retrosheet Game id
             'game_type': Game Type(S/R/F/D/L/W)
@@ -282,25 +382,23 @@ class AtBat(object):
             'event_num': Event Sequence Number(atbat, pitch, action)
             'home_team_runs': Score(Home)
             'away_team_runs': Score(Away)
+            'start_base_out_state': Base-out state(Before At Bat, outs * 8 + occupied bases(1B: 1, 2B: 2, 3B: 4))
+            'end_base_out_state': Base-out state(After At Bat, outs * 8 + occupied bases, three outs: 24)
         }
         """
-        ab_des = MlbamUtil.get_attribute_stats(ab, 'des', str, MlbamConst.UNKNOWN_FULL)
-        event_tx = MlbamUtil.get_attribute_stats(ab, 'event', str, MlbamConst.UNKNOWN_FULL)
-        event_cd = RetroSheet.event_cd(event_tx, ab_des)
-        event_outs_ct = MlbamUtil.get_attribute_stats(ab, 'o', int, 0)
-        start_bases, end_bases = cls._get_bases(ab)
-        pit_mlbid = MlbamUtil.get_attribute_stats(ab, 'pitcher', str, MlbamConst.UNKNOWN_FULL)
-        bat_mlbid = MlbamUtil.get_attribute_stats(ab, 'batter', str, MlbamConst.UNKNOWN_FULL)
-        pit_player = rosters.get(pit_mlbid)
-        bat_player = rosters.get(bat_mlbid)
+        atbat = AtBatRecord()
+        cls._extract(ab.attrs, atbat)
+        start_mask, end_mask = cls._get_bases(ab)
+        start_occupied, end_occupied = RetroSheet.carry_bases(bases, start_mask, end_mask)
+        pit_player = rosters.get(atbat.pit_mlbid)
+        bat_player = rosters.get(atbat.bat_mlbid)
         location_key = Inning.HITLOCATION_KEY_FORMAT.format(
             inning=inning_number,
-            des=event_tx,
-            pitcher=pit_mlbid,
-            batter=bat_mlbid,
+            des=atbat.event_tx,
+            pitcher=atbat.pit_mlbid,
+            batter=atbat.bat_mlbid,
         )
         location = hit_location.get(location_key, {})
-        atbat = OrderedDict()
         atbat['retro_game_id'] = game.retro_game_id
         atbat['year'] = game.timestamp.year
         atbat['month'] = game.timestamp.month
@@ -323,44 +421,35 @@ class AtBat(object):
         atbat['inning_number'] = inning_number
         atbat['bat_home_id'] = inning_id
         atbat['outs_ct'] = out_ct
-        atbat['pit_mlbid'] = pit_mlbid
         atbat['pit_first_name'] = pit_player.first
         atbat['pit_last_name'] = pit_player.last
         atbat['pit_box_name'] = pit_player.box_name
-        atbat['pit_hand_cd'] = MlbamUtil.get_attribute_stats(ab, 'p_throws', str, MlbamConst.UNKNOWN_FULL)
-        atbat['bat_mlbid'] = bat_mlbid
         atbat['bat_first_name'] = bat_player.first
         atbat['bat_last_name'] = bat_player.last
         atbat['bat_box_name'] = bat_player.box_name
-        atbat['bat_hand_cd'] = MlbamUtil.get_attribute_stats(ab, 'stand', str, MlbamConst.UNKNOWN_FULL)
-        atbat['ab_number'] = MlbamUtil.get_attribute_stats(ab, 'num', int, None)
-        atbat['start_bases'] = start_bases
-        atbat['end_bases'] = end_bases
-        atbat['event_outs_ct'] = event_outs_ct
-        atbat['ab_des'] = ab_des
-        atbat['event_tx'] = event_tx
-        atbat['event_cd'] = event_cd
+        atbat['start_bases'] = RetroSheet.BASES[start_mask]
+        atbat['end_bases'] = RetroSheet.BASES[end_mask]
+        atbat['start_base_out_state'] = RetroSheet.base_out_state(out_ct, start_occupied)
+        atbat['end_base_out_state'] = RetroSheet.base_out_state(atbat.event_outs_ct, end_occupied)
+        atbat['event_cd'] = RetroSheet.event_cd(atbat.event_tx, atbat.ab_des)
         atbat['hit_x'] = location.get('hit_x', None)
         atbat['hit_y'] = location.get('hit_y', None)
-        atbat['event_num'] = MlbamUtil.get_attribute_stats(ab, 'event_num', int, -1)
-        atbat['home_team_runs'] = MlbamUtil.get_attribute_stats(ab, 'home_team_runs', int, 0)
-        atbat['away_team_runs'] = MlbamUtil.get_attribute_stats(ab, 'away_team_runs', int, 0)
         return atbat
 
     @classmethod
-    def result(cls, ab, pa, pitch_list):
+    def result(cls, ab, pa, sequence):
         """
         At Bat Result
         :param ab: at bat object(type:Beautifulsoup)
         :param pa: atbat data for plate appearance
-        :param pitch_list: Pitching data
+        :param sequence: PitchSequence object(all pitches)
         :return: pa result value(dict)
         """
         atbat = OrderedDict()
         atbat['ball_ct'] = MlbamUtil.get_attribute_stats(ab, 'b', int, None)
         atbat['strike_ct'] = MlbamUtil.get_attribute_stats(ab, 's', int, None)
-        atbat['pitch_seq'] = ''.join([pitch['pitch_res'] for pitch in pitch_list])
-        atbat['pitch_type_seq'] = '|'.join([pitch['pitch_type'] for pitch in pitch_list])
+        atbat['pitch_seq'] = sequence.pitch_seq
+        atbat['pitch_type_seq'] = sequence.pitch_type_seq
         atbat['battedball_cd'] = RetroSheet.battedball_cd(pa['event_cd'], pa['event_tx'], pa['ab_des'])
         return atbat
 
@@ -368,6 +457,20 @@ class AtBat(object):
 class InningAction(object):
 
     DOWNLOAD_FILE_NAME = 'mlbam_action_{day}.{extension}'
+    # action attributes
+    FIELDS = (
+        MlbamField('b', 'b', int, 0),
+        MlbamField('s', 's', int, 0),
+        MlbamField('o', 'o', int, 0),
+        MlbamField('des', 'des', str, MlbamConst.UNKNOWN_FULL),
+        MlbamField('event', 'event', str, MlbamConst.UNKNOWN_FULL),
+        MlbamField('player_mlbid', 'player', str, MlbamConst.UNKNOWN_FULL),
+        MlbamField('pitch', 'pitch', int, 0),
+        MlbamField('event_num', 'event_num', int, -1),
+        MlbamField('home_team_runs', 'home_team_runs', int, 0),
+        MlbamField('away_team_runs', 'away_team_runs', int, 0),
+    )
+    _extract = staticmethod(MlbamExtractor.compile(FIELDS, 'action'))
 
     @classmethod
     def action(cls, action, game, rosters, inning_number, inning_id):
@@ -415,9 +518,9 @@ class InningAction(object):
             'away_team_runs': Score(Away)
         }
         """
-        player_mlbid = MlbamUtil.get_attribute_stats(action, 'player', str, MlbamConst.UNKNOWN_FULL)
-        player = rosters.get(player_mlbid)
-        act = OrderedDict()
+        act = ActionRecord()
+        cls._extract(action.attrs, act)
+        player = rosters.get(act.player_mlbid)
         act['retro_game_id'] = game.retro_game_id
         act['year'] = game.timestamp.year
         act['month'] = game.timestamp.month
@@ -439,26 +542,16 @@ class InningAction(object):
         act['inning_number'] = inning_number
         act['home_id'] = inning_id
         act['park_location'] = game.park_loc
-        act['b'] = MlbamUtil.get_attribute_stats(action, 'b', int, 0)
-        act['s'] = MlbamUtil.get_attribute_stats(action, 's', int, 0)
-        act['o'] = MlbamUtil.get_attribute_stats(action, 'o', int, 0)
-        act['des'] = MlbamUtil.get_attribute_stats(action, 'des', str, MlbamConst.UNKNOWN_FULL)
-        act['event'] = MlbamUtil.get_attribute_stats(action, 'event', str, MlbamConst.UNKNOWN_FULL)
-        act['player_mlbid'] = player_mlbid
         try:
             act['player_first_name'] = player.first
             act['player_last_name'] = player.last
             act['player_box_name'] = player.box_name
         except AttributeError as e:
             logging.error('Attribute Error(retro_game_id:{retro_game_id} player_mlbid:{player_mlbid})'
-                          .format(**{'retro_game_id': game.retro_game_id, 'player_mlbid': player_mlbid}))
+                          .format(**{'retro_game_id': game.retro_game_id, 'player_mlbid': act.player_mlbid}))
             act['player_first_name'] = MlbamConst.UNKNOWN_FULL
             act['player_last_name'] = MlbamConst.UNKNOWN_FULL
             act['player_box_name'] = MlbamConst.UNKNOWN_FULL
-        act['pitch'] = MlbamUtil.get_attribute_stats(action, 'pitch', int, 0)
-        act['event_num'] = MlbamUtil.get_attribute_stats(action, 'event_num', int, -1)
-        act['home_team_runs'] = MlbamUtil.get_attribute_stats(action, 'home_team_runs', int, 0)
-        act['away_team_runs'] = MlbamUtil.get_attribute_stats(action, 'away_team_runs', int, 0)
         return act
 
 
@@ -474,30 +567,34 @@ class Inning(object):
     INNINGS = OrderedDict()
     INNINGS[INNING_TOP] = 0
     INNINGS[INNING_BOTTOM] = 1
+    ITERPARSE_TAGS = ('inning', INNING_TOP, INNING_BOTTOM, 'atbat', 'action')
     atbats = []
     pitches = []
     actions = []
 
-    def __init__(self, game, players):
+    def __init__(self, game, players, pitch_layout=Pitch.LAYOUT_WIDE):
         """
         :param game: MLBAM Game object
         :param players: MLBAM Players object
+        :param pitch_layout: pitch row layout(wide or normalized)
         """
         self.game = game
         self.players = players
+        self.pitch_layout = pitch_layout
         self.atbats, self.pitches, self.actions = [], [], []
 
     @classmethod
-    def read_xml(cls, url, markup, game, players):
+    def read_xml(cls, url, markup, game, players, pitch_layout=Pitch.LAYOUT_WIDE):
         """
         read xml object
         :param url: contents url
         :param markup: markup provider
         :param game: MLBAM Game object
         :param players: MLBAM Players object
+        :param pitch_layout: pitch row layout(wide or normalized)
         :return: pitchpx.game.game.Game object
         """
-        innings = Inning(game, players)
+        innings = Inning(game, players, pitch_layout)
         base_url = "".join([url, cls.DIRECTORY])
         # hit location data
         hit_location = cls._read_hit_chart_data(
@@ -506,16 +603,79 @@ class Inning(object):
 
         # create for atbat & pitch data
         for inning in MlbamUtil.find_xml_all(base_url, markup, cls.TAG, cls.FILENAME_PATTERN):
-            soup = MlbamUtil.find_xml("/".join([base_url, inning.get_text().strip()]), markup)
-            inning_number = int(soup.inning['num'])
-            for inning_type in cls.INNINGS.keys():
-                inning_soup = soup.inning.find(inning_type)
-                if inning_soup is None:
-                    break
-                innings._inning_events(inning_soup, inning_number, cls.INNINGS[inning_type], hit_location)
-                innings._inning_actions(inning_soup, inning_number, cls.INNINGS[inning_type])
+            inning_url = "/".join([base_url, inning.get_text().strip()])
+            if markup == MlbamUtil.PARSER_ITERPARSE:
+                innings._read_inning_iterparse(MlbamUtil.find_raw(inning_url), hit_location)
+            else:
+                innings._read_inning(MlbamUtil.find_xml(inning_url, markup), hit_location)
         return innings
 
+    @classmethod
+    def read_contents(cls, hit_chart, contents, markup, game, players, pitch_layout=Pitch.LAYOUT_WIDE):
+        """
+        read downloaded xml
+        :param hit_chart: inning_hit.xml(str)
+        :param contents: inning_N.xml list(iterparse: bytes, other: str)
+        :param markup: markup provider
+        :param game: MLBAM Game object
+        :param players: MLBAM Players object
+        :param pitch_layout: pitch row layout(wide or normalized)
+        :return: pitchpx.game.inning.Inning object
+        """
+        innings = Inning(game, players, pitch_layout)
+        hit_location = cls._read_hit_chart_data(MlbamUtil.read_xml(hit_chart, markup))
+        for content in contents:
+            if markup == MlbamUtil.PARSER_ITERPARSE:
+                innings._read_inning_iterparse(content, hit_location)
+            else:
+                innings._read_inning(MlbamUtil.read_xml(content, markup), hit_location)
+        return innings
+
+    def _read_inning(self, soup, hit_location):
+        """
+        Inning events & actions
+        :param soup: Beautifulsoup object(inning_N.xml)
+        :param hit_location: Hitlocation data(dict)
+        """
+        inning_number = int(soup.inning['num'])
+        for inning_type in self.INNINGS.keys():
+            inning_soup = soup.inning.find(inning_type)
+            if inning_soup is None:
+                break
+            self._inning_events(inning_soup, inning_number, self.INNINGS[inning_type], hit_location)
+            self._inning_actions(inning_soup, inning_number, self.INNINGS[inning_type])
+
+    def _read_inning_iterparse(self, content, hit_location):
+        """
+        Inning events & actions(lxml iterparse, elements are cleared after use)
+        :param content: inning xml(bytes)
+        :param hit_location: Hitlocation data(dict)
+        """
+        MlbamStats.count('files_parsed')
+        inning_number, inning_id, out_ct, bases = None, None, 0, 0
+        for event, element in etree.iterparse(
+                io.BytesIO(content), events=('start', 'end'), tag=self.ITERPARSE_TAGS, recover=True
+        ):
+            if event == 'start':
+                if element.tag == 'inning':
+                    inning_number = int(element.get('num'))
+                elif element.tag in self.INNINGS:
+                    inning_id, out_ct, bases = self.INNINGS[element.tag], 0, 0
+                continue
+            if element.tag == 'atbat':
+                out_ct, bases = self._atbat(
+                    MlbamElement(element), inning_number, inning_id, out_ct, bases, hit_location
+                )
+            elif element.tag == 'action':
+                self.actions.append(
+                    InningAction.action(MlbamElement(element), self.game, self.players.rosters, inning_number, inning_id)
+                )
+            else:
+                continue
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
     @classmethod
     def _read_hit_chart_data(cls, soup):
         """
@@ -557,32 +717,51 @@ class Inning(object):
         :param hit_location: Hitlocation data(dict)
         """
         # at bat(batter box data) & pitching data
-        out_ct = 0
+        out_ct, bases = 0, 0
         for ab in soup.find_all('atbat'):
-            # plate appearance data(pa)
-            at_bat = AtBat.pa(ab, self.game, self.players.rosters, inning_number, inning_id, out_ct, hit_location)
-            # pitching data
-            pitching_stats = self._get_pitch(ab, at_bat)
-            # at bat(pa result)
-            pa_result = AtBat.result(ab, at_bat, pitching_stats)
-            at_bat.update(pa_result)
-            self.atbats.append(at_bat)
-            self.pitches.extend(pitching_stats)
-            # out count
-            out_ct = at_bat['event_outs_ct']
-
-    def _get_pitch(self, soup, pa):
+            out_ct, bases = self._atbat(ab, inning_number, inning_id, out_ct, bases, hit_location)
+
+    def _atbat(self, ab, inning_number, inning_id, out_ct, bases, hit_location):
+        """
+        At bat & pitching data
+        :param ab: at bat object(type:Beautifulsoup or MlbamElement)
+        :param inning_number: Inning Number
+        :param inning_id: Inning Id(0:home, 1:away)
+        :param out_ct: out count
+        :param bases: occupied bases(bit mask, carried through the half inning)
+        :param hit_location: Hitlocation data(dict)
+        :return: out count & occupied bases(after at bat)
+        """
+        # plate appearance data(pa)
+        at_bat = AtBat.pa(
+            ab, self.game, self.players.rosters, inning_number, inning_id, out_ct, hit_location, bases
+        )
+        # pitching data
+        sequence = PitchSequence()
+        pitching_stats = self._get_pitch(ab, at_bat, sequence)
+        # at bat(pa result)
+        pa_result = AtBat.result(ab, at_bat, sequence)
+        at_bat.update(pa_result)
+        self.atbats.append(at_bat)
+        self.pitches.extend(pitching_stats)
+        # out count & occupied bases(three outs: empty)
+        return at_bat['event_outs_ct'], at_bat['end_base_out_state'] % len(RetroSheet.BASES)
+
+    def _get_pitch(self, soup, pa, sequence=None):
         """
         get pitch data
         :param soup: Beautifulsoup object
         :param pa: atbat data for plate appearance
+        :param sequence: PitchSequence object(shared with AtBat.result, default: new sequence)
         :return: pitches result(list)
         """
         pitches = []
+        if sequence is None:
+            sequence = PitchSequence()
         ball_tally, strike_tally = 0, 0
         for pitch in soup.find_all('pitch'):
             # pitching result
-            pitch = Pitch.row(pitch, pa, pitches, ball_tally, strike_tally)
+            pitch = Pitch.row(pitch, pa, sequence, ball_tally, strike_tally, self.pitch_layout)
             pitches.append(pitch)
             # ball count
             ball_tally, strike_tally = RetroSheet.ball_count(ball_tally, strike_tally, pitch['pitch_res'])
@@ -3,11 +3,47 @@
 
 from collections import OrderedDict
 from pitchpx.mlbam_util import MlbamUtil, MlbamConst
+from pitchpx.mlbam_extractor import MlbamField, MlbamExtractor
 from pitchpx.game.game import Game
 
 __author__ = 'Shinichi Nakagawa'
 
 
+def isdigit(value):
+    """
+    ditit check for stats
+    :param value: stats value
+    :return: True or False
+    """
+    if str(value).replace('.','').replace('-','').isdigit():
+        return True
+    return False
+
+
+def stats_converter(data_type, unknown):
+    """
+    Stats converter(digit only)
+    :param data_type: Data type(int, float)
+    :param unknown: not digit value
+    :return: converter function(data_type attribute: column type)
+    """
+    def convert(value):
+        if isdigit(value):
+            return data_type(value)
+        return unknown
+    convert.data_type = data_type
+    return convert
+
+
+# Yakyu-Min attributes(Players.YakyuMin & subclasses)
+YAKYUMIN_FIELDS = (
+    MlbamField('id', data_type=None),
+    MlbamField('first', data_type=None),
+    MlbamField('last', data_type=None),
+    MlbamField('position', data_type=None),
+)
+
+
 class Players(object):
 
     FILENAME = 'players.xml'
@@ -28,6 +64,9 @@ class Players(object):
         last = MlbamConst.UNKNOWN_FULL
         position = MlbamConst.UNKNOWN_SHORT
 
+        FIELDS = YAKYUMIN_FIELDS
+        _extract = staticmethod(MlbamExtractor.compile(FIELDS, 'yakyumin'))
+
         def __init__(self, soup, retro_game_id):
             """
             create object
@@ -35,10 +74,7 @@ class Players(object):
             :param retro_game_id: Retrosheet Game id
             """
             self.retro_game_id = retro_game_id
-            self.id = soup.get('id')
-            self.first = soup.get('first')
-            self.last = soup.get('last')
-            self.position = soup.get('position')
+            self._extract(soup.attrs, self)
 
         def row(self):
             """
@@ -97,40 +133,77 @@ class Players(object):
         game_position = MlbamConst.UNKNOWN_SHORT
 
         DOWNLOAD_FILE_NAME = 'mlbam_player_{day}.{extension}'
+        DIMENSION_FILE_NAME = 'mlbam_player_season_{season}.{extension}'
+        LAYOUT_FULL = 'full'
+        LAYOUT_SLIM = 'slim'
+        LAYOUTS = (LAYOUT_FULL, LAYOUT_SLIM)
+        # season player table(not changed in a season)
+        DIMENSION_FIELDS = ('id', 'first', 'last', 'box_name', 'rl', 'bats')
+        # per game roster(slim layout)
+        GAME_FIELDS = (
+            'retro_game_id', 'id', 'position', 'num', 'status', 'team_abbrev', 'team_id', 'parent_team_abbrev',
+            'parent_team_id', 'avg', 'hr', 'rbi', 'wins', 'losses', 'era', 'bat_order', 'game_position',
+        )
+        # player attributes
+        FIELDS = YAKYUMIN_FIELDS + (
+            MlbamField('num', 'num', stats_converter(int, num), num),
+            MlbamField('box_name', 'boxname', None, MlbamConst.UNKNOWN_FULL),
+            MlbamField('rl', data_type=None),
+            MlbamField('bats', data_type=None),
+            MlbamField('status', data_type=None),
+            MlbamField('team_abbrev', data_type=None),
+            MlbamField('team_id', data_type=None),
+            MlbamField('parent_team_abbrev', data_type=None),
+            MlbamField('parent_team_id', data_type=None),
+            MlbamField('avg', 'avg', stats_converter(float, avg), avg),
+            MlbamField('hr', 'hr', stats_converter(int, hr), hr),
+            MlbamField('rbi', 'rbi', stats_converter(int, rbi), rbi),
+            MlbamField('wins', 'wins', stats_converter(int, wins), wins),
+            MlbamField('losses', 'losses', stats_converter(int, losses), losses),
+            MlbamField('era', 'era', stats_converter(float, era), era),
+            MlbamField('bat_order', 'bat_order', stats_converter(int, bat_order), bat_order),
+            MlbamField('game_position', 'game_position', None, game_position),
+        )
+        _extract = staticmethod(MlbamExtractor.compile(FIELDS, 'player'))
 
-        def __init__(self, soup, retro_game_id):
+        def game_row(self):
             """
-            create object
-            :param soup: Beautifulsoup object
-            :param retro_game_id: Retrosheet Game id
+            Player's Dataset(Row, slim layout: game-varying columns only)
+            :return: {
+                'retro_game_id': Retrosheet Game id
+                'id': Player Id
+                'position': Position
+                'num': Unique Number in Game
+                'status': A(Active) or Other
+                'team_abbrev': Team Name
+                'team_id': Team Id
+                'parent_team_abbrev': Base Team Name
+                'parent_team_id': Base Team Id
+                'avg': Batting Average
+                'hr': Home Run
+                'rbi': RBI
+                'wins': Pitched Win
+                'lose': Pithced Lose
+                'era': ERA
+                'bat_order': Batting Order num(Starting Member Only)
+                'game_position': Game Position(Starting Member Only)
+            }
             """
-            super().__init__(soup, retro_game_id)
-            if Players.isdigit(soup['num']):
-                self.num = int(soup['num'])
-            self.box_name = soup['boxname']
-            self.rl = soup.get('rl')
-            self.bats = soup.get('bats')
-            self.status = soup.get('status')
-            self.team_abbrev = soup.get('team_abbrev')
-            self.team_id = soup.get('team_id')
-            self.parent_team_abbrev = soup.get('parent_team_abbrev')
-            self.parent_team_id = soup.get('parent_team_id')
-            if 'avg' in soup.attrs and Players.isdigit(soup['avg']):
-                self.avg = float(soup['avg'])
-            if 'hr' in soup.attrs and Players.isdigit(soup['hr']):
-                self.hr = int(soup['hr'])
-            if 'rbi' in soup.attrs and Players.isdigit(soup['rbi']):
-                self.rbi = int(soup['rbi'])
-            if 'wins' in soup.attrs and Players.isdigit(soup['wins']):
-                self.wins = int(soup['wins'])
-            if 'losses' in soup.attrs and Players.isdigit(soup['losses']):
-                self.losses = int(soup['losses'])
-            if 'era' in soup.attrs and Players.isdigit(soup['era']):
-                self.era = float(soup['era'])
-            if 'bat_order' in soup.attrs and Players.isdigit(soup['bat_order']):
-                self.bat_order = int(soup['bat_order'])
-            if 'game_position' in soup.attrs:
-                self.game_position = soup['game_position']
+            return OrderedDict([(name, getattr(self, name)) for name in self.GAME_FIELDS])
+
+        def dimension_row(self):
+            """
+            Player's Dataset(Row, season player table)
+            :return: {
+                'id': Player Id
+                'first': First Name
+                'last': Last Name
+                'box_name': At Bat Name
+                'rl': Throw(R or L)
+                'bats': Batting Position(R or L or S)
+            }
+            """
+            return OrderedDict([(name, getattr(self, name)) for name in self.DIMENSION_FIELDS])
 
         def row(self):
             """
@@ -328,6 +401,4 @@ class Players(object):
         :param value: stats value
         :return: True or False
         """
-        if str(value).replace('.','').replace('-','').isdigit():
-            return True
-        return False
+        return isdigit(value)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class Record(object):
+    """
+    Compact row(__slots__, fixed columns)
+    Subclass: __slots__ = FIELDS = (column name, ...)
+    Read & write like OrderedDict(column order: FIELDS)
+    """
+    __slots__ = ()
+    FIELDS = ()
+
+    def __init__(self, *values, **kwargs):
+        """
+        :param values: column values(FIELDS order, missing: None)
+        :param kwargs: column values(by name)
+        """
+        for name, value in zip(self.FIELDS, values):
+            object.__setattr__(self, name, value)
+        for name in self.FIELDS[len(values):]:
+            object.__setattr__(self, name, None)
+        for name, value in kwargs.items():
+            self[name] = value
+
+    def __getitem__(self, key):
+        # columns only(not methods & class attributes)
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        object.__setattr__(self, key, value)
+
+    def __contains__(self, key):
+        return key in self.FIELDS
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self):
+        return len(self.FIELDS)
+
+    def __eq__(self, other):
+        if isinstance(other, Record):
+            return self.FIELDS == other.FIELDS and self.values() == other.values()
+        if isinstance(other, dict):
+            return dict(self.items()) == other
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __getstate__(self):
+        return self.values()
+
+    def __setstate__(self, state):
+        for name, value in zip(self.FIELDS, state):
+            object.__setattr__(self, name, value)
+
+    def __repr__(self):
+        return '{name}({items})'.format(name=self.__class__.__name__, items=self.items())
+
+    def keys(self):
+        """
+        Column names
+        :return: column name list
+        """
+        return list(self.FIELDS)
+
+    def values(self):
+        """
+        Column values
+        :return: value list(FIELDS order)
+        """
+        return [getattr(self, name) for name in self.FIELDS]
+
+    def items(self):
+        """
+        Columns
+        :return: (column name, value) list
+        """
+        return [(name, getattr(self, name)) for name in self.FIELDS]
+
+    def get(self, key, default=None):
+        """
+        Column value
+        :param key: column name
+        :param default: value(unknown column)
+        :return: value
+        """
+        if key not in self.FIELDS:
+            return default
+        return getattr(self, key)
+
+    def update(self, other):
+        """
+        Set columns
+        :param other: dict or Record
+        """
+        for key, value in other.items():
+            self[key] = value
@@ -3,17 +3,33 @@
 
 import os
 import re
-import csv
+import time
 import yaml
 import click
 import logging
+import asyncio
+import functools
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
 from multiprocessing import Pool
 from formencode import validators
 from datetime import datetime as dt
 from datetime import timedelta
-import time
 
-from pitchpx.mlbam_util import MlbamUtil, MlbAmException, MlbAmHttpNotFound, MlbAmBadParameter
+from pitchpx.mlbam_util import MlbamUtil, MlbAmException, MlbAmHttpError, MlbAmHttpNotFound, MlbAmCacheMiss, \
+    MlbAmBadParameter
+from pitchpx.mlbam_session import MlbamSession
+from pitchpx.mlbam_cache import MlbamCache
+from pitchpx.mlbam_async import MlbamAsyncUtil
+from pitchpx.mlbam_rate_limit import MlbamRateLimiter
+from pitchpx.mlbam_retry import MlbamRetry
+from pitchpx.mlbam_manifest import MlbamManifest
+from pitchpx.mlbam_writer import MlbamWriter
+from pitchpx.mlbam_player_cache import MlbamPlayerCache
+from pitchpx.mlbam_matrix import MlbamMatrix
+from pitchpx.mlbam_pitch_store import MlbamPitchStore
+from pitchpx.mlbam_live import MlbamLive
+from pitchpx.mlbam_stats import MlbamStats
 from pitchpx.game.game import Game
 from pitchpx.game.players import Players
 from pitchpx.game.boxscore import BoxScore
@@ -29,89 +45,484 @@ class MlbAm(object):
     DIRECTORY_PATH_GAME_DAY = '{year}_{month}_{day}'
     PAGE_URL_GAME_DAY = 'year_{year}/month_{month}/day_{day}'
     PAGE_URL_GAME_PREFIX = 'gid_{year}_{month}_{day}_.*'
+    ENGINE_POOL = 'pool'
+    ENGINE_ASYNCIO = 'asyncio'
+    DOWNLOAD_FILE_NAMES = (
+        Game.DOWNLOAD_FILE_NAME,
+        Players.Player.DOWNLOAD_FILE_NAME,
+        Players.Coach.DOWNLOAD_FILE_NAME,
+        Players.Umpire.DOWNLOAD_FILE_NAME,
+        AtBat.DOWNLOAD_FILE_NAME,
+        Pitch.DOWNLOAD_FILE_NAME,
+        BoxScore.DOWNLOAD_FILE_NAME,
+        InningAction.DOWNLOAD_FILE_NAME,
+    )
+    # rows counter name(ex: mlbam_pitch_{day}.{extension} -> rows_pitch)
+    ROW_COUNTERS = {
+        filename: filename.split('_{day}')[0].replace('mlbam_', 'rows_', 1) for filename in DOWNLOAD_FILE_NAMES
+    }
 
-    def __init__(self, base_dir, output, days=[], setting_file='setting.yml'):
+    def __init__(self, base_dir, output, days=[], setting_file='setting.yml', cache=None, offline=False,
+                 resume=False, revalidate=False):
         """
         MLBAM Data set scrape
         :param base_dir: Base directory
         :param output: Output directory
         :param days: Game Days(datetime list)
         :param setting_file: setteing file(yml)
+        :param cache: Raw XML cache directory(default: setting file)
+        :param offline: Replay from cache only(True or False)
+        :param resume: Skip completed days(True or False)
+        :param revalidate: Conditional request for cached responses(True or False, default: setting file)
         """
-        setting = yaml.load(open(self.DELIMITER.join([base_dir, setting_file]), 'r'))
+        setting = yaml.safe_load(open(self.DELIMITER.join([base_dir, setting_file]), 'r'))
         self.url = setting['mlb']['url']
         self.parser = setting['config']['xml_parser']
         self.extension = setting['config']['extension']
+        self.writer = MlbamWriter.get_writer(self.extension)
+        self.pitch_layout = setting['config'].get('pitch_layout', Pitch.LAYOUT_WIDE)
+        if self.pitch_layout not in Pitch.LAYOUTS:
+            raise MlbAmBadParameter('Unknown pitch layout: {layout}'.format(layout=self.pitch_layout))
+        self.player_layout = setting['config'].get('player_layout', Players.Player.LAYOUT_FULL)
+        if self.player_layout not in Players.Player.LAYOUTS:
+            raise MlbAmBadParameter('Unknown player layout: {layout}'.format(layout=self.player_layout))
+        self.player_cache = setting.get('players', {}).get('cache')
+        if self.player_layout == Players.Player.LAYOUT_SLIM and not self.player_cache:
+            # season player tables are rewritten from the cache(memory only: players of this run only)
+            raise MlbAmBadParameter('Slim player layout needs a player cache')
+        self.matrix = setting.get('matrix', {}).get('file')
+        self.pitch_store = dict(setting.get('pitch_store', {}))
         self.encoding = setting['config']['encoding']
+        self.workers = setting['config'].get('workers')
+        self.chunk_size = setting['config'].get('chunk_size', 1)
+        self.engine = setting['config'].get('engine', self.ENGINE_POOL)
+        self.asyncio = dict(setting.get('asyncio', {}))
+        self.days_in_flight = self.asyncio.pop('days_in_flight', 4)
+        self.http = setting.get('http', {})
+        self.rate_limit = dict(setting.get('rate_limit', {}))
+        self.retry = dict(setting.get('retry', {}))
+        self.live = dict(setting.get('live', {}))
+        self.stats = dict(setting.get('stats', {}))
+        self.cache = dict(setting.get('cache', {}))
+        if cache:
+            self.cache['directory'] = cache
+        self.cache['offline'] = offline
+        if revalidate:
+            self.cache['revalidate'] = revalidate
+        if offline and not self.cache.get('directory'):
+            raise MlbAmBadParameter('Offline mode needs a cache directory')
         self.output = output
         self.days = days
+        self.resume = resume
 
     def download(self):
         """
         MLBAM dataset download
+        :return: stats summary(dict)
+        """
+        MlbamStats.reset()
+        start = time.perf_counter()
+        manifest = MlbamManifest(self.output)
+        if self.player_layout == Players.Player.LAYOUT_SLIM:
+            MlbamPlayerCache.configure(os.path.join(self.output, self.player_cache))
+        else:
+            MlbamPlayerCache.configure()
+        MlbamMatrix.configure(os.path.join(self.output, self.matrix) if self.matrix else None, self.resume)
+        MlbamPitchStore.configure(
+            os.path.join(self.output, self.pitch_store['directory']) if self.pitch_store.get('directory') else None,
+            self.pitch_store.get('dtype', 'float32'),
+        )
+        days = self.days
+        if self.resume:
+            days = [timestamp for timestamp in self.days if not manifest.completed(self._day(timestamp))]
+            logging.info('->- Resume: {skip} days completed'.format(skip=len(self.days) - len(days)))
+            MlbamStats.count('days_skipped', len(self.days) - len(days))
+        rate_limit = dict(self.rate_limit, state=MlbamRateLimiter.create_state(self.rate_limit.get('burst', 1)))
+        if self.engine == self.ENGINE_ASYNCIO:
+            MlbAm._init_worker(self.http, self.cache, rate_limit, self.retry)
+            loop = asyncio.new_event_loop()
+            try:
+                loop.run_until_complete(self._download_async(days, manifest))
+            finally:
+                loop.close()
+        else:
+            p = Pool(
+                self.workers, initializer=MlbAm._init_worker, initargs=(self.http, self.cache, rate_limit, self.retry)
+            )
+            try:
+                # game list(per day) & games(fan out per game)
+                games_list = p.map(self._find_games, days)
+                datasets = p.imap(
+                    self._download_game, [game for games in games_list for game in games], self.chunk_size
+                )
+                for timestamp, games in zip(days, games_list):
+                    self._write_datasets(timestamp, (next(datasets) for _ in games), manifest)
+            finally:
+                p.close()
+                p.join()
+        self._write_player_seasons()
+        return self._write_stats(time.perf_counter() - start)
+
+    def _write_stats(self, elapsed):
+        """
+        Write stats summary(JSON & Prometheus text)
+        :param elapsed: wall clock seconds
+        :return: stats summary(dict)
+        """
+        summary = MlbamStats.summary(elapsed)
+        # relative paths: in the output directory(absolute paths as given)
+        if self.stats.get('summary'):
+            MlbamStats.write(os.path.join(self.output, self.stats['summary']), MlbamStats.dumps(summary))
+        if self.stats.get('prometheus'):
+            MlbamStats.write(os.path.join(self.output, self.stats['prometheus']), MlbamStats.prometheus(summary))
+        return summary
+
+    def poll(self):
+        """
+        MLBAM in-progress games polling(the first day, new rows only)
+        """
+        rate_limit = dict(self.rate_limit, state=MlbamRateLimiter.create_state(self.rate_limit.get('burst', 1)))
+        # cached responses are revalidated per poll
+        MlbAm._init_worker(self.http, dict(self.cache, offline=False, revalidate=True), rate_limit, self.retry)
+        MlbamLive(self, self.days[0], **self.live).run()
+
+    @classmethod
+    def _init_worker(cls, http, cache, rate_limit, retry):
         """
-        p = Pool()
-        p.map(self._download, self.days)
+        Worker process setting
+        :param http: http setting(dict)
+        :param cache: cache setting(dict)
+        :param rate_limit: rate limit setting(dict, with shared state)
+        :param retry: retry setting(dict)
+        """
+        MlbamSession.configure(**http)
+        MlbamCache.configure(**cache)
+        MlbamRateLimiter.configure(**rate_limit)
+        MlbamRetry.configure(**retry)
+        MlbamStats.reset()
+        MlbamUtil.record_digests()
 
-    def _download(self, timestamp):
+    @classmethod
+    def _timestamp_params(cls, timestamp):
         """
-        download MLBAM Game Day
+        Timestamp parameters(url, file name)
         :param timestamp: day
+        :return: {'year': year, 'month': month, 'day': day}
         """
-        games, atbats, pitches = [], [], []
-        rosters, coaches, umpires = [], [], []
-        boxscores, actions = [], []
-        timestamp_params = {
+        return {
             'year': str(timestamp.year),
             'month': str(timestamp.month).zfill(2),
             'day': str(timestamp.day).zfill(2)
         }
 
+    @classmethod
+    def _day(cls, timestamp):
+        """
+        Day(file name, manifest key)
+        :param timestamp: day
+        :return: YYYYMMDD
+        """
+        return "{year}{month}{day}".format(**cls._timestamp_params(timestamp))
+
+    def _find_games(self, timestamp):
+        """
+        find MLBAM Game Day games
+        :param timestamp: day
+        :return: (day, gid path, gid url) list
+        """
+        timestamp_params = self._timestamp_params(timestamp)
+
         logging.info('->- Game data download start({year}/{month}/{day})'.format(**timestamp_params))
 
         base_url = self.DELIMITER.join([self.url, self.PAGE_URL_GAME_DAY.format(**timestamp_params)])
         html = MlbamUtil.find_xml(base_url, self.parser)
 
         href = self.PAGE_URL_GAME_PREFIX.format(**timestamp_params)
+        games = []
         for gid in html.find_all('a', href=re.compile(href)):
             gid_path = gid.get_text().strip()
-            gid_url = self.DELIMITER.join([base_url, gid_path])
-            # Read XML & create dataset
-            try:
+            games.append((timestamp, gid_path, self.DELIMITER.join([base_url, gid_path])))
+        return games
+
+    def _download_game(self, game):
+        """
+        download MLBAM Game
+        :param game: (day, gid path, gid url)
+        :return: (gid path, status, datasets(None: game not found), input xml hashes, stats delta)
+        """
+        timestamp, gid_path, gid_url = game
+        # Read XML & create dataset
+        try:
+            with MlbamStats.timer(MlbamStats.STAGE_ROWS):
                 game = Game.read_xml(gid_url, self.parser, timestamp, MlbAm._get_game_number(gid_path))
                 players = Players.read_xml(gid_url, self.parser, game)
-                innings = Inning.read_xml(gid_url, self.parser, game, players)
+                innings = Inning.read_xml(gid_url, self.parser, game, players, self.pitch_layout)
                 boxscore = BoxScore.read_xml(gid_url, self.parser, game, players)
-            except MlbAmHttpNotFound as e:
-                logging.warning(e.msg)
-                continue
-
-            # append a dataset
-            games.append(game.row())
-            rosters.extend([roseter.row() for roseter in players.rosters.values()])
-            coaches.extend([coach.row() for coach in players.coaches.values()])
-            umpires.extend([umpire.row() for umpire in players.umpires.values()])
-            atbats.extend(innings.atbats)
-            pitches.extend(innings.pitches)
-            actions.extend(innings.actions)
-            boxscores.append(boxscore.row())
-
-        # writing csv
-        day = "".join([timestamp_params['year'], timestamp_params['month'], timestamp_params['day']])
-        for params in (
-                {'datasets': games, 'filename': Game.DOWNLOAD_FILE_NAME},
-                {'datasets': rosters, 'filename': Players.Player.DOWNLOAD_FILE_NAME},
-                {'datasets': coaches, 'filename': Players.Coach.DOWNLOAD_FILE_NAME},
-                {'datasets': umpires, 'filename': Players.Umpire.DOWNLOAD_FILE_NAME},
-                {'datasets': atbats, 'filename': AtBat.DOWNLOAD_FILE_NAME},
-                {'datasets': pitches, 'filename': Pitch.DOWNLOAD_FILE_NAME},
-                {'datasets': boxscores, 'filename': BoxScore.DOWNLOAD_FILE_NAME},
-                {'datasets': actions, 'filename': InningAction.DOWNLOAD_FILE_NAME},
-        ):
-            self._write_csv(params['datasets'], params['filename'].format(day=day, extension=self.extension))
-        time.sleep(2)
-
-        logging.info('-<- Game data download end({year}/{month}/{day})'.format(**timestamp_params))
+                datasets = self._datasets(game, players, innings, boxscore, self.player_layout)
+        except MlbAmHttpError as e:
+            logging.warning(e.msg)
+            return gid_path, MlbAm._game_status(e), None, MlbamUtil.pop_digests(gid_url), MlbamStats.pop()
+        return gid_path, MlbamManifest.GAME_COMPLETE, datasets, MlbamUtil.pop_digests(gid_url), MlbamStats.pop()
+
+    @classmethod
+    def _game_status(cls, error):
+        """
+        Game status(download error)
+        :param error: MlbAmHttpError object
+        :return: not found(retry is useless) or failed(redo on resume)
+        """
+        if isinstance(error, MlbAmHttpNotFound) and not isinstance(error, MlbAmCacheMiss):
+            return MlbamManifest.GAME_NOT_FOUND
+        return MlbamManifest.GAME_FAILED
+
+    async def _download_async(self, days, manifest):
+        """
+        MLBAM dataset download(asyncio fetch, parse in process pool)
+        :param days: Game Days(datetime list)
+        :param manifest: MlbamManifest object
+        """
+        with ProcessPoolExecutor(self.workers) as executor:
+            async with MlbamAsyncUtil(**self.asyncio) as fetcher:
+                tasks = deque()
+                for timestamp in days:
+                    tasks.append((timestamp, asyncio.ensure_future(self._download_day_async(fetcher, executor, timestamp))))
+                    if len(tasks) >= self.days_in_flight:
+                        await self._write_datasets_async(*tasks.popleft(), manifest=manifest)
+                while tasks:
+                    await self._write_datasets_async(*tasks.popleft(), manifest=manifest)
+
+    async def _write_datasets_async(self, timestamp, task, manifest=None):
+        """
+        Write MLBAM Game Day datasets(asyncio, a game at a time in gid order)
+        :param timestamp: day
+        :param task: day task(result: game task list)
+        :param manifest: MlbamManifest object(None: not recorded)
+        """
+        games = await task
+        writers = self._open_writers(timestamp)
+        try:
+            results = []
+            for game in games:
+                results.append(self._write_game(writers, await game, timestamp.year))
+        except Exception:
+            for writer in writers.values():
+                writer.abort()
+            raise
+        self._close_writers(timestamp, writers, results, manifest)
+
+    async def _download_day_async(self, fetcher, executor, timestamp):
+        """
+        download MLBAM Game Day(asyncio)
+        :param fetcher: MlbamAsyncUtil object
+        :param executor: parse process pool
+        :param timestamp: day
+        :return: game task list(result: (gid path, status, datasets, input xml hashes, stats delta))
+        """
+        timestamp_params = self._timestamp_params(timestamp)
+
+        logging.info('->- Game data download start({year}/{month}/{day})'.format(**timestamp_params))
+
+        base_url = self.DELIMITER.join([self.url, self.PAGE_URL_GAME_DAY.format(**timestamp_params)])
+        href = self.PAGE_URL_GAME_PREFIX.format(**timestamp_params)
+        games = [
+            (timestamp, gid.get_text().strip(), self.DELIMITER.join([base_url, gid.get_text().strip()]))
+            for gid in await fetcher.find_xml_all(base_url, self.parser, 'a', href)
+        ]
+        return [asyncio.ensure_future(self._download_game_async(fetcher, executor, game)) for game in games]
+
+    async def _download_game_async(self, fetcher, executor, game):
+        """
+        download MLBAM Game(asyncio)
+        :param fetcher: MlbamAsyncUtil object
+        :param executor: parse process pool
+        :param game: (day, gid path, gid url)
+        :return: (gid path, status, datasets(None: game not found), input xml hashes, stats delta)
+        """
+        timestamp, gid_path, gid_url = game
+        inning_url = "".join([gid_url, Inning.DIRECTORY])
+        find_inning = fetcher.find_raw if self.parser == MlbamUtil.PARSER_ITERPARSE else fetcher.find_text
+        try:
+            game_xml, players_xml, boxscore_xml, hit_chart_xml, innings = await asyncio.gather(
+                fetcher.find_text("".join([gid_url, Game.FILENAME])),
+                fetcher.find_text("".join([gid_url, Players.FILENAME])),
+                fetcher.find_text("".join([gid_url, BoxScore.FILENAME])),
+                fetcher.find_text('/'.join([inning_url, Inning.FILENAME_INNING_HIT])),
+                fetcher.find_xml_all(inning_url, self.parser, Inning.TAG, Inning.FILENAME_PATTERN),
+            )
+            inning_xmls = await asyncio.gather(
+                *[find_inning('/'.join([inning_url, inning.get_text().strip()])) for inning in innings]
+            )
+        except MlbAmHttpError as e:
+            logging.warning(e.msg)
+            return gid_path, MlbAm._game_status(e), None, fetcher.pop_digests(gid_url), {}
+        datasets, stats = await asyncio.get_event_loop().run_in_executor(
+            executor,
+            functools.partial(
+                MlbAm._parse_game_stats,
+                self.parser, self.pitch_layout, timestamp, gid_path, game_xml, players_xml, boxscore_xml, hit_chart_xml, inning_xmls,
+                player_layout=self.player_layout,
+            )
+        )
+        return gid_path, MlbamManifest.GAME_COMPLETE, datasets, fetcher.pop_digests(gid_url), stats
+
+    @classmethod
+    def _parse_game_stats(cls, *args, **kwargs):
+        """
+        parse MLBAM Game(process pool, with stats delta)
+        :param args: MlbAm._parse_game args
+        :param kwargs: MlbAm._parse_game kwargs
+        :return: (datasets, stats delta)
+        """
+        # forked pool processes: drop stats copied from the parent process
+        MlbamStats.reset()
+        with MlbamStats.timer(MlbamStats.STAGE_ROWS):
+            datasets = cls._parse_game(*args, **kwargs)
+        return datasets, MlbamStats.pop()
+
+    @classmethod
+    def _parse_game(cls, parser, pitch_layout, timestamp, gid_path, game_xml, players_xml, boxscore_xml, hit_chart_xml,
+                    inning_xmls, player_layout=Players.Player.LAYOUT_FULL):
+        """
+        parse MLBAM Game(downloaded xml)
+        :param parser: markup provider
+        :param pitch_layout: pitch row layout(wide or normalized)
+        :param timestamp: day
+        :param gid_path: game logs directory path
+        :param game_xml: game.xml(str)
+        :param players_xml: players.xml(str)
+        :param boxscore_xml: boxscore.xml(str)
+        :param hit_chart_xml: inning_hit.xml(str)
+        :param inning_xmls: inning_N.xml list(iterparse: bytes, other: str)
+        :param player_layout: player row layout(full or slim)
+        :return: datasets(key: file name, value: rows)
+        """
+        game = Game._generate_game_object(
+            MlbamUtil.read_xml(game_xml, parser), timestamp, MlbAm._get_game_number(gid_path)
+        )
+        players = Players._read_objects(MlbamUtil.read_xml(players_xml, parser), game)
+        innings = Inning.read_contents(hit_chart_xml, inning_xmls, parser, game, players, pitch_layout)
+        boxscore = BoxScore._generate_object(MlbamUtil.read_xml(boxscore_xml, parser), game, players)
+        return cls._datasets(game, players, innings, boxscore, player_layout)
+
+    @classmethod
+    def _datasets(cls, game, players, innings, boxscore, player_layout=Players.Player.LAYOUT_FULL):
+        """
+        MLBAM Game datasets
+        :param game: MLBAM Game object
+        :param players: MLBAM Players object
+        :param innings: MLBAM Inning object
+        :param boxscore: MLBAM BoxScore object
+        :param player_layout: player row layout(full or slim: with season player table rows)
+        :return: datasets(key: file name, value: rows)
+        """
+        datasets = OrderedDict()
+        datasets[Game.DOWNLOAD_FILE_NAME] = [game.row()]
+        if player_layout == Players.Player.LAYOUT_SLIM:
+            datasets[Players.Player.DOWNLOAD_FILE_NAME] = [roseter.game_row() for roseter in players.rosters.values()]
+            datasets[Players.Player.DIMENSION_FILE_NAME] = [
+                roseter.dimension_row() for roseter in players.rosters.values()
+            ]
+        else:
+            datasets[Players.Player.DOWNLOAD_FILE_NAME] = [roseter.row() for roseter in players.rosters.values()]
+        datasets[Players.Coach.DOWNLOAD_FILE_NAME] = [coach.row() for coach in players.coaches.values()]
+        datasets[Players.Umpire.DOWNLOAD_FILE_NAME] = [umpire.row() for umpire in players.umpires.values()]
+        datasets[AtBat.DOWNLOAD_FILE_NAME] = innings.atbats
+        datasets[Pitch.DOWNLOAD_FILE_NAME] = innings.pitches
+        datasets[BoxScore.DOWNLOAD_FILE_NAME] = [boxscore.row()]
+        datasets[InningAction.DOWNLOAD_FILE_NAME] = innings.actions
+        return datasets
+
+    def _write_datasets(self, timestamp, games, manifest=None):
+        """
+        Write MLBAM Game Day datasets(streaming, a game at a time)
+        :param timestamp: day
+        :param games: (gid path, status, datasets(None: game not found), input xml hashes, stats delta) iterable
+        :param manifest: MlbamManifest object(None: not recorded)
+        """
+        writers = self._open_writers(timestamp)
+        try:
+            results = [self._write_game(writers, game, timestamp.year) for game in games]
+        except Exception:
+            for writer in writers.values():
+                writer.abort()
+            raise
+        self._close_writers(timestamp, writers, results, manifest)
+
+    def _open_writers(self, timestamp):
+        """
+        Open day writers(per file type)
+        :param timestamp: day
+        :return: {download file name: MlbamWriter object}
+        """
+        day = self._day(timestamp)
+        writers = OrderedDict()
+        for filename in self.DOWNLOAD_FILE_NAMES:
+            writers[filename] = self.writer(
+                '/'.join([self.output, filename.format(day=day, extension=self.extension)]), self.encoding
+            )
+            writers[filename].open()
+        return writers
+
+    @classmethod
+    def _write_game(cls, writers, game, season=None):
+        """
+        Append a game datasets
+        :param writers: day writers
+        :param game: (gid path, status, datasets(None: game not found), input xml hashes, stats delta)
+        :param season: season(year, season player table)
+        :return: (gid path, status, input xml hashes)
+        """
+        gid_path, status, datasets, inputs, stats = game
+        MlbamStats.merge(stats)
+        MlbamStats.count('games_{status}'.format(status=status))
+        if datasets:
+            with MlbamStats.timer(MlbamStats.STAGE_WRITE):
+                for filename, writer in writers.items():
+                    writer.write_rows(datasets[filename])
+                    MlbamStats.count(cls.ROW_COUNTERS[filename], len(datasets[filename]))
+            if Players.Player.DIMENSION_FILE_NAME in datasets:
+                MlbamPlayerCache.update(season, datasets[Players.Player.DIMENSION_FILE_NAME])
+            MlbamMatrix.update(season, datasets[AtBat.DOWNLOAD_FILE_NAME])
+            with MlbamStats.timer(MlbamStats.STAGE_WRITE):
+                MlbamPitchStore.append(season, datasets[Pitch.DOWNLOAD_FILE_NAME])
+        return gid_path, status, inputs
+
+    def _close_writers(self, timestamp, writers, results, manifest=None):
+        """
+        Close day writers(atomic rename) & record the day
+        :param timestamp: day
+        :param writers: day writers
+        :param results: (gid path, status, input xml hashes) list
+        :param manifest: MlbamManifest object(None: not recorded)
+        """
+        with MlbamStats.timer(MlbamStats.STAGE_WRITE):
+            for writer in writers.values():
+                writer.close()
+        # side stores first: a recorded day is skipped on resume
+        MlbamPlayerCache.save()
+        MlbamMatrix.save()
+        MlbamPitchStore.save()
+        if manifest:
+            manifest.record(
+                self._day(timestamp),
+                [os.path.basename(writer.path) for writer in writers.values()],
+                {gid_path: {'status': status, 'inputs': inputs} for gid_path, status, inputs in results},
+            )
+
+        logging.info('-<- Game data download end({year}/{month}/{day})'.format(**self._timestamp_params(timestamp)))
+
+    def _write_player_seasons(self):
+        """
+        Write season player tables(changed seasons only)
+        """
+        for season in sorted(MlbamPlayerCache.updated):
+            self.writer.write(
+                '/'.join([
+                    self.output, Players.Player.DIMENSION_FILE_NAME.format(season=season, extension=self.extension)
+                ]),
+                MlbamPlayerCache.rows(season),
+                self.encoding,
+            )
 
     @classmethod
     def _get_game_number(cls, gid_path):
@@ -129,20 +540,6 @@ class MlbAm(object):
                     return int(char)
         raise MlbAmException('Illegal Game Number:(gid:{gid_path})'.format(gid_path))
 
-    def _write_csv(self, datasets, filename):
-        """
-        Write CSV
-        :param datasets: Datasets
-        :param filename: File Name
-        """
-        with open('/'.join([self.output, filename]), mode='w', encoding=self.encoding) as write_file:
-            writer = csv.writer(write_file, delimiter=',')
-            for i, row in enumerate(datasets):
-                if i == 0:
-                    # header
-                    writer.writerow(list(row.keys()))
-                writer.writerow(list(row.values()))
-
     @classmethod
     def _validate_datetime(cls, value):
         """
@@ -183,12 +580,16 @@ class MlbAm(object):
         return days
 
     @classmethod
-    def scrape(cls, start, end, output):
+    def scrape(cls, start, end, output, cache=None, offline=False, resume=False, revalidate=False):
         """
         Scrape a MLBAM Data
         :param start: Start Day(YYYYMMDD)
         :param end: End Day(YYYYMMDD)
         :param output: Output directory
+        :param cache: Raw XML cache directory
+        :param offline: Replay from cache only(True or False)
+        :param resume: Skip completed days(True or False)
+        :param revalidate: Conditional request for cached responses(True or False)
         """
         # Logger setting
         logging.basicConfig(
@@ -207,25 +608,76 @@ class MlbAm(object):
 
         # Download
         logging.info('->- MLBAM dataset download start')
-        mlb = MlbAm(os.path.dirname(os.path.abspath(__file__)), output, cls._days(start, end))
-        mlb.download()
+        mlb = MlbAm(
+            os.path.dirname(os.path.abspath(__file__)),
+            output,
+            cls._days(start, end),
+            cache=cache,
+            offline=offline,
+            resume=resume,
+            revalidate=revalidate,
+        )
+        summary = mlb.download()
         logging.info('-<- MLBAM dataset download end')
+        logging.info('-<- MLBAM dataset download stats: {summary}'.format(summary=MlbamStats.dumps(summary)))
+
+    @classmethod
+    def live(cls, day, output, cache=None):
+        """
+        Poll a MLBAM Game Day(in-progress games)
+        :param day: Game Day(YYYYMMDD)
+        :param output: Output directory
+        :param cache: Raw XML cache directory(revalidated per poll)
+        """
+        # Logger setting
+        logging.basicConfig(
+            level=logging.INFO,
+            format="time:%(asctime)s.%(msecs)03d" + "\tmessage:%(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S"
+        )
+
+        # validate
+        try:
+            cls._validate_datetime(day)
+        except (validators.Invalid, MlbAmException) as e:
+            raise MlbAmException('{msg} a {name}.'.format(name='Start Day', msg=e.msg))
+
+        # Polling
+        logging.info('->- MLBAM live polling start')
+        mlb = MlbAm(os.path.dirname(os.path.abspath(__file__)), output, cls._days(day, day), cache=cache)
+        mlb.poll()
+        logging.info('-<- MLBAM live polling end')
 
 
 @click.command()
-@click.option('--start', '-s', required=True, help='Start Day(YYYYMMDD)')
-@click.option('--end', '-e', required=True, help='End Day(YYYYMMDD)')
+@click.option('--start', '-s', default=None, help='Start Day(YYYYMMDD, --live: Game Day, default: today)')
+@click.option('--end', '-e', default=None, help='End Day(YYYYMMDD)')
 @click.option('--out', '-o', required=True, default='../output/mlb', help='Output directory(default:"./output/mlb")')
-def scrape(start, end, out):
+@click.option('--cache', '-c', default=None, help='Raw XML cache directory(default:setting.yml)')
+@click.option('--offline', is_flag=True, default=False, help='Replay from cache only')
+@click.option('--resume', is_flag=True, default=False, help='Skip days completed by a previous run')
+@click.option('--live', is_flag=True, default=False, help='Poll in-progress games(new at bats, pitches & actions)')
+@click.option('--revalidate', is_flag=True, default=False, help='Conditional request for cached responses')
+def scrape(start, end, out, cache, offline, resume, live, revalidate):
     """
     Scrape a MLBAM Data
     :param start: Start Day(YYYYMMDD)
     :param end: End Day(YYYYMMDD)
     :param out: Output directory(default:"../output/mlb")
+    :param cache: Raw XML cache directory(default:setting.yml)
+    :param offline: Replay from cache only
+    :param resume: Skip days completed by a previous run
+    :param live: Poll in-progress games
+    :param revalidate: Conditional request for cached responses
     """
     try:
         logging.basicConfig(level=logging.DEBUG)
-        MlbAm.scrape(start, end, out)
+        if live:
+            MlbAm.live(start or dt.now().strftime(MlbAm.DATE_FORMAT), out, cache=cache)
+            return
+        if not start or not end:
+            raise click.UsageError('--start and --end are required.')
+        MlbAm.scrape(start, end, out, cache=cache, offline=offline, resume=resume, revalidate=revalidate)
     except MlbAmBadParameter as e:
         raise click.BadParameter(e)
 
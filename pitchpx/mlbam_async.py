@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import re
+import time
+import asyncio
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from pitchpx.mlbam_util import MlbamUtil, MlbAmException, MlbAmCacheMiss
+from pitchpx.mlbam_cache import MlbamCache
+from pitchpx.mlbam_rate_limit import MlbamRateLimiter
+from pitchpx.mlbam_retry import MlbamRetry
+from pitchpx.mlbam_session import MlbamSession
+from pitchpx.mlbam_stats import MlbamStats
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class MlbamAsyncUtil(object):
+    """
+    asyncio fetch engine(async counterpart of MlbamUtil)
+    """
+
+    def __init__(self, concurrency=100, limit_per_host=0, headers=MlbamUtil.HTTP_HEADERS):
+        """
+        :param concurrency: max requests in flight
+        :param limit_per_host: max requests in flight per host(0: unlimited)
+        :param headers: http header
+        """
+        if aiohttp is None:
+            raise MlbAmException('asyncio engine needs aiohttp(pip install pitchpx[asyncio])')
+        self.concurrency = concurrency
+        self.limit_per_host = limit_per_host
+        self.headers = headers
+        self.session = None
+        self.digests = {}
+
+    async def __aenter__(self):
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.limit_per_host),
+            timeout=aiohttp.ClientTimeout(total=MlbamSession.timeout),
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.session.close()
+        self.session = None
+
+    async def _get_content(self, url):
+        """
+        Get http content
+        :param url: contents url
+        :return: requests.Response object
+        """
+        cached = None
+        if MlbamCache.enabled():
+            cached = MlbamCache.get(url)
+            if MlbamCache.use_cached(cached):
+                MlbamStats.count('cache_hits')
+                return cached
+            if MlbamCache.offline:
+                raise MlbAmCacheMiss('Cache miss url: {url}'.format(url=url))
+        wait = MlbamRateLimiter.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        start = time.perf_counter()
+        async with self.session.get(url, headers=MlbamCache.conditional_headers(cached, self.headers)) as resp:
+            body = await resp.read()
+        # concurrent requests(sum of request time)
+        MlbamStats.add(MlbamStats.STAGE_FETCH, time.perf_counter() - start)
+        MlbamStats.count('http_requests')
+        MlbamStats.count('http_bytes', len(body))
+        req = Response()
+        req.url = url
+        req.status_code = resp.status
+        req.headers = CaseInsensitiveDict(resp.headers)
+        req.encoding = get_encoding_from_headers(req.headers)
+        req._content = body
+        if cached is not None and req.status_code == MlbamCache.NOT_MODIFIED:
+            MlbamStats.count('not_modified')
+            return MlbamCache.not_modified(url, cached, req)
+        if MlbamCache.enabled() and req.status_code in range(200, 300):
+            MlbamCache.put(url, req)
+        return req
+
+    async def _find_content(self, url):
+        """
+        find content(2xx only)
+        :param url: contents url
+        :return: requests.Response object
+        """
+        for attempt in range(1, MlbamRetry.max_attempts + 1):
+            try:
+                req, error = await self._get_content(url), None
+            except MlbamRetry.RETRY_EXCEPTIONS + (aiohttp.ClientError, ) as e:
+                req, error = None, e
+            req, wait = MlbamUtil._attempt(url, attempt, req, error, self.digests)
+            if req is not None:
+                return req
+            await asyncio.sleep(wait)
+
+    def pop_digests(self, prefix):
+        """
+        Pop recorded input xml hashes
+        :param prefix: url prefix(ex: gid url)
+        :return: {url: sha1}
+        """
+        urls = [url for url in self.digests if url.startswith(prefix)]
+        return {url: self.digests.pop(url) for url in urls}
+
+    async def find_raw(self, url):
+        """
+        find raw xml
+        :param url: contents url
+        :return: xml(bytes)
+        """
+        return (await self._find_content(url)).content
+
+    async def find_text(self, url):
+        """
+        find xml text
+        :param url: contents url
+        :return: xml(str)
+        """
+        return (await self._find_content(url)).text
+
+    async def find_xml(self, url, features):
+        """
+        find xml
+        :param url: contents url
+        :param features: markup provider
+        :return: BeautifulSoup object
+        """
+        return MlbamUtil.read_xml(await self.find_text(url), features)
+
+    async def find_xml_all(self, url, markup, tag, pattern):
+        """
+        find xml(list)
+        :param url: contents url
+        :param markup: markup provider
+        :param tag: find tag
+        :param pattern: xml file pattern
+        :return: BeautifulSoup object list
+        """
+        body = await self.find_xml(url, markup)
+        return body.find_all(tag, href=re.compile(pattern))
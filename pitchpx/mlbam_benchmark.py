@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import copy
+import json
+import yaml
+import click
+import logging
+import resource
+import tempfile
+from formencode import validators
+
+from pitchpx import mlbam
+from pitchpx.mlbam import MlbAm
+from pitchpx.mlbam_util import MlbAmBadParameter
+from pitchpx.mlbam_corpus import MlbamCorpus, MlbamStaticServer
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class MlbamBenchmark(object):
+    """
+    Offline benchmark(full parse & write path, corpus served by MlbamStaticServer or replayed from the raw cache)
+    Corpus: recorded gid directories or a synthetic corpus(MlbamCorpus)
+    Report: games/sec, pitches/sec, peak RSS & stage time(MlbamStats)
+    """
+    SETTING_FILE = 'setting.yml'
+    PITCH_COUNTER = 'rows_pitch'
+    # ru_maxrss unit(Linux: kilobytes, macOS: bytes)
+    RSS_UNIT = 1 if sys.platform == 'darwin' else 1024
+
+    def __init__(self, start, end, corpus=None, cache=None, config=None, repeat=1, synthetic=None):
+        """
+        :param start: Start Day(YYYYMMDD)
+        :param end: End Day(YYYYMMDD)
+        :param corpus: corpus directory(served by MlbamStaticServer)
+        :param cache: Raw XML cache directory(offline replay)
+        :param config: setting.yml config overrides(dict, ex: {'engine': 'asyncio'})
+        :param repeat: runs
+        :param synthetic: synthetic corpus size(dict, MlbamCorpus params ex: {'games': 15}, generated per benchmark)
+        """
+        if len([source for source in (corpus, cache, synthetic) if source is not None]) != 1:
+            raise MlbAmBadParameter('Benchmark needs a corpus, a cache directory or a synthetic corpus')
+        if repeat < 1:
+            raise MlbAmBadParameter('Illegal repeat: {repeat}'.format(repeat=repeat))
+        for day in (start, end):
+            MlbAm._validate_datetime(day)
+        MlbAm._validate_datetime_from_to(start, end)
+        self.days = MlbAm._days(start, end)
+        self.corpus = corpus
+        self.cache = cache
+        self.config = config or {}
+        self.repeat = repeat
+        self.synthetic = synthetic
+        base_dir = os.path.dirname(os.path.abspath(mlbam.__file__))
+        with open(os.path.join(base_dir, self.SETTING_FILE), 'r') as setting_file:
+            self.setting = yaml.safe_load(setting_file)
+
+    def run(self):
+        """
+        Run the benchmark
+        :return: report(dict, the fastest run & all runs)
+        """
+        if self.cache:
+            runs = [self._run(self.setting['mlb']['url']) for _ in range(self.repeat)]
+        elif self.synthetic is not None:
+            with tempfile.TemporaryDirectory() as corpus:
+                MlbamCorpus(corpus, **self.synthetic).generate(self.days[0], self.days[-1])
+                with MlbamStaticServer(corpus) as server:
+                    runs = [self._run(server.url) for _ in range(self.repeat)]
+        else:
+            with MlbamStaticServer(self.corpus) as server:
+                runs = [self._run(server.url) for _ in range(self.repeat)]
+        report = dict(min(runs, key=lambda run: run['elapsed']))
+        report['runs'] = runs
+        report['peak_rss_mb'] = self.peak_rss()
+        return report
+
+    def _run(self, url):
+        """
+        A run(temporary setting & output directory)
+        :param url: MLBAM url
+        :return: stats summary(dict, with pitches/sec)
+        """
+        setting = copy.deepcopy(self.setting)
+        setting['mlb']['url'] = url
+        setting['config'].update(self.config)
+        # local corpus: no throttle, no cache(every run fetches & parses)
+        setting.setdefault('rate_limit', {})['rate'] = 0
+        setting.setdefault('cache', {})['directory'] = None
+        setting.setdefault('stats', {})['prometheus'] = None
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, self.SETTING_FILE), 'w') as setting_file:
+                yaml.safe_dump(setting, setting_file)
+            output = os.path.join(tmp, 'output')
+            os.makedirs(output)
+            mlb = MlbAm(tmp, output, self.days, cache=self.cache, offline=bool(self.cache))
+            summary = mlb.download()
+        pitches = summary['counters'].get(self.PITCH_COUNTER, 0)
+        summary['pitches_per_sec'] = round(pitches / summary['elapsed'], 3) if summary['elapsed'] > 0 else 0.0
+        return summary
+
+    @classmethod
+    def peak_rss(cls):
+        """
+        Peak RSS(this process & the largest finished worker process)
+        :return: {'main': MB, 'workers': MB}
+        """
+        return {
+            'main': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * cls.RSS_UNIT / 1048576, 1),
+            'workers': round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * cls.RSS_UNIT / 1048576, 1),
+        }
+
+    @classmethod
+    def dumps(cls, report):
+        """
+        JSON report
+        :param report: MlbamBenchmark.run result
+        :return: str
+        """
+        return json.dumps(report, indent=1, sort_keys=True)
+
+
+@click.command()
+@click.option('--start', '-s', required=True, help='Start Day(YYYYMMDD)')
+@click.option('--end', '-e', required=True, help='End Day(YYYYMMDD)')
+@click.option('--corpus', default=None, help='Corpus directory(year_YYYY/month_MM/day_DD/gid_.../)')
+@click.option('--cache', '-c', default=None, help='Raw XML cache directory(offline replay)')
+@click.option('--synthetic', default=None, type=int, help='Synthetic corpus(games per day, MlbamCorpus defaults)')
+@click.option('--config', multiple=True, help='setting.yml config override(ex: --config engine=asyncio)')
+@click.option('--repeat', '-n', default=1, help='Runs(report: the fastest run)')
+def benchmark(start, end, corpus, cache, synthetic, config, repeat):
+    """
+    MLBAM parse & write benchmark
+    :param start: Start Day(YYYYMMDD)
+    :param end: End Day(YYYYMMDD)
+    :param corpus: Corpus directory
+    :param cache: Raw XML cache directory
+    :param synthetic: Synthetic corpus games per day
+    :param config: setting.yml config overrides(key=value)
+    :param repeat: Runs
+    """
+    try:
+        logging.basicConfig(level=logging.WARNING)
+        overrides = {}
+        for item in config:
+            key, _, value = item.partition('=')
+            overrides[key] = yaml.safe_load(value)
+        benchmark = MlbamBenchmark(
+            start, end, corpus, cache, overrides, repeat,
+            synthetic={'games': synthetic} if synthetic is not None else None,
+        )
+        click.echo(MlbamBenchmark.dumps(benchmark.run()))
+    except (validators.Invalid, MlbAmBadParameter) as e:
+        raise click.BadParameter(e)
+
+if __name__ == '__main__':
+    benchmark()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import hashlib
+import tempfile
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class MlbamCache(object):
+    """
+    Raw HTTP response cache(on disk, key: url)
+    Revalidate: cached responses are checked by conditional requests(ETag, Last-Modified)
+    """
+    BODY_EXTENSION = 'body'
+    META_EXTENSION = 'json'
+    EVICT_RATIO = 0.9
+    NOT_MODIFIED = 304
+    # response header: conditional request header
+    VALIDATORS = (('ETag', 'If-None-Match'), ('Last-Modified', 'If-Modified-Since'))
+
+    directory = None
+    max_size = 0
+    offline = False
+    revalidate = False
+
+    _size = None
+    _pid = None
+
+    @classmethod
+    def configure(cls, directory=None, max_size=0, offline=False, revalidate=False):
+        """
+        Cache setting
+        :param directory: cache directory(None: cache disabled)
+        :param max_size: max cache size(bytes, 0: unlimited)
+        :param offline: replay from cache only(True or False)
+        :param revalidate: conditional request for cached responses(True or False)
+        """
+        cls.directory = directory
+        cls.max_size = max_size or 0
+        cls.offline = offline
+        cls.revalidate = revalidate
+        cls._size, cls._pid = None, None
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    @classmethod
+    def enabled(cls):
+        """
+        Cache enabled
+        :return: True or False
+        """
+        return cls.directory is not None
+
+    @classmethod
+    def key(cls, url):
+        """
+        Cache key
+        :param url: contents url
+        :return: sha1 hex digest
+        """
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def _path(cls, key, extension):
+        """
+        Cache file path
+        :param key: cache key
+        :param extension: file extension
+        :return: path
+        """
+        return os.path.join(cls.directory, key[:2], '{key}.{extension}'.format(key=key, extension=extension))
+
+    @classmethod
+    def get(cls, url):
+        """
+        Get cached response
+        :param url: contents url
+        :return: requests.Response object or None
+        """
+        key = cls.key(url)
+        meta_path, body_path = cls._path(key, cls.META_EXTENSION), cls._path(key, cls.BODY_EXTENSION)
+        try:
+            with open(meta_path, mode='r', encoding='utf-8') as meta_file:
+                meta = json.load(meta_file)
+            with open(body_path, mode='rb') as body_file:
+                body = body_file.read()
+            # least recently used
+            os.utime(body_path)
+        except (OSError, ValueError):
+            return None
+        response = Response()
+        response.url = meta['url']
+        response.status_code = meta['status_code']
+        response.headers = CaseInsensitiveDict(meta['headers'])
+        response.encoding = meta['encoding']
+        response._content = body
+        return response
+
+    @classmethod
+    def use_cached(cls, cached):
+        """
+        Cached response without request
+        :param cached: requests.Response object or None
+        :return: True or False(request, conditional when cached)
+        """
+        return cached is not None and (cls.offline or not cls.revalidate)
+
+    @classmethod
+    def conditional_headers(cls, cached, headers):
+        """
+        Request headers with validators of the cached response
+        :param cached: requests.Response object or None
+        :param headers: http header
+        :return: http header
+        """
+        if cached is None:
+            return headers
+        headers = dict(headers)
+        for validator, header in cls.VALIDATORS:
+            if cached.headers.get(validator):
+                headers[header] = cached.headers[validator]
+        return headers
+
+    @classmethod
+    def not_modified(cls, url, cached, response):
+        """
+        Refresh a cached response by 304 Not Modified(validators are updated)
+        :param url: contents url
+        :param cached: cached requests.Response object
+        :param response: 304 requests.Response object
+        :return: cached requests.Response object
+        """
+        changed = False
+        for validator, _ in cls.VALIDATORS:
+            if response.headers.get(validator) and response.headers[validator] != cached.headers.get(validator):
+                cached.headers[validator] = response.headers[validator]
+                changed = True
+        if changed:
+            cls._write_meta(cls.key(url), url, cached)
+        return cached
+
+    @classmethod
+    def put(cls, url, response):
+        """
+        Store response
+        :param url: contents url
+        :param response: requests.Response object
+        """
+        key = cls.key(url)
+        body = response.content
+        os.makedirs(os.path.dirname(cls._path(key, cls.BODY_EXTENSION)), exist_ok=True)
+        # body first, an entry exists when the meta exists
+        cls._write(cls._path(key, cls.BODY_EXTENSION), body)
+        cls._write_meta(key, url, response)
+        if cls.max_size:
+            cls._add_size(len(body))
+
+    @classmethod
+    def _write_meta(cls, key, url, response):
+        """
+        Write response meta(status, headers with validators, encoding)
+        :param key: cache key
+        :param url: contents url
+        :param response: requests.Response object
+        """
+        meta = {
+            'url': url,
+            'status_code': response.status_code,
+            'headers': dict(response.headers),
+            'encoding': response.encoding,
+        }
+        cls._write(cls._path(key, cls.META_EXTENSION), json.dumps(meta).encode('utf-8'))
+
+    @classmethod
+    def _write(cls, path, data):
+        """
+        Write file(atomic)
+        :param path: file path
+        :param data: bytes
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, mode='wb') as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def _entries(cls):
+        """
+        Cache entries
+        :return: (last used, size, key) list
+        """
+        entries = []
+        for root, _, files in os.walk(cls.directory):
+            for filename in files:
+                key, extension = os.path.splitext(filename)
+                if extension != '.{extension}'.format(extension=cls.BODY_EXTENSION):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(root, filename))
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, key))
+        return entries
+
+    @classmethod
+    def _add_size(cls, size):
+        """
+        Count cache size, evict when over max size
+        :param size: added bytes
+        """
+        if cls._size is None or cls._pid != os.getpid():
+            cls._size = sum([entry[1] for entry in cls._entries()])
+            cls._pid = os.getpid()
+        else:
+            cls._size += size
+        if cls._size > cls.max_size:
+            cls.evict()
+
+    @classmethod
+    def evict(cls):
+        """
+        Evict least recently used entries(until EVICT_RATIO * max size)
+        """
+        entries = sorted(cls._entries())
+        size = sum([entry[1] for entry in entries])
+        limit = cls.max_size * cls.EVICT_RATIO
+        for _, entry_size, key in entries:
+            if size <= limit:
+                break
+            for extension in (cls.META_EXTENSION, cls.BODY_EXTENSION):
+                try:
+                    os.remove(cls._path(key, extension))
+                except OSError:
+                    pass
+            size -= entry_size
+        cls._size = size
@@ -0,0 +1,801 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import uuid
+import click
+import random
+import logging
+import threading
+from formencode import validators
+from datetime import timedelta
+from xml.sax.saxutils import quoteattr
+from socketserver import ThreadingMixIn
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+
+from pitchpx.mlbam import MlbAm
+from pitchpx.mlbam_util import MlbAmBadParameter
+from pitchpx.game.game import Game
+from pitchpx.game.players import Players
+from pitchpx.game.boxscore import BoxScore
+from pitchpx.game.inning import Inning
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class MlbamStaticHandler(SimpleHTTPRequestHandler):
+    """
+    Static file handler(corpus directory, directory listing: gid & inning anchors)
+    """
+    corpus = '.'
+
+    def translate_path(self, path):
+        """
+        Corpus file path
+        :param path: request path
+        :return: file path
+        """
+        path = super().translate_path(path)
+        return os.path.join(self.corpus, os.path.relpath(path, os.getcwd()))
+
+    def log_message(self, format, *args):
+        """
+        No access log
+        """
+        pass
+
+
+class MlbamStaticServer(ThreadingMixIn, HTTPServer):
+    """
+    Local HTTP stand-in(MLBAM Gameday layout: year_YYYY/month_MM/day_DD/gid_.../)
+    """
+    daemon_threads = True
+
+    def __init__(self, corpus, host='127.0.0.1', port=0):
+        """
+        :param corpus: corpus directory
+        :param host: bind address
+        :param port: port(0: any free port)
+        """
+        handler = type('MlbamCorpusHandler', (MlbamStaticHandler, ), {'corpus': os.path.abspath(corpus)})
+        super().__init__((host, port), handler)
+        self._thread = None
+
+    @property
+    def url(self):
+        """
+        Base url(setting.yml mlb.url)
+        :return: url
+        """
+        host, port = self.server_address[:2]
+        return 'http://{host}:{port}'.format(host=host, port=port)
+
+    def start(self):
+        """
+        Serve in a daemon thread
+        :return: self
+        """
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Shutdown
+        """
+        if self._thread:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+class MlbamCorpus(object):
+    """
+    Synthetic Gameday corpus(gid directory trees: game.xml, players.xml, boxscore.xml, inning/inning_hit.xml &
+    inning/inning_N.xml), same schema as the MLBAM Gameday files
+    Deterministic(seed): rosters are stable per team, games per day
+    """
+    GID_PATH = 'gid_{year}_{month}_{day}_{away}mlb_{home}mlb_{number}'
+    LEAGUES = {'AL': '103', 'NL': '104'}
+    # code, abbrev, id, name, name_full, name_brief, league, division_id, venue_id, venue, location
+    TEAMS = (
+        ('bal', 'BAL', '110', 'Baltimore', 'Baltimore Orioles', 'Orioles', 'AL', '201', '2',
+         'Oriole Park at Camden Yards', 'Baltimore, MD'),
+        ('bos', 'BOS', '111', 'Boston', 'Boston Red Sox', 'Red Sox', 'AL', '201', '3', 'Fenway Park', 'Boston, MA'),
+        ('nya', 'NYY', '147', 'NY Yankees', 'New York Yankees', 'Yankees', 'AL', '201', '3313', 'Yankee Stadium',
+         'Bronx, NY'),
+        ('tba', 'TB', '139', 'Tampa Bay', 'Tampa Bay Rays', 'Rays', 'AL', '201', '12', 'Tropicana Field',
+         'St. Petersburg, FL'),
+        ('tor', 'TOR', '141', 'Toronto', 'Toronto Blue Jays', 'Blue Jays', 'AL', '201', '14', 'Rogers Centre',
+         'Toronto, ON'),
+        ('cha', 'CWS', '145', 'Chi White Sox', 'Chicago White Sox', 'White Sox', 'AL', '202', '4',
+         'U.S. Cellular Field', 'Chicago, IL'),
+        ('cle', 'CLE', '114', 'Cleveland', 'Cleveland Indians', 'Indians', 'AL', '202', '5', 'Progressive Field',
+         'Cleveland, OH'),
+        ('det', 'DET', '116', 'Detroit', 'Detroit Tigers', 'Tigers', 'AL', '202', '2394', 'Comerica Park',
+         'Detroit, MI'),
+        ('kca', 'KC', '118', 'Kansas City', 'Kansas City Royals', 'Royals', 'AL', '202', '7', 'Kauffman Stadium',
+         'Kansas City, MO'),
+        ('min', 'MIN', '142', 'Minnesota', 'Minnesota Twins', 'Twins', 'AL', '202', '3312', 'Target Field',
+         'Minneapolis, MN'),
+        ('hou', 'HOU', '117', 'Houston', 'Houston Astros', 'Astros', 'AL', '200', '2392', 'Minute Maid Park',
+         'Houston, TX'),
+        ('ana', 'LAA', '108', 'LA Angels', 'Los Angeles Angels', 'Angels', 'AL', '200', '1',
+         'Angel Stadium of Anaheim', 'Anaheim, CA'),
+        ('oak', 'OAK', '133', 'Oakland', 'Oakland Athletics', 'Athletics', 'AL', '200', '10', 'O.co Coliseum',
+         'Oakland, CA'),
+        ('sea', 'SEA', '136', 'Seattle', 'Seattle Mariners', 'Mariners', 'AL', '200', '680', 'Safeco Field',
+         'Seattle, WA'),
+        ('tex', 'TEX', '140', 'Texas', 'Texas Rangers', 'Rangers', 'AL', '200', '13', 'Globe Life Park in Arlington',
+         'Arlington, TX'),
+        ('atl', 'ATL', '144', 'Atlanta', 'Atlanta Braves', 'Braves', 'NL', '204', '16', 'Turner Field',
+         'Atlanta, GA'),
+        ('mia', 'MIA', '146', 'Miami', 'Miami Marlins', 'Marlins', 'NL', '204', '4169', 'Marlins Park', 'Miami, FL'),
+        ('nyn', 'NYM', '121', 'NY Mets', 'New York Mets', 'Mets', 'NL', '204', '3289', 'Citi Field', 'Flushing, NY'),
+        ('phi', 'PHI', '143', 'Philadelphia', 'Philadelphia Phillies', 'Phillies', 'NL', '204', '2681',
+         'Citizens Bank Park', 'Philadelphia, PA'),
+        ('was', 'WSH', '120', 'Washington', 'Washington Nationals', 'Nationals', 'NL', '204', '3309',
+         'Nationals Park', 'Washington, DC'),
+        ('chn', 'CHC', '112', 'Chi Cubs', 'Chicago Cubs', 'Cubs', 'NL', '205', '17', 'Wrigley Field', 'Chicago, IL'),
+        ('cin', 'CIN', '113', 'Cincinnati', 'Cincinnati Reds', 'Reds', 'NL', '205', '2602',
+         'Great American Ball Park', 'Cincinnati, OH'),
+        ('mil', 'MIL', '158', 'Milwaukee', 'Milwaukee Brewers', 'Brewers', 'NL', '205', '32', 'Miller Park',
+         'Milwaukee, WI'),
+        ('pit', 'PIT', '134', 'Pittsburgh', 'Pittsburgh Pirates', 'Pirates', 'NL', '205', '31', 'PNC Park',
+         'Pittsburgh, PA'),
+        ('sln', 'STL', '138', 'St. Louis', 'St. Louis Cardinals', 'Cardinals', 'NL', '205', '2889', 'Busch Stadium',
+         'St. Louis, MO'),
+        ('ari', 'ARI', '109', 'Arizona', 'Arizona Diamondbacks', 'D-backs', 'NL', '203', '15', 'Chase Field',
+         'Phoenix, AZ'),
+        ('col', 'COL', '115', 'Colorado', 'Colorado Rockies', 'Rockies', 'NL', '203', '19', 'Coors Field',
+         'Denver, CO'),
+        ('lan', 'LAD', '119', 'LA Dodgers', 'Los Angeles Dodgers', 'Dodgers', 'NL', '203', '22', 'Dodger Stadium',
+         'Los Angeles, CA'),
+        ('sdn', 'SD', '135', 'San Diego', 'San Diego Padres', 'Padres', 'NL', '203', '2680', 'Petco Park',
+         'San Diego, CA'),
+        ('sfn', 'SF', '137', 'San Francisco', 'San Francisco Giants', 'Giants', 'NL', '203', '2395', 'AT&T Park',
+         'San Francisco, CA'),
+    )
+    FIRST_NAMES = (
+        'Adam', 'Brad', 'Carlos', 'Chris', 'David', 'Felix', 'Hisashi', 'Ichiro', 'Jose', 'Kyle', 'Luis', 'Manny',
+        'Matt', 'Mike', 'Nelson', 'Robinson', 'Ryan', 'Shohei', 'Taijuan', 'Yu',
+    )
+    LAST_NAMES = (
+        'Cano', 'Cruz', 'Davis', 'Garcia', 'Hernandez', 'Iwakuma', 'Jackson', 'Jones', 'Machado', 'Martinez',
+        'Miller', 'Nakagawa', 'Ortiz', 'Rodriguez', 'Seager', 'Smith', 'Suzuki', 'Trout', 'Walker', 'Zunino',
+    )
+    # starting lineup positions(bat order 1-9), bench & pitchers
+    LINEUP = ('CF', 'SS', '2B', 'DH', '1B', '3B', 'RF', 'LF', 'C')
+    BENCH = ('C', 'IF', 'OF', 'OF')
+    PITCHERS = 12
+    ROTATION = 5
+    POSITION_NAMES = {
+        'P': 'pitcher', 'C': 'catcher', '1B': 'first baseman', '2B': 'second baseman', '3B': 'third baseman',
+        'SS': 'shortstop', 'LF': 'left fielder', 'CF': 'center fielder', 'RF': 'right fielder',
+    }
+    COACHES = ('manager', 'hitting_coach', 'pitching_coach', 'first_base_coach', 'third_base_coach', 'bench_coach')
+    UMPIRES = ('home', 'first', 'second', 'third')
+    PITCH_TYPES = {'FF': 93.0, 'SI': 91.5, 'FC': 88.0, 'SL': 84.0, 'CH': 84.5, 'CU': 78.0}
+    # at bat events: (event, des format, last pitch result, hit chart type(None: not in play), weight)
+    OUT_EVENTS = (
+        ('Strikeout', '{batter} strikes out swinging.  ', 'S', None, 30),
+        ('Groundout', '{batter} grounds out to {position} {fielder}.  ', 'X', 'O', 30),
+        ('Flyout', '{batter} flies out to {position} {fielder}.  ', 'X', 'O', 20),
+        ('Lineout', '{batter} lines out to {position} {fielder}.  ', 'X', 'O', 10),
+        ('Pop Out', '{batter} pops out to {position} {fielder}.  ', 'X', 'O', 10),
+    )
+    ON_BASE_EVENTS = (
+        ('Single', '{batter} singles on a line drive to {position} {fielder}.  ', 'X', 'H', 55),
+        ('Walk', '{batter} walks.  ', 'B', None, 20),
+        ('Double', '{batter} doubles on a fly ball to {position} {fielder}.  ', 'X', 'H', 17),
+        ('Home Run', '{batter} homers on a fly ball to {position} {fielder}.  ', 'X', 'H', 8),
+    )
+    # bases advanced(runners, batter)
+    ADVANCE = {'Single': 1, 'Walk': 0, 'Double': 2, 'Home Run': 4}
+    BASES = ('1B', '2B', '3B')
+
+    def __init__(self, directory, games=15, innings=9, atbats=4, pitches=4, seed=0):
+        """
+        :param directory: corpus directory
+        :param games: games per day
+        :param innings: innings per game
+        :param atbats: at bats per half inning(>= 3, the last at bat is the third out)
+        :param pitches: pitches per at bat(>= 1)
+        :param seed: random seed
+        """
+        if games < 0 or innings < 1 or atbats < 3 or pitches < 1:
+            raise MlbAmBadParameter(
+                'Illegal corpus size(games: {games}, innings: {innings}, at bats: {atbats}, pitches: {pitches})'.format(
+                    games=games, innings=innings, atbats=atbats, pitches=pitches,
+                )
+            )
+        self.directory = directory
+        self.games = games
+        self.innings = innings
+        self.atbats = atbats
+        self.pitches = pitches
+        self.seed = seed
+        self.rosters = {}
+
+    def generate(self, start, end):
+        """
+        Generate gid directories(a day directory per day)
+        :param start: Start Day(datetime)
+        :param end: End Day(datetime)
+        :return: {'days': days, 'games': games, 'atbats': at bats, 'pitches': pitches}
+        """
+        total = {'days': 0, 'games': 0, 'atbats': 0, 'pitches': 0}
+        for day in range((end - start).days + 1):
+            timestamp = start + timedelta(days=day)
+            total['days'] += 1
+            for count in self.generate_day(timestamp):
+                total['games'] += 1
+                total['atbats'] += count['atbats']
+                total['pitches'] += count['pitches']
+        return total
+
+    def generate_day(self, timestamp):
+        """
+        Generate a game day(teams are paired per day)
+        :param timestamp: day
+        :return: game counts({'atbats': at bats, 'pitches': pitches}) list
+        """
+        params = MlbAm._timestamp_params(timestamp)
+        day_path = os.path.join(self.directory, *MlbAm.PAGE_URL_GAME_DAY.format(**params).split(MlbAm.DELIMITER))
+        os.makedirs(day_path, exist_ok=True)
+        rng = random.Random('{seed}_{day}'.format(seed=self.seed, day=MlbAm._day(timestamp)))
+        teams = list(self.TEAMS)
+        rng.shuffle(teams)
+        pairs = [(teams[i], teams[i + 1]) for i in range(0, len(teams), 2)]
+        counts = []
+        for i in range(self.games):
+            away, home = pairs[i % len(pairs)]
+            gid_path = self.GID_PATH.format(away=away[0], home=home[0], number=i // len(pairs) + 1, **params)
+            counts.append(self.generate_game(os.path.join(day_path, gid_path), timestamp, home, away))
+        return counts
+
+    def generate_game(self, gid_dir, timestamp, home, away):
+        """
+        Generate a gid directory
+        :param gid_dir: gid directory path
+        :param timestamp: day
+        :param home: home team(TEAMS)
+        :param away: away team(TEAMS)
+        :return: {'atbats': at bats, 'pitches': pitches}
+        """
+        rng = random.Random('{seed}_{gid}'.format(seed=self.seed, gid=os.path.basename(gid_dir)))
+        os.makedirs(os.path.join(gid_dir, Inning.DIRECTORY.strip('/')), exist_ok=True)
+        game_pk = str(rng.randint(100000, 999999))
+        rosters = {'home': self._roster(home), 'away': self._roster(away)}
+        starters = {
+            team_type: rosters[team_type]['pitchers'][timestamp.toordinal() % self.ROTATION]
+            for team_type in rosters
+        }
+        relievers = {
+            team_type: rosters[team_type]['pitchers'][self.ROTATION + rng.randrange(self.PITCHERS - self.ROTATION)]
+            for team_type in rosters
+        }
+        umpires = rng.sample(range(427000, 428000), len(self.UMPIRES))
+        simulation = self._simulate(rng, timestamp, rosters, starters, relievers, home, away)
+        inning_dir = Inning.DIRECTORY.strip('/')
+        files = {
+            Game.FILENAME: self._game_xml(rng, game_pk, home, away),
+            Players.FILENAME: self._players_xml(timestamp, rosters, home, away, umpires),
+            BoxScore.FILENAME: self._boxscore_xml(timestamp, game_pk, rosters, simulation['stats'], home, away),
+            '/'.join([inning_dir, Inning.FILENAME_INNING_HIT]): self._element('hitchart', [], simulation['hips']),
+        }
+        for number, inning in enumerate(simulation['innings'], 1):
+            files['{directory}/inning_{number}.xml'.format(directory=inning_dir, number=number)] = inning
+        for filename, xml in files.items():
+            with open(os.path.join(gid_dir, filename), mode='w', encoding='utf-8') as xml_file:
+                xml_file.write(xml)
+        return {'atbats': simulation['atbats'], 'pitches': simulation['pitches']}
+
+    def _roster(self, team):
+        """
+        Team roster(stable player ids & names)
+        :param team: team(TEAMS)
+        :return: {'lineup': players, 'bench': players, 'pitchers': players, 'coaches': coaches}
+        """
+        if team[0] in self.rosters:
+            return self.rosters[team[0]]
+        rng = random.Random('{seed}_{team}'.format(seed=self.seed, team=team[0]))
+        positions = list(self.LINEUP) + list(self.BENCH) + ['P'] * self.PITCHERS
+        players = []
+        for number, position in enumerate(positions, 1):
+            first, last = rng.choice(self.FIRST_NAMES), rng.choice(self.LAST_NAMES)
+            rl = rng.choice(('R', 'R', 'R', 'L'))
+            players.append({
+                'id': str(int(team[2]) * 1000 + number),
+                'first': first,
+                'last': last,
+                'num': str(number),
+                'boxname': '{last}, {initial}'.format(last=last, initial=first[0]),
+                'rl': rl,
+                'bats': rl if position == 'P' else rng.choice(('R', 'R', 'L', 'S')),
+                'position': position,
+                'b_height': '6-{inch}'.format(inch=rng.randint(0, 5)),
+            })
+        lineup = len(self.LINEUP)
+        roster = {
+            'lineup': players[:lineup],
+            'bench': players[lineup:lineup + len(self.BENCH)],
+            'pitchers': players[lineup + len(self.BENCH):],
+            'coaches': [
+                {'position': position, 'first': rng.choice(self.FIRST_NAMES), 'last': rng.choice(self.LAST_NAMES),
+                 'id': str(int(team[2]) * 1000 + 900 + number), 'num': str(50 + number)}
+                for number, position in enumerate(self.COACHES)
+            ],
+        }
+        self.rosters[team[0]] = roster
+        return roster
+
+    def _simulate(self, rng, timestamp, rosters, starters, relievers, home, away):
+        """
+        Play a game(at bats, pitches, runners & pitching change actions)
+        :param rng: Random object
+        :param timestamp: day
+        :param rosters: {'home': roster, 'away': roster}
+        :param starters: starting pitchers(key: team type)
+        :param relievers: relief pitchers(key: team type, from the 2/3 of innings)
+        :param home: home team(TEAMS)
+        :param away: away team(TEAMS)
+        :return: {'innings': inning xml list, 'hips': hip elements, 'stats': player stats,
+                  'atbats': at bats, 'pitches': pitches}
+        """
+        state = {
+            'event_num': 0, 'ab_number': 0, 'pitches': 0, 'runs': {'home': 0, 'away': 0}, 'stats': {},
+            'order': {'home': 0, 'away': 0}, 'clock': timestamp.replace(hour=19, minute=5),
+        }
+        change_inning = self.innings * 2 // 3 + 1
+        innings, hips = [], []
+        for number in range(1, self.innings + 1):
+            halves = []
+            for half, batting, fielding in (('top', 'away', 'home'), ('bottom', 'home', 'away')):
+                pitcher = relievers[fielding] if number >= change_inning > 1 else starters[fielding]
+                children = []
+                if number == change_inning > 1:
+                    state['event_num'] += 1
+                    children.append(self._element('action', [
+                        ('b', 0), ('s', 0), ('o', 0),
+                        ('des', 'Pitching Change: {reliever} replaces {starter}. '.format(
+                            reliever=self._name(pitcher), starter=self._name(starters[fielding]))),
+                        ('event', 'Pitching Substitution'), ('tfs', state['clock'].strftime('%H%M%S')),
+                        ('tfs_zulu', state['clock'].strftime('%Y-%m-%dT%H:%M:%SZ')), ('player', pitcher['id']),
+                        ('pitch', 1), ('event_num', state['event_num']), ('home_team_runs', state['runs']['home']),
+                        ('away_team_runs', state['runs']['away']),
+                    ]))
+                children.extend(self._half_inning(
+                    rng, state, number, 'A' if half == 'top' else 'H', batting, rosters[batting]['lineup'],
+                    rosters[fielding]['lineup'], pitcher, hips,
+                ))
+                halves.append(self._element(half, [], children))
+            innings.append(self._element('inning', [
+                ('num', number), ('away_team', away[0]), ('home_team', home[0]),
+                ('next', 'Y' if number < self.innings else 'N'),
+            ], halves))
+        return {
+            'innings': innings, 'hips': hips, 'stats': state['stats'], 'atbats': state['ab_number'],
+            'pitches': state['pitches'],
+        }
+
+    def _half_inning(self, rng, state, number, team, batting, lineup, defense, pitcher, hips):
+        """
+        Half inning at bats(the last at bat is the third out)
+        :param rng: Random object
+        :param state: game state(event_num, ab_number, runs, stats, batting order, clock)
+        :param number: inning number
+        :param team: hit chart team(A: away, H: home)
+        :param batting: batting team type(home or away)
+        :param lineup: batting lineup
+        :param defense: fielding lineup
+        :param pitcher: pitcher
+        :param hips: hit chart elements(appended)
+        :return: atbat elements
+        """
+        outs_at = set(rng.sample(range(self.atbats - 1), 2)) | {self.atbats - 1}
+        bases, outs, atbats = [None, None, None], 0, []
+        for i in range(self.atbats):
+            batter = lineup[state['order'][batting] % len(lineup)]
+            state['order'][batting] += 1
+            state['ab_number'] += 1
+            out = i in outs_at
+            event, des, result, hip_type = self._event(rng, self.OUT_EVENTS if out else self.ON_BASE_EVENTS)
+            fielder_position = rng.choice(self.LINEUP[:3] + self.LINEUP[4:])
+            fielder = [player for player in defense if player['position'] == fielder_position][0]
+            start_clock = state['clock']
+            pitch_xml, balls, strikes = self._pitches(rng, state, result, out, pitcher)
+            play_guid = str(state['pitch_guid'])
+            if out:
+                outs += 1
+            start = list(bases)
+            runners, bases = self._advance(bases, batter, event) if not out else ([], bases)
+            state['runs'][batting] += len([runner for runner in runners if runner[2] == ''])
+            runner_xml = [
+                self._element('runner', [('id', runner['id']), ('start', base), ('end', base), ('event', event)])
+                for base, runner in zip(self.BASES, start) if runner and out
+            ] + [
+                self._element('runner', [('id', runner_id), ('start', start_base), ('end', end_base), ('event', event)])
+                for runner_id, start_base, end_base in runners
+            ]
+            state['event_num'] += 1
+            atbats.append(self._element('atbat', [
+                ('num', state['ab_number']), ('b', balls), ('s', strikes), ('o', outs),
+                ('start_tfs', start_clock.strftime('%H%M%S')),
+                ('start_tfs_zulu', start_clock.strftime('%Y-%m-%dT%H:%M:%SZ')),
+                ('batter', batter['id']), ('stand', 'L' if batter['bats'] == 'L' else 'R'),
+                ('b_height', batter['b_height']), ('pitcher', pitcher['id']), ('p_throws', pitcher['rl']),
+                ('des', des.format(
+                    batter=self._name(batter), position=self.POSITION_NAMES[fielder_position],
+                    fielder=self._name(fielder),
+                )),
+                ('event_num', state['event_num']), ('event', event), ('play_guid', play_guid),
+                ('home_team_runs', state['runs']['home']), ('away_team_runs', state['runs']['away']),
+            ], pitch_xml + runner_xml))
+            if hip_type:
+                hips.append(self._element('hip', [
+                    ('des', event), ('x', round(rng.uniform(20.0, 230.0), 2)),
+                    ('y', round(rng.uniform(30.0, 210.0), 2)),
+                    ('batter', batter['id']), ('pitcher', pitcher['id']), ('type', hip_type), ('team', team),
+                    ('inning', number),
+                ]))
+            self._count(state, batter, pitcher, event, out)
+        return atbats
+
+    def _event(self, rng, events):
+        """
+        At bat event(weighted, walks & strikeouts need enough pitches)
+        :param rng: Random object
+        :param events: OUT_EVENTS or ON_BASE_EVENTS
+        :return: event, des format, pitch result, hit chart type
+        """
+        candidates = [
+            event for event in events
+            if not (event[2] == 'B' and self.pitches < 4) and not (event[2] == 'S' and self.pitches < 3)
+        ]
+        point = rng.uniform(0, sum([event[4] for event in candidates]))
+        for event in candidates:
+            point -= event[4]
+            if point <= 0:
+                break
+        return event[:4]
+
+    def _pitches(self, rng, state, result, out, pitcher):
+        """
+        At bat pitches(the last pitch is the result: B walk, S strikeout, X in play)
+        :param rng: Random object
+        :param state: game state
+        :param result: at bat result pitch
+        :param out: out(True or False)
+        :param pitcher: pitcher
+        :return: pitch elements, balls, strikes
+        """
+        caps = {'B': 3, 'S': 2}
+        counts = {'B': 0, 'S': 0}
+        sequence = [result] * caps.get(result, 0)
+        for pitch_res in sequence:
+            counts[pitch_res] += 1
+        while len(sequence) < self.pitches - 1:
+            # full count: fouls
+            pitch_res = rng.choice(
+                [pitch_res for pitch_res in ('B', 'S') if counts[pitch_res] < caps[pitch_res]] or ['F']
+            )
+            if pitch_res != 'F':
+                counts[pitch_res] += 1
+            sequence.append(pitch_res)
+        fouls = [pitch_res for pitch_res in sequence if pitch_res == 'F']
+        sequence = [pitch_res for pitch_res in sequence if pitch_res != 'F']
+        rng.shuffle(sequence)
+        sequence += fouls + [result]
+        pitch_types = rng.sample(sorted(self.PITCH_TYPES), 3)
+        pitches = []
+        for pitch_res in sequence:
+            state['event_num'] += 1
+            state['pitches'] += 1
+            state['clock'] += timedelta(seconds=rng.randint(12, 30))
+            state['pitch_guid'] = uuid.UUID(int=rng.getrandbits(128))
+            pitch_type = rng.choice(pitch_types)
+            start_speed = round(self.PITCH_TYPES[pitch_type] + rng.uniform(-2.5, 2.5), 1)
+            if pitch_res == 'B':
+                des = 'Ball'
+            elif pitch_res == 'F':
+                des = 'Foul'
+            elif pitch_res == 'S':
+                des = rng.choice(('Called Strike', 'Swinging Strike', 'Foul'))
+            else:
+                des = 'In play, out(s)' if out else 'In play, no out'
+            pitches.append(self._element('pitch', [
+                ('des', des), ('id', state['event_num']), ('type', 'S' if pitch_res == 'F' else pitch_res),
+                ('tfs', state['clock'].strftime('%H%M%S')),
+                ('tfs_zulu', state['clock'].strftime('%Y-%m-%dT%H:%M:%SZ')),
+                ('x', round(rng.uniform(60.0, 170.0), 2)), ('y', round(rng.uniform(130.0, 220.0), 2)),
+                ('event_num', state['event_num']),
+                ('sv_id', state['clock'].strftime('%y%m%d_%H%M%S')), ('play_guid', str(state['pitch_guid'])),
+                ('start_speed', start_speed), ('end_speed', round(start_speed * 0.92, 1)),
+                ('sz_top', round(rng.uniform(3.2, 3.7), 2)), ('sz_bot', round(rng.uniform(1.5, 1.8), 2)),
+                ('pfx_x', round(rng.uniform(-10.0, 10.0), 2)), ('pfx_z', round(rng.uniform(-6.0, 12.0), 2)),
+                ('px', round(rng.uniform(-1.5, 1.5), 3)), ('pz', round(rng.uniform(0.5, 4.0), 3)),
+                ('x0', round(rng.uniform(-3.0, 3.0), 3)), ('y0', 50.0), ('z0', round(rng.uniform(5.0, 6.5), 3)),
+                ('vx0', round(rng.uniform(-10.0, 10.0), 3)), ('vy0', round(-start_speed * 1.466, 3)),
+                ('vz0', round(rng.uniform(-8.0, 2.0), 3)), ('ax', round(rng.uniform(-20.0, 15.0), 3)),
+                ('ay', round(rng.uniform(20.0, 35.0), 3)), ('az', round(rng.uniform(-40.0, -10.0), 3)),
+                ('break_y', 23.8), ('break_angle', round(rng.uniform(-30.0, 40.0), 1)),
+                ('break_length', round(rng.uniform(3.0, 15.0), 1)), ('pitch_type', pitch_type),
+                ('type_confidence', round(rng.uniform(0.8, 2.0), 3)), ('zone', rng.randint(1, 14)),
+                ('nasty', rng.randint(10, 80)), ('spin_dir', round(rng.uniform(0.0, 360.0), 3)),
+                ('spin_rate', round(rng.uniform(300.0, 2600.0), 3)), ('cc', ''), ('mt', ''),
+            ]))
+        balls = counts['B'] + (1 if result == 'B' else 0)
+        strikes = counts['S'] + (1 if result == 'S' else 0)
+        return pitches, balls, strikes
+
+    def _advance(self, bases, batter, event):
+        """
+        Runners(on base events: forced or advanced, home run: all score)
+        :param bases: runners on 1B, 2B, 3B(player or None)
+        :param batter: batter
+        :param event: at bat event
+        :return: runner list((id, start base, end base('': scored))), bases after the at bat
+        """
+        advance = self.ADVANCE[event]
+        runners, after = [], [None, None, None]
+        if advance == 0:
+            # walk: forced runners only
+            after = list(bases)
+            base = 0
+            runner = batter
+            while base < 3 and runner is not None:
+                runner, after[base] = after[base], runner
+                base += 1
+            for base, player in enumerate(after):
+                if player is not None:
+                    start = '' if player is batter else self.BASES[bases.index(player)]
+                    runners.append((player['id'], start, self.BASES[base]))
+            if runner is not None:
+                runners.append((runner['id'], '3B', ''))
+            return runners, after
+        for base in (2, 1, 0):
+            if bases[base] is None:
+                continue
+            end = base + advance
+            runners.append((bases[base]['id'], self.BASES[base], self.BASES[end] if end < 3 else ''))
+            if end < 3:
+                after[end] = bases[base]
+        end = advance - 1
+        runners.append((batter['id'], '', self.BASES[end] if end < 3 else ''))
+        if end < 3:
+            after[end] = batter
+        return runners, after
+
+    def _count(self, state, batter, pitcher, event, out):
+        """
+        Box score stats
+        :param state: game state
+        :param batter: batter
+        :param pitcher: pitcher
+        :param event: at bat event
+        :param out: out(True or False)
+        """
+        stats = state['stats']
+        bat = stats.setdefault(batter['id'], {'ab': 0, 'h': 0, 'bb': 0, 'so': 0, 'hr': 0})
+        pit = stats.setdefault(pitcher['id'], {'out': 0, 'bf': 0, 'h': 0, 'bb': 0, 'so': 0, 'hr': 0})
+        pit['bf'] += 1
+        if event == 'Walk':
+            bat['bb'] += 1
+            pit['bb'] += 1
+            return
+        bat['ab'] += 1
+        if out:
+            pit['out'] += 1
+            if event == 'Strikeout':
+                bat['so'] += 1
+                pit['so'] += 1
+            return
+        bat['h'] += 1
+        pit['h'] += 1
+        if event == 'Home Run':
+            bat['hr'] += 1
+            pit['hr'] += 1
+
+    def _game_xml(self, rng, game_pk, home, away):
+        """
+        game.xml
+        :param rng: Random object
+        :param game_pk: game pk
+        :param home: home team(TEAMS)
+        :param away: away team(TEAMS)
+        :return: xml(str)
+        """
+        teams = [self._element('team', [
+            ('type', team_type), ('code', team[0]), ('file_code', team[0]), ('abbrev', team[1]), ('id', team[2]),
+            ('name', team[3]), ('name_full', team[4]), ('name_brief', team[5]), ('w', rng.randint(0, 100)),
+            ('l', rng.randint(0, 100)), ('division_id', team[7]), ('league_id', self.LEAGUES[team[6]]),
+            ('league', team[6]),
+        ]) for team_type, team in (('home', home), ('away', away))]
+        stadium = self._element('stadium', [
+            ('id', home[8]), ('name', home[9]), ('venue_w_chan_loc', 'US{code}0001'.format(code=home[1])),
+            ('location', home[10]),
+        ])
+        return self._element('game', [
+            ('type', 'R'), ('local_game_time', '19:05'), ('game_pk', game_pk), ('game_time_et', '07:05 PM'),
+            ('gameday_sw', 'P'),
+        ], teams + [stadium])
+
+    def _players_xml(self, timestamp, rosters, home, away, umpires):
+        """
+        players.xml
+        :param timestamp: day
+        :param rosters: {'home': roster, 'away': roster}
+        :param home: home team(TEAMS)
+        :param away: away team(TEAMS)
+        :param umpires: umpire ids
+        :return: xml(str)
+        """
+        teams = []
+        for team_type, team in (('away', away), ('home', home)):
+            roster = rosters[team_type]
+            players = []
+            for player in roster['lineup'] + roster['bench'] + roster['pitchers']:
+                attrs = [
+                    (name, player[name]) for name in ('id', 'first', 'last', 'num', 'boxname', 'rl', 'bats', 'position')
+                ]
+                if player in roster['lineup']:
+                    attrs.append(('current_position', player['position']))
+                attrs.extend([
+                    ('status', 'A'), ('team_abbrev', team[1]), ('team_id', team[2]), ('parent_team_abbrev', team[1]),
+                    ('parent_team_id', team[2]),
+                ])
+                if player in roster['lineup']:
+                    attrs.extend([
+                        ('bat_order', roster['lineup'].index(player) + 1), ('game_position', player['position']),
+                    ])
+                seed = int(player['id'])
+                attrs.extend([
+                    ('avg', '.{avg:03d}'.format(avg=200 + seed % 120)), ('hr', seed % 31), ('rbi', seed % 97),
+                ])
+                if player['position'] == 'P':
+                    attrs.extend([
+                        ('wins', seed % 15), ('losses', seed % 11),
+                        ('era', '{era:.2f}'.format(era=2.0 + (seed % 300) / 100)),
+                    ])
+                players.append(self._element('player', attrs))
+            coaches = [
+                self._element('coach', [(name, coach[name]) for name in ('position', 'first', 'last', 'id', 'num')])
+                for coach in roster['coaches']
+            ]
+            teams.append(
+                self._element('team', [('type', team_type), ('id', team[1]), ('name', team[4])], players + coaches)
+            )
+        umpire_names = [
+            (self.FIRST_NAMES[umpire_id % len(self.FIRST_NAMES)], self.LAST_NAMES[umpire_id % len(self.LAST_NAMES)])
+            for umpire_id in umpires
+        ]
+        teams.append(self._element('umpires', [], [
+            self._element('umpire', [
+                ('position', position), ('name', '{first} {last}'.format(first=first, last=last)), ('id', umpire_id),
+                ('first', first), ('last', last),
+            ])
+            for position, umpire_id, (first, last) in zip(self.UMPIRES, umpires, umpire_names)
+        ]))
+        return self._element('game', [
+            ('venue', home[9]), ('date', timestamp.strftime('%B %d, %Y').replace(' 0', ' ')),
+        ], teams)
+
+    def _boxscore_xml(self, timestamp, game_pk, rosters, stats, home, away):
+        """
+        boxscore.xml
+        :param timestamp: day
+        :param game_pk: game pk
+        :param rosters: {'home': roster, 'away': roster}
+        :param stats: player stats
+        :param home: home team(TEAMS)
+        :param away: away team(TEAMS)
+        :return: xml(str)
+        """
+        elements = []
+        for team_type in ('home', 'away'):
+            roster = rosters[team_type]
+            batters = [
+                self._element('batter', [
+                    ('id', player['id']), ('name', player['last']), ('pos', player['position']),
+                    ('bo', '{order}00'.format(order=order)),
+                ] + sorted(stats.get(player['id'], {'ab': 0}).items()))
+                for order, player in enumerate(roster['lineup'], 1)
+            ]
+            pitchers = [
+                self._element('pitcher', [
+                    ('id', player['id']), ('name', player['last']), ('pos', 'P'),
+                ] + sorted(stats[player['id']].items()))
+                for player in roster['pitchers'] if player['id'] in stats
+            ]
+            elements.append(self._element('batting', [('team_flag', team_type)], batters))
+            elements.append(self._element('pitching', [('team_flag', team_type)], pitchers))
+        return self._element('boxscore', [
+            ('game_id', '{date}/{away}mlb-{home}mlb-1'.format(
+                date=timestamp.strftime('%Y/%m/%d'), away=away[0], home=home[0])),
+            ('game_pk', game_pk), ('venue_id', home[8]), ('venue_name', home[9]), ('home_id', home[2]),
+            ('away_id', away[2]),
+        ], elements)
+
+    @classmethod
+    def _name(cls, player):
+        """
+        Player name(des)
+        :param player: player
+        :return: first last
+        """
+        return '{first} {last}'.format(first=player['first'], last=player['last'])
+
+    @classmethod
+    def _element(cls, tag, attrs, children=None):
+        """
+        XML element
+        :param tag: tag name
+        :param attrs: (name, value) list
+        :param children: child element list(None: empty element)
+        :return: xml(str)
+        """
+        attributes = ''.join([
+            ' {name}={value}'.format(name=name, value=quoteattr(str(value))) for name, value in attrs
+        ])
+        if children is None:
+            return '<{tag}{attributes}/>'.format(tag=tag, attributes=attributes)
+        return '<{tag}{attributes}>{children}</{tag}>'.format(
+            tag=tag, attributes=attributes, children=''.join(children)
+        )
+
+
+@click.command()
+@click.option('--start', '-s', required=True, help='Start Day(YYYYMMDD)')
+@click.option('--end', '-e', required=True, help='End Day(YYYYMMDD)')
+@click.option('--out', '-o', required=True, help='Corpus directory')
+@click.option('--games', default=15, help='Games per day(default: 15)')
+@click.option('--innings', default=9, help='Innings per game(default: 9)')
+@click.option('--atbats', default=4, help='At bats per half inning(default: 4)')
+@click.option('--pitches', default=4, help='Pitches per at bat(default: 4)')
+@click.option('--seed', default=0, help='Random seed(default: 0)')
+@click.option('--serve', is_flag=True, default=False, help='Serve the corpus(setting.yml mlb.url: printed url)')
+@click.option('--port', default=8080, help='Serve port(default: 8080)')
+def corpus(start, end, out, games, innings, atbats, pitches, seed, serve, port):
+    """
+    Generate a synthetic MLBAM Gameday corpus
+    :param start: Start Day(YYYYMMDD)
+    :param end: End Day(YYYYMMDD)
+    :param out: Corpus directory
+    :param games: Games per day
+    :param innings: Innings per game
+    :param atbats: At bats per half inning
+    :param pitches: Pitches per at bat
+    :param seed: Random seed
+    :param serve: Serve the corpus
+    :param port: Serve port
+    """
+    try:
+        logging.basicConfig(level=logging.INFO)
+        for day in (start, end):
+            MlbAm._validate_datetime(day)
+        MlbAm._validate_datetime_from_to(start, end)
+        days = MlbAm._days(start, end)
+        total = MlbamCorpus(out, games, innings, atbats, pitches, seed).generate(days[0], days[-1])
+        logging.info('-<- Corpus: {days} days, {games} games, {atbats} at bats, {pitches} pitches'.format(**total))
+    except (validators.Invalid, MlbAmBadParameter) as e:
+        raise click.BadParameter(e)
+    if serve:
+        server = MlbamStaticServer(out, port=port)
+        logging.info('->- Serving {url}'.format(url=server.url))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
+if __name__ == '__main__':
+    corpus()
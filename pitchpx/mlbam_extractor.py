@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from collections import namedtuple
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class MlbamField(namedtuple('MlbamField', ('name', 'source', 'data_type', 'unknown'))):
+    """
+    Field spec
+    name: row attribute name
+    source: xml attribute name
+    data_type: Data type(int, float, str, converter function, None: raw value)
+    unknown: attribute key not exists value
+    """
+    __slots__ = ()
+
+    def __new__(cls, name, source=None, data_type=str, unknown=None):
+        """
+        :param name: row attribute name
+        :param source: xml attribute name(default: name)
+        :param data_type: Data type(int, float, str, converter function, None: raw value)
+        :param unknown: attribute key not exists value(default:None)
+        """
+        return super().__new__(cls, name, source or name, data_type, unknown)
+
+
+class MlbamExtractor(object):
+    """
+    Compile field specs to an extractor function(same result as MlbamUtil.get_attribute_stats)
+    """
+    SKIP_VALUES = frozenset(('placeholder', 'None'))
+
+    @classmethod
+    def compile(cls, fields, name='extract'):
+        """
+        Compile field specs
+        :param fields: MlbamField list
+        :param name: function name
+        :return: function(attrs, row), attrs: xml attribute dict, row: object(set attributes)
+        """
+        namespace = {'SKIP_VALUES': cls.SKIP_VALUES}
+        lines = ['def {name}(attrs, row):'.format(name=name), '    get = attrs.get']
+        for i, field in enumerate(fields):
+            if not field.name.isidentifier():
+                raise ValueError('Illegal field name: {name}'.format(name=field.name))
+            data_type, unknown = 'data_type_{i}'.format(i=i), 'unknown_{i}'.format(i=i)
+            namespace[data_type], namespace[unknown] = field.data_type, field.unknown
+            if field.data_type is None:
+                # raw value(MlbamUtil.get_attribute)
+                lines.append('    row.{name} = get({source!r}, {unknown})'.format(
+                    name=field.name, source=field.source, unknown=unknown))
+                continue
+            condition = 'not value or value in SKIP_VALUES'
+            if isinstance(field.unknown, str) and field.data_type is not str:
+                condition = ' '.join([condition, 'or value == {unknown}'.format(unknown=unknown)])
+            # xml attribute values are str(no conversion)
+            value = 'value' if field.data_type is str else '{data_type}(value)'.format(data_type=data_type)
+            lines.append('    value = get({source!r})'.format(source=field.source))
+            lines.append('    row.{name} = {unknown} if {condition} else {value}'.format(
+                name=field.name, unknown=unknown, condition=condition, value=value))
+        source = '\n'.join(lines)
+        exec(compile(source, '<MlbamExtractor.{name}>'.format(name=name), 'exec'), namespace)
+        extract = namespace[name]
+        extract.source = source
+        return extract
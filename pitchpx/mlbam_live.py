@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import re
+import json
+import time
+import logging
+import tempfile
+from collections import OrderedDict
+
+from pitchpx.mlbam_util import MlbamUtil, MlbAmHttpError
+from pitchpx.mlbam_manifest import MlbamManifest
+from pitchpx.mlbam_writer import CsvWriter
+from pitchpx.game.game import Game
+from pitchpx.game.players import Players
+from pitchpx.game.inning import Inning, AtBat, Pitch, InningAction
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class MlbamLive(object):
+    """
+    Live(in-game) polling
+    Innings >= the last seen inning are fetched per poll, rows after the last event_num are appended
+    Unchanged innings(same content hash) are not parsed & the hit chart is not fetched
+    """
+    STATE_FILENAME = 'pitchpx_live.json'
+    FILE_NAMES = OrderedDict([
+        (AtBat.DOWNLOAD_FILE_NAME, 'mlbam_live_atbat_{day}.csv'),
+        (Pitch.DOWNLOAD_FILE_NAME, 'mlbam_live_pitch_{day}.csv'),
+        (InningAction.DOWNLOAD_FILE_NAME, 'mlbam_live_action_{day}.csv'),
+    ])
+    INNING_NUMBER = re.compile(r'inning_(\d+)\.xml')
+    INNING_FINAL = re.compile(r'<inning[^>]*\snext="N"')
+
+    class LiveGame(object):
+        """
+        Polling state(a game)
+        """
+        event_num = -1  # last emitted event_num
+        inning = 1  # last seen inning number
+        final = False
+        game = None
+        players = None
+        digest = None  # hash of the last polled inning contents
+
+        def __init__(self, gid_path, gid_url, state=None):
+            """
+            :param gid_path: game logs directory path
+            :param gid_url: game logs url
+            :param state: saved state(dict)
+            """
+            self.gid_path = gid_path
+            self.gid_url = gid_url
+            if state:
+                self.event_num, self.inning, self.final = state['event_num'], state['inning'], state['final']
+
+        def state(self):
+            """
+            Saved state
+            :return: dict
+            """
+            return {'event_num': self.event_num, 'inning': self.inning, 'final': self.final}
+
+    def __init__(self, mlb, timestamp, interval=30, max_polls=None):
+        """
+        :param mlb: MlbAm object(setting)
+        :param timestamp: game day
+        :param interval: seconds between polls
+        :param max_polls: max polls(None: until all games are final)
+        """
+        self.mlb = mlb
+        self.timestamp = timestamp
+        self.day = mlb._day(timestamp)
+        self.interval = interval
+        self.max_polls = max_polls
+        self.state_path = os.path.join(mlb.output, self.STATE_FILENAME)
+        self.games = OrderedDict()
+
+    def run(self):
+        """
+        Poll until all games are final(or max polls)
+        """
+        MlbamUtil.record_digests(False)
+        state = self._load_state()
+        polls = 0
+        while True:
+            rows = self.poll(state)
+            polls += 1
+            logging.info('->- Live poll {polls}: {atbats} at bats, {pitches} pitches, {actions} actions'.format(
+                polls=polls, atbats=len(rows[AtBat.DOWNLOAD_FILE_NAME]), pitches=len(rows[Pitch.DOWNLOAD_FILE_NAME]),
+                actions=len(rows[InningAction.DOWNLOAD_FILE_NAME]),
+            ))
+            state = None
+            if self.games and all([game.final for game in self.games.values()]):
+                break
+            if self.max_polls and polls >= self.max_polls:
+                break
+            time.sleep(self.interval)
+
+    def poll(self, state=None):
+        """
+        Poll the game day once & append new rows
+        :param state: saved games state(first poll)
+        :return: new rows(key: download file name, value: rows)
+        """
+        rows = OrderedDict([(filename, []) for filename in self.FILE_NAMES])
+        try:
+            games = self._find_games(state or {})
+        except MlbAmHttpError as e:
+            # game day page error: known games only, new games on the next poll
+            logging.warning(e.msg)
+            games = list(self.games.values())
+        for game in games:
+            if game.final:
+                continue
+            try:
+                for filename, datasets in self._poll_game(game).items():
+                    rows[filename].extend(datasets)
+            except MlbAmHttpError as e:
+                logging.warning(e.msg)
+        for filename, datasets in rows.items():
+            if datasets:
+                CsvWriter.append(
+                    os.path.join(self.mlb.output, self.FILE_NAMES[filename].format(day=self.day)),
+                    datasets,
+                    self.mlb.encoding,
+                )
+        self._save_state()
+        return rows
+
+    def _find_games(self, state):
+        """
+        Game day games(new games are added)
+        :param state: saved games state
+        :return: LiveGame list
+        """
+        for timestamp, gid_path, gid_url in self.mlb._find_games(self.timestamp):
+            if gid_path not in self.games:
+                self.games[gid_path] = self.LiveGame(gid_path, gid_url, state.get(gid_path))
+        return list(self.games.values())
+
+    def _poll_game(self, game):
+        """
+        Poll a game(changed innings only)
+        :param game: LiveGame object
+        :return: new rows(key: download file name, value: rows)
+        """
+        if game.game is None:
+            mlb_game = Game.read_xml(
+                game.gid_url, self.mlb.parser, self.timestamp, self.mlb._get_game_number(game.gid_path)
+            )
+            game.players = Players.read_xml(game.gid_url, self.mlb.parser, mlb_game)
+            game.game = mlb_game
+        base_url = "".join([game.gid_url, Inning.DIRECTORY])
+        numbers = sorted([
+            int(self.INNING_NUMBER.search(inning.get_text()).group(1))
+            for inning in MlbamUtil.find_xml_all(base_url, self.mlb.parser, Inning.TAG, Inning.FILENAME_PATTERN)
+        ])
+        numbers = [number for number in numbers if number >= game.inning]
+        if not numbers:
+            return {}
+        contents, digests = [], []
+        for number in numbers:
+            req = MlbamUtil._find_content('/'.join([base_url, 'inning_{number}.xml'.format(number=number)]))
+            contents.append(req.content if self.mlb.parser == MlbamUtil.PARSER_ITERPARSE else req.text)
+            digests.append(MlbamManifest.digest(req.content))
+        game.final = self.INNING_FINAL.search(req.text) is not None
+        digest = MlbamManifest.digest(''.join(digests).encode('utf-8'))
+        if digest == game.digest:
+            return {}
+        game.digest = digest
+        hit_chart = MlbamUtil._find_content('/'.join([base_url, Inning.FILENAME_INNING_HIT])).text
+        innings = Inning.read_contents(
+            hit_chart, contents, self.mlb.parser, game.game, game.players, self.mlb.pitch_layout
+        )
+        rows = self.new_rows(innings, game.event_num)
+        game.inning = numbers[-1]
+        game.event_num = max(
+            [game.event_num] + [row['event_num'] for row in rows[AtBat.DOWNLOAD_FILE_NAME]] +
+            [row['event_num'] for row in rows[InningAction.DOWNLOAD_FILE_NAME]]
+        )
+        return rows
+
+    @classmethod
+    def new_rows(cls, innings, event_num):
+        """
+        Rows after the last event
+        :param innings: MLBAM Inning object
+        :param event_num: last emitted event_num
+        :return: new rows(key: download file name, value: rows)
+        """
+        atbats = [atbat for atbat in innings.atbats if atbat['event_num'] > event_num]
+        ab_numbers = set([atbat['ab_number'] for atbat in atbats])
+        rows = OrderedDict()
+        rows[AtBat.DOWNLOAD_FILE_NAME] = atbats
+        rows[Pitch.DOWNLOAD_FILE_NAME] = [pitch for pitch in innings.pitches if pitch['ab_number'] in ab_numbers]
+        rows[InningAction.DOWNLOAD_FILE_NAME] = [
+            action for action in innings.actions if action['event_num'] > event_num
+        ]
+        return rows
+
+    def _load_state(self):
+        """
+        Saved games state(same game day only)
+        :return: {gid path: state}
+        """
+        try:
+            with open(self.state_path, mode='r', encoding='utf-8') as state_file:
+                state = json.load(state_file)
+        except (OSError, ValueError):
+            return {}
+        if state.get('day') != self.day:
+            return {}
+        return state['games']
+
+    def _save_state(self):
+        """
+        Write games state(atomic)
+        """
+        data = json.dumps(
+            {'day': self.day, 'games': {gid_path: game.state() for gid_path, game in self.games.items()}},
+            indent=1, sort_keys=True,
+        )
+        fd, tmp_path = tempfile.mkstemp(dir=self.mlb.output)
+        with os.fdopen(fd, mode='w', encoding='utf-8') as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_path, self.state_path)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import hashlib
+import tempfile
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class MlbamManifest(object):
+    """
+    Download manifest(completed days & games, written by the main process)
+    """
+    FILENAME = 'pitchpx_manifest.json'
+    VERSION = 1
+    GAME_COMPLETE = 'complete'
+    GAME_NOT_FOUND = 'not_found'
+    GAME_FAILED = 'failed'
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, directory):
+        """
+        :param directory: output directory
+        """
+        self.directory = directory
+        self.path = os.path.join(directory, self.FILENAME)
+        self.days = {}
+        try:
+            with open(self.path, mode='r', encoding='utf-8') as manifest_file:
+                manifest = json.load(manifest_file)
+            if manifest.get('version') == self.VERSION:
+                self.days = manifest['days']
+        except (OSError, ValueError):
+            pass
+
+    @classmethod
+    def digest(cls, content):
+        """
+        Content hash
+        :param content: bytes
+        :return: sha1 hex digest
+        """
+        return hashlib.sha1(content).hexdigest()
+
+    @classmethod
+    def digest_file(cls, path):
+        """
+        File hash
+        :param path: file path
+        :return: sha1 hex digest or None(file not found)
+        """
+        sha1 = hashlib.sha1()
+        try:
+            with open(path, mode='rb') as read_file:
+                for chunk in iter(lambda: read_file.read(cls.CHUNK_SIZE), b''):
+                    sha1.update(chunk)
+        except OSError:
+            return None
+        return sha1.hexdigest()
+
+    def completed(self, day):
+        """
+        Day completed(all games downloaded & output files not changed)
+        :param day: day(YYYYMMDD)
+        :return: True or False
+        """
+        entry = self.days.get(day)
+        if not entry or not entry['complete']:
+            return False
+        for filename, digest in entry['files'].items():
+            if self.digest_file(os.path.join(self.directory, filename)) != digest:
+                return False
+        return True
+
+    def record(self, day, filenames, games):
+        """
+        Record a written day & save
+        :param day: day(YYYYMMDD)
+        :param filenames: output file names
+        :param games: {gid path: {'status': status, 'inputs': {url: sha1}}}
+        """
+        self.days[day] = {
+            'complete': all([game['status'] != self.GAME_FAILED for game in games.values()]),
+            'files': {
+                filename: self.digest_file(os.path.join(self.directory, filename)) for filename in filenames
+            },
+            'games': games,
+        }
+        self.save()
+
+    def save(self):
+        """
+        Write manifest(atomic)
+        """
+        data = json.dumps({'version': self.VERSION, 'days': self.days}, indent=1, sort_keys=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+        with os.fdopen(fd, mode='w', encoding='utf-8') as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+from pitchpx.baseball.base_out_matrix import BaseOutMatrix
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class MlbamMatrix(object):
+    """
+    Season run expectancy, transition & win probability matrices(process-wide, key: season)
+    At bat rows of written games are aggregated by the main process, a npz file per season
+    A game already in the matrix(resume) is not counted again
+    """
+    path = None  # file path format(ex: /output/pitchpx_matrix_{season}.npz)
+    seasons = {}  # key: season value: BaseOutMatrix object
+    updated = set()  # seasons changed since the last save
+
+    _resume = False
+
+    @classmethod
+    def configure(cls, path=None, resume=False):
+        """
+        Matrix setting
+        :param path: file path format(with {season}, None: off)
+        :param resume: Add to the saved matrices(True or False, False: matrices of this run only)
+        """
+        cls.path, cls._resume = path, resume
+        cls.seasons, cls.updated = {}, set()
+
+    @classmethod
+    def update(cls, season, atbats):
+        """
+        Add a game(a game already in the matrix is skipped)
+        :param season: season(year)
+        :param atbats: at bat rows of a game(mlbam_atbat)
+        """
+        if not cls.path or not atbats:
+            return
+        season = str(season)
+        if season not in cls.seasons:
+            path = cls.path.format(season=season)
+            if cls._resume and os.path.exists(path):
+                cls.seasons[season] = BaseOutMatrix.load(path)
+            else:
+                cls.seasons[season] = BaseOutMatrix()
+        if atbats[0]['retro_game_id'] in cls.seasons[season].game_ids:
+            return
+        cls.seasons[season].add_game(atbats)
+        cls.updated.add(season)
+
+    @classmethod
+    def save(cls):
+        """
+        Write npz files(changed seasons only)
+        """
+        for season in sorted(cls.updated):
+            cls.seasons[season].save(cls.path.format(season=season))
+        cls.updated = set()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import tempfile
+from collections import OrderedDict
+import numpy as np
+from pitchpx.game.inning import Pitch
+from pitchpx.mlbam_util import MlbAmBadParameter
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class MlbamPitchStore(object):
+    """
+    PITCHf/x column store(process-wide, a directory per season)
+    Fixed-width little endian column files(PITCHf/x: float32 or float64, id index: int32) & a JSON header
+    The header(rows & games) is the commit point: column data after the header rows is discarded on the next run
+    Readers open a season as numpy.memmap(zero copy)
+    """
+    VERSION = 1
+    HEADER_FILE = 'header.json'
+    COLUMN_FILE = '{name}.bin'
+    # PITCHf/x numeric fields(Pitch.row)
+    COLUMNS = tuple([field.name for field in Pitch.FIELDS if field.data_type is float])
+    # id index: games(header) position, at bat & pitch id(unknown: -1)
+    INDEX_COLUMNS = ('game_index', 'ab_number', 'pitch_id')
+    INDEX_DTYPE = '<i4'
+    DTYPES = {'float32': '<f4', 'float64': '<f8'}
+
+    directory = None
+    dtype = DTYPES['float32']
+    seasons = {}  # key: season value: header(dict)
+    updated = set()  # seasons changed since the last save
+
+    @classmethod
+    def configure(cls, directory=None, dtype='float32'):
+        """
+        Store setting
+        :param directory: store directory(None: off)
+        :param dtype: PITCHf/x column type(float32 or float64)
+        """
+        if dtype not in cls.DTYPES:
+            raise MlbAmBadParameter('Unknown pitch store dtype: {dtype}'.format(dtype=dtype))
+        cls.directory, cls.dtype = directory, cls.DTYPES[dtype]
+        cls.seasons, cls.updated = {}, set()
+
+    @classmethod
+    def append(cls, season, pitches):
+        """
+        Append a game(a game already in the store is skipped)
+        :param season: season(year)
+        :param pitches: pitch rows of a game(mlbam_pitch, wide or normalized layout)
+        """
+        if not cls.directory or not pitches:
+            return
+        season = str(season)
+        header = cls._header(season)
+        retro_game_id = pitches[0]['retro_game_id']
+        if retro_game_id in header['games']:
+            return
+        values = np.array([[pitch[name] for name in cls.COLUMNS] for pitch in pitches], dtype=np.float64)
+        index = np.array([
+            [len(header['games'])] + [-1 if pitch[name] is None else pitch[name] for name in cls.INDEX_COLUMNS[1:]]
+            for pitch in pitches
+        ], dtype=cls.INDEX_DTYPE)
+        season_dir = os.path.join(cls.directory, season)
+        for i, name in enumerate(cls.COLUMNS):
+            cls._write_column(season_dir, name, values[:, i].astype(header['dtype']))
+        for i, name in enumerate(cls.INDEX_COLUMNS):
+            cls._write_column(season_dir, name, index[:, i].copy())
+        header['games'][retro_game_id] = [header['rows'], len(pitches)]
+        header['rows'] += len(pitches)
+        cls.updated.add(season)
+
+    @classmethod
+    def _write_column(cls, season_dir, name, values):
+        """
+        Append column values
+        :param season_dir: season directory
+        :param name: column name
+        :param values: numpy.ndarray
+        """
+        with open(os.path.join(season_dir, cls.COLUMN_FILE.format(name=name)), mode='ab') as column_file:
+            column_file.write(values.tobytes())
+
+    @classmethod
+    def _header(cls, season):
+        """
+        Season header(new season: empty store, column data after the header rows is discarded)
+        :param season: season(str)
+        :return: header(dict)
+        """
+        if season in cls.seasons:
+            return cls.seasons[season]
+        season_dir = os.path.join(cls.directory, season)
+        os.makedirs(season_dir, exist_ok=True)
+        header = cls._read_header(season_dir)
+        if header is None:
+            header = {
+                'version': cls.VERSION,
+                'dtype': cls.dtype,
+                'columns': list(cls.COLUMNS),
+                'rows': 0,
+                'games': OrderedDict(),  # key: retro_game_id value: [start row, rows]
+            }
+        elif header['dtype'] != cls.dtype:
+            raise MlbAmBadParameter('Pitch store {season} dtype: {dtype}'.format(season=season, dtype=header['dtype']))
+        for name in cls.COLUMNS + cls.INDEX_COLUMNS:
+            path = os.path.join(season_dir, cls.COLUMN_FILE.format(name=name))
+            dtype = cls.INDEX_DTYPE if name in cls.INDEX_COLUMNS else header['dtype']
+            with open(path, mode='ab') as column_file:
+                column_file.truncate(header['rows'] * np.dtype(dtype).itemsize)
+        cls.seasons[season] = header
+        return header
+
+    @classmethod
+    def _read_header(cls, season_dir):
+        """
+        Read a season header
+        :param season_dir: season directory
+        :return: header(dict, not exists or other version: None)
+        """
+        try:
+            with open(os.path.join(season_dir, cls.HEADER_FILE), mode='r', encoding='utf-8') as header_file:
+                header = json.load(header_file, object_pairs_hook=OrderedDict)
+        except (OSError, ValueError):
+            return None
+        if header.get('version') != cls.VERSION or header.get('columns') != list(cls.COLUMNS):
+            return None
+        return header
+
+    @classmethod
+    def save(cls):
+        """
+        Write headers(atomic, changed seasons only)
+        """
+        for season in sorted(cls.updated):
+            season_dir = os.path.join(cls.directory, season)
+            fd, tmp_path = tempfile.mkstemp(dir=season_dir)
+            with os.fdopen(fd, mode='w', encoding='utf-8') as tmp_file:
+                json.dump(cls.seasons[season], tmp_file)
+            os.replace(tmp_path, os.path.join(season_dir, cls.HEADER_FILE))
+        cls.updated = set()
+
+    @classmethod
+    def read(cls, directory, season):
+        """
+        Open a season(read only, zero copy)
+        :param directory: store directory
+        :param season: season(year)
+        :return: {
+            'columns': {column name: numpy.memmap},
+            'game_index', 'ab_number', 'pitch_id': id index(numpy.memmap)
+            'games': {retro_game_id: slice(rows of the game)}
+        }
+        """
+        season_dir = os.path.join(directory, str(season))
+        header = cls._read_header(season_dir)
+        if header is None:
+            raise MlbAmBadParameter('Pitch store not found: {season_dir}'.format(season_dir=season_dir))
+        rows = header['rows']
+        store = {name: cls._read_column(season_dir, name, cls.INDEX_DTYPE, rows) for name in cls.INDEX_COLUMNS}
+        store['columns'] = OrderedDict([
+            (name, cls._read_column(season_dir, name, header['dtype'], rows)) for name in cls.COLUMNS
+        ])
+        store['games'] = OrderedDict([
+            (retro_game_id, slice(start, start + count)) for retro_game_id, (start, count) in header['games'].items()
+        ])
+        return store
+
+    @classmethod
+    def _read_column(cls, season_dir, name, dtype, rows):
+        """
+        Open a column file(read only, zero copy)
+        :param season_dir: season directory
+        :param name: column name
+        :param dtype: column type
+        :param rows: rows(header)
+        :return: numpy.memmap(no rows: empty numpy.ndarray)
+        """
+        if rows == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(
+            os.path.join(season_dir, cls.COLUMN_FILE.format(name=name)), dtype=dtype, mode='r', shape=(rows, )
+        )
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import json
+import tempfile
+from collections import OrderedDict
+from pitchpx.game.players import Players
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class MlbamPlayerCache(object):
+    """
+    Player dimension cache(process-wide, key: season & MLBAM player id)
+    Per game roster rows(slim layout) are merged into season player tables
+    """
+    VERSION = 1
+    FIELDS = Players.Player.DIMENSION_FIELDS
+
+    path = None
+    seasons = {}  # key: season value: {player id: dimension values(tuple)}
+    updated = set()  # seasons changed after configure
+
+    _changed = False
+
+    @classmethod
+    def configure(cls, path=None):
+        """
+        Cache setting
+        :param path: cache file path(None: memory only)
+        """
+        cls.path = path
+        cls.seasons, cls.updated, cls._changed = {}, set(), False
+        if not path:
+            return
+        try:
+            with open(path, mode='r', encoding='utf-8') as cache_file:
+                cache = json.load(cache_file)
+        except (OSError, ValueError):
+            return
+        if cache.get('version') != cls.VERSION or cache.get('fields') != list(cls.FIELDS):
+            return
+        for season, players in cache['seasons'].items():
+            cls.seasons[season] = {
+                cls.intern(player_id): tuple([cls.intern(value) for value in values])
+                for player_id, values in players.items()
+            }
+
+    @classmethod
+    def intern(cls, value):
+        """
+        Intern a string(names & handedness are shared by all games)
+        :param value: value
+        :return: interned value(str) or value
+        """
+        if type(value) is str:
+            return sys.intern(value)
+        return value
+
+    @classmethod
+    def update(cls, season, rows):
+        """
+        Merge dimension rows
+        :param season: season(year)
+        :param rows: Players.Player.dimension_row list
+        """
+        season = str(season)
+        players = cls.seasons.setdefault(season, {})
+        for row in rows:
+            values = tuple([cls.intern(row[name]) for name in cls.FIELDS])
+            player_id = values[0]
+            if players.get(player_id) != values:
+                players[player_id] = values
+                cls.updated.add(season)
+                cls._changed = True
+
+    @classmethod
+    def rows(cls, season):
+        """
+        Season player table
+        :param season: season(year)
+        :return: rows(player id order)
+        """
+        players = cls.seasons.get(str(season), {})
+        return [OrderedDict(zip(cls.FIELDS, players[player_id])) for player_id in sorted(players)]
+
+    @classmethod
+    def save(cls):
+        """
+        Write cache file(atomic, changed only)
+        """
+        if not cls.path or not cls._changed:
+            return
+        data = json.dumps(
+            {
+                'version': cls.VERSION,
+                'fields': list(cls.FIELDS),
+                'seasons': {season: {
+                    player_id: list(values) for player_id, values in players.items()
+                } for season, players in cls.seasons.items()},
+            },
+            sort_keys=True,
+        )
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(cls.path)))
+        with os.fdopen(fd, mode='w', encoding='utf-8') as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_path, cls.path)
+        cls._changed = False
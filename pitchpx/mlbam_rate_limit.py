@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import time
+from multiprocessing import Lock, Value
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class MlbamRateLimiter(object):
+    """
+    Token bucket rate limiter(state is shared by Pool workers)
+    """
+    rate = 0.0
+    burst = 1
+
+    _state = None
+
+    @classmethod
+    def create_state(cls, burst=1):
+        """
+        Create shared state(create in the parent process, pass to workers)
+        :param burst: bucket size
+        :return: (lock, tokens, last refill time)
+        """
+        return Lock(), Value('d', burst, lock=False), Value('d', time.monotonic(), lock=False)
+
+    @classmethod
+    def configure(cls, rate=0.0, burst=1, state=None):
+        """
+        Rate limit setting
+        :param rate: requests/sec(0: unlimited)
+        :param burst: bucket size
+        :param state: shared state(default: new state)
+        """
+        cls.rate = rate or 0.0
+        cls.burst = max(burst, 1)
+        cls._state = state or cls.create_state(cls.burst)
+
+    @classmethod
+    def reserve(cls):
+        """
+        Take a token
+        :return: seconds to wait before the request
+        """
+        if not cls.rate:
+            return 0.0
+        lock, tokens, timestamp = cls._state
+        with lock:
+            now = time.monotonic()
+            remain = min(cls.burst, tokens.value + (now - timestamp.value) * cls.rate) - 1
+            tokens.value, timestamp.value = remain, now
+        if remain >= 0:
+            return 0.0
+        return -remain / cls.rate
+
+    @classmethod
+    def acquire(cls):
+        """
+        Take a token(blocking)
+        """
+        wait = cls.reserve()
+        if wait > 0:
+            time.sleep(wait)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import random
+import asyncio
+import requests
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class MlbamRetry(object):
+    """
+    Retry policy(exponential backoff with full jitter)
+    """
+    RETRY_EXCEPTIONS = (requests.ConnectionError, requests.Timeout, asyncio.TimeoutError)
+    # attempt results
+    DONE = 'done'
+    NOT_FOUND = 'not_found'
+    RETRY = 'retry'
+    GIVE_UP = 'give_up'
+
+    max_attempts = 4
+    backoff = 0.5
+    max_backoff = 30.0
+    jitter = True
+    retry_status = (429, 500, 502, 503, 504)
+
+    retries = 0
+    give_ups = 0
+
+    @classmethod
+    def configure(cls, max_attempts=4, backoff=0.5, max_backoff=30.0, jitter=True,
+                  retry_status=(429, 500, 502, 503, 504)):
+        """
+        Retry setting
+        :param max_attempts: max attempts(1: no retry)
+        :param backoff: first backoff(seconds)
+        :param max_backoff: max backoff(seconds)
+        :param jitter: random wait between 0 and backoff(True or False)
+        :param retry_status: retryable http status codes
+        """
+        cls.max_attempts = max(max_attempts, 1)
+        cls.backoff = backoff
+        cls.max_backoff = max_backoff
+        cls.jitter = jitter
+        cls.retry_status = tuple(retry_status)
+
+    @classmethod
+    def is_retryable(cls, status_code):
+        """
+        Retryable status code
+        :param status_code: http status code
+        :return: True or False
+        """
+        return status_code in cls.retry_status
+
+    @classmethod
+    def attempt(cls, url, attempt, status_code=None, error=None):
+        """
+        Classify an attempt(sleep is up to the fetch engine)
+        :param url: contents url
+        :param attempt: attempt(1, 2, ...)
+        :param status_code: http status code(None: error)
+        :param error: retryable exception
+        :return: (result, value)
+        DONE: (DONE, None), RETRY: (RETRY, seconds to wait), NOT_FOUND & GIVE_UP: (result, error message)
+        """
+        if error is None:
+            if status_code in range(200, 300):
+                return cls.DONE, None
+            if not cls.is_retryable(status_code):
+                return cls.NOT_FOUND, 'HTTP Error url: {url} status: {status}'.format(url=url, status=status_code)
+            status = status_code
+        else:
+            status = error.__class__.__name__
+        if attempt < cls.max_attempts:
+            return cls.RETRY, cls.retry(attempt)
+        cls.give_up()
+        return cls.GIVE_UP, 'HTTP Error(give up) url: {url} status: {status} attempts: {attempts}'.format(
+            url=url, status=status, attempts=cls.max_attempts
+        )
+
+    @classmethod
+    def retry(cls, attempt):
+        """
+        Count a retry
+        :param attempt: failed attempt(1, 2, ...)
+        :return: seconds to wait before next attempt
+        """
+        cls.retries += 1
+        wait = min(cls.max_backoff, cls.backoff * (2 ** (attempt - 1)))
+        if cls.jitter:
+            return random.uniform(0, wait)
+        return wait
+
+    @classmethod
+    def give_up(cls):
+        """
+        Count a give up
+        """
+        cls.give_ups += 1
+
+    @classmethod
+    def counters(cls):
+        """
+        Retry counters
+        :return: {'retries': retry count, 'give_ups': give up count}
+        """
+        return {'retries': cls.retries, 'give_ups': cls.give_ups}
+
+    @classmethod
+    def reset_counters(cls):
+        """
+        Reset retry counters
+        """
+        cls.retries, cls.give_ups = 0, 0
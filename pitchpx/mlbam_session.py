@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import requests
+from requests.adapters import HTTPAdapter
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class MlbamSession(object):
+    """
+    Shared HTTP session(one per process)
+    """
+    SCHEMES = ('http://', 'https://')
+
+    pool_connections = 10
+    pool_maxsize = 10
+    pool_block = False
+    keep_alive = True
+    timeout = None
+
+    _session = None
+    _pid = None
+
+    @classmethod
+    def configure(cls, pool_connections=10, pool_maxsize=10, pool_block=False, keep_alive=True, timeout=None):
+        """
+        Session setting(the current session is discarded)
+        :param pool_connections: number of host connection pools to cache
+        :param pool_maxsize: max connections per host
+        :param pool_block: block when pool_maxsize connections per host are in use
+        :param keep_alive: reuse connection(True or False)
+        :param timeout: request timeout(seconds, None: no timeout)
+        """
+        cls.pool_connections = pool_connections
+        cls.pool_maxsize = pool_maxsize
+        cls.pool_block = pool_block
+        cls.keep_alive = keep_alive
+        cls.timeout = timeout
+        cls.close()
+
+    @classmethod
+    def get_session(cls):
+        """
+        Get shared session(created per process)
+        :return: requests.Session object
+        """
+        if cls._session is None or cls._pid != os.getpid():
+            cls._session = cls._create_session()
+            cls._pid = os.getpid()
+        return cls._session
+
+    @classmethod
+    def close(cls):
+        """
+        Close shared session
+        """
+        if cls._session is not None and cls._pid == os.getpid():
+            cls._session.close()
+        cls._session, cls._pid = None, None
+
+    @classmethod
+    def _create_session(cls):
+        """
+        Create session
+        :return: requests.Session object
+        """
+        session = requests.Session()
+        for scheme in cls.SCHEMES:
+            session.mount(
+                scheme,
+                HTTPAdapter(
+                    pool_connections=cls.pool_connections,
+                    pool_maxsize=cls.pool_maxsize,
+                    pool_block=cls.pool_block,
+                )
+            )
+        if not cls.keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
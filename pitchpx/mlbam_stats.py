@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import time
+import tempfile
+from contextlib import contextmanager
+from pitchpx.mlbam_retry import MlbamRetry
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class MlbamStats(object):
+    """
+    Stage timers & counters(process-wide)
+    Workers pop per game deltas, the main process merges them
+    Nested timers are exclusive(ex: rows = game time - fetch - parse)
+    """
+    STAGE_FETCH = 'fetch'
+    STAGE_PARSE = 'parse'
+    STAGE_ROWS = 'rows'
+    STAGE_WRITE = 'write'
+    STAGES = (STAGE_FETCH, STAGE_PARSE, STAGE_ROWS, STAGE_WRITE)
+    PROMETHEUS_PREFIX = 'pitchpx'
+
+    timers = {}  # key: stage value: seconds
+    counters = {}  # key: counter name value: count
+
+    _stack = []  # running timers [stage, nested seconds]
+
+    @classmethod
+    def reset(cls):
+        """
+        Reset timers & counters
+        """
+        cls.timers, cls.counters, cls._stack = {}, {}, []
+        MlbamRetry.reset_counters()
+
+    @classmethod
+    @contextmanager
+    def timer(cls, stage):
+        """
+        Stage timer(nested stages are excluded)
+        :param stage: stage name
+        """
+        start = time.perf_counter()
+        cls._stack.append([stage, 0.0])
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            _, nested = cls._stack.pop()
+            cls.add(stage, elapsed - nested)
+            if cls._stack:
+                cls._stack[-1][1] += elapsed
+
+    @classmethod
+    def add(cls, stage, seconds):
+        """
+        Add stage time(concurrent tasks: asyncio fetch)
+        :param stage: stage name
+        :param seconds: seconds
+        """
+        cls.timers[stage] = cls.timers.get(stage, 0.0) + seconds
+
+    @classmethod
+    def count(cls, name, value=1):
+        """
+        Count up
+        :param name: counter name
+        :param value: count
+        """
+        cls.counters[name] = cls.counters.get(name, 0) + value
+
+    @classmethod
+    def pop(cls):
+        """
+        Pop timers & counters(with retry counters) since the last pop
+        :return: {'timers': {stage: seconds}, 'counters': {name: count}}
+        """
+        for name, value in MlbamRetry.counters().items():
+            if value:
+                cls.count(name, value)
+        MlbamRetry.reset_counters()
+        delta = {'timers': cls.timers, 'counters': cls.counters}
+        cls.timers, cls.counters = {}, {}
+        return delta
+
+    @classmethod
+    def merge(cls, delta):
+        """
+        Merge a delta(worker process)
+        :param delta: MlbamStats.pop result
+        """
+        if not delta:
+            return
+        for stage, seconds in delta['timers'].items():
+            cls.add(stage, seconds)
+        for name, value in delta['counters'].items():
+            cls.count(name, value)
+
+    @classmethod
+    def summary(cls, elapsed):
+        """
+        Structured summary
+        :param elapsed: wall clock seconds
+        :return: dict
+        """
+        cls.merge(cls.pop())
+        games = sum([value for name, value in cls.counters.items() if name.startswith('games_')])
+        return {
+            'elapsed': round(elapsed, 3),
+            'games_per_sec': round(games / elapsed, 3) if elapsed > 0 else 0.0,
+            'stages': {stage: round(seconds, 3) for stage, seconds in sorted(cls.timers.items())},
+            'counters': dict(sorted(cls.counters.items())),
+        }
+
+    @classmethod
+    def prometheus(cls, summary):
+        """
+        Prometheus text exposition format
+        :param summary: MlbamStats.summary result
+        :return: str
+        """
+        lines = [
+            '# TYPE {prefix}_elapsed_seconds gauge'.format(prefix=cls.PROMETHEUS_PREFIX),
+            '{prefix}_elapsed_seconds {value}'.format(prefix=cls.PROMETHEUS_PREFIX, value=summary['elapsed']),
+            '# TYPE {prefix}_stage_seconds_total counter'.format(prefix=cls.PROMETHEUS_PREFIX),
+        ]
+        for stage, seconds in summary['stages'].items():
+            lines.append('{prefix}_stage_seconds_total{{stage="{stage}"}} {value}'.format(
+                prefix=cls.PROMETHEUS_PREFIX, stage=stage, value=seconds))
+        for name, value in summary['counters'].items():
+            lines.append('# TYPE {prefix}_{name}_total counter'.format(prefix=cls.PROMETHEUS_PREFIX, name=name))
+            lines.append('{prefix}_{name}_total {value}'.format(prefix=cls.PROMETHEUS_PREFIX, name=name, value=value))
+        return '\n'.join(lines) + '\n'
+
+    @classmethod
+    def write(cls, path, data):
+        """
+        Write a summary file(atomic)
+        :param path: file path
+        :param data: str
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+        with os.fdopen(fd, mode='w', encoding='utf-8') as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def dumps(cls, summary):
+        """
+        JSON summary
+        :param summary: MlbamStats.summary result
+        :return: str
+        """
+        return json.dumps(summary, indent=1, sort_keys=True)
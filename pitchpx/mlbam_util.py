@@ -2,30 +2,120 @@
 # -*- coding: utf-8 -*-
 
 import re
+import time
 from bs4 import BeautifulSoup
-import requests
+from pitchpx.mlbam_session import MlbamSession
+from pitchpx.mlbam_cache import MlbamCache
+from pitchpx.mlbam_rate_limit import MlbamRateLimiter
+from pitchpx.mlbam_retry import MlbamRetry
+from pitchpx.mlbam_manifest import MlbamManifest
+from pitchpx.mlbam_stats import MlbamStats
 
 __author__ = 'Shinichi Nakagawa'
 
 
 class MlbamUtil(object):
 
+    PARSER_ITERPARSE = 'iterparse'
+    PARSER_ITERPARSE_FEATURES = 'lxml'
+
     HTTP_HEADERS = {
         'User-Agent': ('Mozilla/5.0 (Macintosh; Intel Mac OS X 10_11_4) '
                        'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/50.0.2661.86 Safari/537.36'),
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
     }
 
+    # input xml hashes(key: url, None: not recorded)
+    digests = None
+
+    @classmethod
+    def record_digests(cls, enabled=True):
+        """
+        Record input xml hashes
+        :param enabled: True or False
+        """
+        cls.digests = {} if enabled else None
+
+    @classmethod
+    def pop_digests(cls, prefix):
+        """
+        Pop recorded input xml hashes
+        :param prefix: url prefix(ex: gid url)
+        :return: {url: sha1}
+        """
+        if cls.digests is None:
+            return {}
+        urls = [url for url in cls.digests if url.startswith(prefix)]
+        return {url: cls.digests.pop(url) for url in urls}
+
     @classmethod
     def _get_content(cls, url, headers=HTTP_HEADERS):
         """
         Get http content
         :param url: contents url
         :param headers: http header
-        :return: BeautifulSoup object
+        :return: requests.Response object
+        """
+        cached = None
+        if MlbamCache.enabled():
+            cached = MlbamCache.get(url)
+            if MlbamCache.use_cached(cached):
+                MlbamStats.count('cache_hits')
+                return cached
+            if MlbamCache.offline:
+                raise MlbAmCacheMiss('Cache miss url: {url}'.format(url=url))
+        MlbamRateLimiter.acquire()
+        with MlbamStats.timer(MlbamStats.STAGE_FETCH):
+            req = MlbamSession.get_session().get(
+                url, headers=MlbamCache.conditional_headers(cached, headers), timeout=MlbamSession.timeout
+            )
+        MlbamStats.count('http_requests')
+        MlbamStats.count('http_bytes', len(req.content))
+        if cached is not None and req.status_code == MlbamCache.NOT_MODIFIED:
+            MlbamStats.count('not_modified')
+            return MlbamCache.not_modified(url, cached, req)
+        if MlbamCache.enabled() and req.status_code in range(200, 300):
+            MlbamCache.put(url, req)
+        return req
+
+    @classmethod
+    def _find_content(cls, url):
+        """
+        find content(2xx only)
+        :param url: contents url
+        :return: requests.Response object
+        """
+        for attempt in range(1, MlbamRetry.max_attempts + 1):
+            try:
+                req, error = cls._get_content(url), None
+            except MlbamRetry.RETRY_EXCEPTIONS as e:
+                req, error = None, e
+            req, wait = cls._attempt(url, attempt, req, error, cls.digests)
+            if req is not None:
+                return req
+            time.sleep(wait)
+
+    @classmethod
+    def _attempt(cls, url, attempt, req, error, digests=None):
         """
-        session = requests.Session()
-        return session.get(url, headers=headers)
+        Attempt result(shared by the fetch engines)
+        :param url: contents url
+        :param attempt: attempt(1, 2, ...)
+        :param req: requests.Response object(None: error)
+        :param error: retryable exception
+        :param digests: input xml hashes(dict, None: not recorded)
+        :return: (requests.Response object, 0) or (None, seconds to wait), MlbAmHttpNotFound or MlbAmHttpError
+        """
+        result, value = MlbamRetry.attempt(url, attempt, None if req is None else req.status_code, error)
+        if result == MlbamRetry.DONE:
+            if digests is not None:
+                digests[url] = MlbamManifest.digest(req.content)
+            return req, 0
+        elif result == MlbamRetry.NOT_FOUND:
+            raise MlbAmHttpNotFound(value)
+        elif result == MlbamRetry.GIVE_UP:
+            raise MlbAmHttpError(value)
+        return None, value
 
     @classmethod
     def find_xml(cls, url, features):
@@ -36,11 +126,40 @@ class MlbamUtil(object):
         :param headers: http header
         :return: BeautifulSoup object
         """
-        req = cls._get_content(url)
-        if req.status_code in range(200, 300):
-            return BeautifulSoup(req.text, features)
-        else:
-            raise MlbAmHttpNotFound('HTTP Error url: {url} status: {status}'.format(url=url, status=req.status_code))
+        req = cls._find_content(url)
+        return cls.read_xml(req.text, features)
+
+    @classmethod
+    def read_xml(cls, markup, features):
+        """
+        read xml
+        :param markup: xml(str)
+        :param features: markup provider
+        :return: BeautifulSoup object
+        """
+        MlbamStats.count('files_parsed')
+        with MlbamStats.timer(MlbamStats.STAGE_PARSE):
+            return BeautifulSoup(markup, cls.soup_features(features))
+
+    @classmethod
+    def find_raw(cls, url):
+        """
+        find raw xml
+        :param url: contents url
+        :return: xml(bytes)
+        """
+        return cls._find_content(url).content
+
+    @classmethod
+    def soup_features(cls, features):
+        """
+        BeautifulSoup markup provider
+        :param features: markup provider(setting.yml config.xml_parser)
+        :return: BeautifulSoup features
+        """
+        if features == cls.PARSER_ITERPARSE:
+            return cls.PARSER_ITERPARSE_FEATURES
+        return features
 
     @classmethod
     def find_xml_all(cls, url, markup, tag, pattern):
@@ -87,6 +206,56 @@ class MlbamUtil(object):
         return unknown
 
 
+class MlbamElement(object):
+    """
+    lxml element wrapper(BeautifulSoup like interface)
+    """
+
+    def __init__(self, element):
+        """
+        :param element: lxml element
+        """
+        self.element = element
+        self.name = element.tag
+        self.attrs = element.attrib
+
+    def get(self, key, default=None):
+        """
+        Get attribute
+        :param key: attribute key
+        :param default: attribute key not exists value(default:None)
+        :return: attribute value
+        """
+        return self.attrs.get(key, default)
+
+    def __getitem__(self, key):
+        return self.attrs[key]
+
+    def find_all(self, name, **attrs):
+        """
+        find descendant elements
+        :param name: tag name
+        :param attrs: attribute filter
+        :return: MlbamElement list
+        """
+        return [
+            MlbamElement(element) for element in self.element.iterdescendants(name)
+            if all([element.get(key) == value for key, value in attrs.items()])
+        ]
+
+    def find(self, name, **attrs):
+        """
+        find first descendant element
+        :param name: tag name
+        :param attrs: attribute filter
+        :return: MlbamElement object or None
+        """
+        for element in self.element.iterdescendants(name):
+            if all([element.get(key) == value for key, value in attrs.items()]):
+                return MlbamElement(element)
+        return None
+
+
 class MlbamConst(object):
 
     UNKNOWN_FULL = 'Unknown'
@@ -106,5 +275,13 @@ class MlbAmBadParameter(MlbAmException):
     pass
 
 
-class MlbAmHttpNotFound(MlbAmException):
+class MlbAmHttpError(MlbAmException):
+    pass
+
+
+class MlbAmHttpNotFound(MlbAmHttpError):
+    pass
+
+
+class MlbAmCacheMiss(MlbAmHttpNotFound):
     pass
@@ -0,0 +1,347 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import abc
+import csv
+from pitchpx.mlbam_util import MlbAmBadParameter, MlbamConst
+from pitchpx.game.game import Game
+from pitchpx.game.players import Players
+from pitchpx.game.inning import AtBat, Pitch, InningAction
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class MlbamWriter(abc.ABC):
+    """
+    Output sink(selected by config.extension)
+    Incremental: open -> write_rows(per game) -> close(atomic rename)
+    """
+    EXTENSION = None
+    TMP_SUFFIX = '.tmp'
+
+    def __init__(self, path, encoding):
+        """
+        :param path: file path
+        :param encoding: file encoding
+        """
+        self.path = path
+        self.tmp_path = ''.join([path, self.TMP_SUFFIX])
+        self.encoding = encoding
+
+    @classmethod
+    def get_writer(cls, extension):
+        """
+        Output sink class
+        :param extension: file extension(csv, parquet, arrow)
+        :return: MlbamWriter subclass
+        """
+        for writer in (CsvWriter, ParquetWriter, ArrowWriter):
+            if writer.EXTENSION == extension:
+                writer.check()
+                return writer
+        raise MlbAmBadParameter('Unknown extension: {extension}'.format(extension=extension))
+
+    @classmethod
+    def check(cls):
+        """
+        Check dependencies
+        :return: None or MlbAmBadParameter
+        """
+        pass
+
+    @classmethod
+    def write(cls, path, datasets, encoding):
+        """
+        Write datasets(at once)
+        :param path: file path
+        :param datasets: rows(dict list)
+        :param encoding: file encoding
+        """
+        writer = cls(path, encoding)
+        writer.open()
+        try:
+            writer.write_rows(datasets)
+        except Exception:
+            writer.abort()
+            raise
+        writer.close()
+
+    @abc.abstractmethod
+    def open(self):
+        """
+        Open temporary file
+        """
+        pass
+
+    @abc.abstractmethod
+    def write_rows(self, datasets):
+        """
+        Append rows
+        :param datasets: rows(dict list)
+        """
+        pass
+
+    @abc.abstractmethod
+    def _close(self):
+        """
+        Flush & close temporary file
+        """
+        pass
+
+    def close(self):
+        """
+        Flush & rename temporary file to the file path
+        """
+        self._close()
+        os.replace(self.tmp_path, self.path)
+
+    def abort(self):
+        """
+        Discard temporary file(the file path is not changed)
+        """
+        try:
+            self._close()
+        finally:
+            if os.path.exists(self.tmp_path):
+                os.remove(self.tmp_path)
+
+
+class CsvWriter(MlbamWriter):
+    """
+    CSV(all values as text)
+    """
+    EXTENSION = 'csv'
+
+    @classmethod
+    def append(cls, path, datasets, encoding):
+        """
+        Append rows to an append-only file(header: new file only)
+        :param path: file path
+        :param datasets: rows(dict list)
+        :param encoding: file encoding
+        """
+        with open(path, mode='a', encoding=encoding) as append_file:
+            writer = csv.writer(append_file, delimiter=',')
+            header = append_file.tell() > 0
+            for row in datasets:
+                if not header:
+                    writer.writerow(list(row.keys()))
+                    header = True
+                writer.writerow(list(row.values()))
+
+    def open(self):
+        """
+        Open temporary file
+        """
+        self.file = open(self.tmp_path, mode='w', encoding=self.encoding)
+        self.writer = csv.writer(self.file, delimiter=',')
+        self.header = False
+
+    def write_rows(self, datasets):
+        """
+        Append rows
+        :param datasets: rows(dict list)
+        """
+        for row in datasets:
+            if not self.header:
+                self.writer.writerow(list(row.keys()))
+                self.header = True
+            self.writer.writerow(list(row.values()))
+
+    def _close(self):
+        """
+        Flush & close temporary file
+        """
+        self.file.close()
+
+
+class ParquetWriter(MlbamWriter):
+    """
+    Parquet(typed columns, needs pyarrow)
+    Column types are fixed per column name(field specs), the same for every day & row group
+    """
+    EXTENSION = 'parquet'
+    ROW_GROUP_SIZE = 10000
+
+    # PITCHf/x & hit location
+    FLOAT_COLUMNS = frozenset((
+        'x', 'y', 'start_speed', 'end_speed', 'sz_top', 'sz_bot', 'pfx_x', 'pfx_z', 'px', 'pz',
+        'x0', 'y0', 'z0', 'vx0', 'vy0', 'vz0', 'ax', 'ay', 'az', 'break_y', 'break_angle', 'break_length',
+        'type_confidence', 'zone', 'spin_dir', 'spin_rate', 'hit_x', 'hit_y',
+    ))
+    # computed columns(not in the field specs)
+    INT_COLUMNS = frozenset((
+        'year', 'month', 'day', 'inning_number', 'bat_home_id', 'home_id', 'outs_ct', 'event_cd', 'pa_event_cd',
+        'ball_ct', 'strike_ct', 'pa_ball_ct', 'pa_strike_ct', 'start_base_out_state', 'end_base_out_state',
+    ))
+    # field specs(data type: int or float, others: string)
+    FIELDS = (
+        Game.FIELDS + Game.STADIUM_FIELDS + Players.Player.FIELDS + AtBat.FIELDS + Pitch.FIELDS + InningAction.FIELDS
+    )
+    # repeated strings(dictionary encoded)
+    DICTIONARY_COLUMNS = frozenset((
+        'st_fl', 'regseason_fl', 'playoff_fl', 'game_type', 'game_type_des',
+        'home_team_id', 'away_team_id', 'home_team_lg', 'away_team_lg', 'interleague_fl',
+        'park_id', 'park_name', 'park_location', 'pit_hand_cd', 'bat_hand_cd', 'start_bases', 'end_bases',
+        'event_tx', 'pa_terminal_fl', 'pitch_res', 'pitch_type',
+    ))
+    # unknown values(null in int & float columns)
+    UNKNOWN_VALUES = frozenset((MlbamConst.UNKNOWN_FULL, MlbamConst.UNKNOWN_SHORT))
+
+    _types = None  # key: column name value: pyarrow.DataType
+
+    @classmethod
+    def check(cls):
+        """
+        Check dependencies
+        :return: None or MlbAmBadParameter
+        """
+        if pyarrow is None:
+            raise MlbAmBadParameter('{extension} output needs pyarrow(pip install pitchpx[parquet])'.format(
+                extension=cls.EXTENSION))
+
+    @classmethod
+    def column_type(cls, name):
+        """
+        Column type
+        :param name: column name
+        :return: pyarrow.DataType(not in the field specs: string)
+        """
+        if cls._types is None:
+            data_types = {}
+            for field in cls.FIELDS:
+                # stats converter: column type as data_type attribute
+                data_types[field.name] = getattr(field.data_type, 'data_type', field.data_type)
+            data_types.update({name: int for name in cls.INT_COLUMNS})
+            data_types.update({name: float for name in cls.FLOAT_COLUMNS})
+            ParquetWriter._types = {
+                name: {int: pyarrow.int64(), float: pyarrow.float64()}[data_type]
+                for name, data_type in data_types.items() if data_type in (int, float)
+            }
+        if name in cls._types:
+            return cls._types[name]
+        if name in cls.DICTIONARY_COLUMNS:
+            return pyarrow.dictionary(pyarrow.int32(), pyarrow.string())
+        return pyarrow.string()
+
+    @classmethod
+    def schema(cls, names):
+        """
+        Table schema
+        :param names: column names
+        :return: pyarrow.Schema
+        """
+        return pyarrow.schema([pyarrow.field(name, cls.column_type(name)) for name in names])
+
+    @classmethod
+    def _array(cls, values, value_type):
+        """
+        Column array
+        :param values: column values
+        :param value_type: column type
+        :return: pyarrow.Array
+        """
+        if pyarrow.types.is_dictionary(value_type):
+            return cls._array(values, value_type.value_type).dictionary_encode()
+        if pyarrow.types.is_string(value_type):
+            return pyarrow.array(
+                [value if value is None or type(value) is str else str(value) for value in values], type=value_type
+            )
+        return pyarrow.array([None if value in cls.UNKNOWN_VALUES else value for value in values], type=value_type)
+
+    @classmethod
+    def table(cls, datasets, schema=None):
+        """
+        Rows to table
+        :param datasets: rows(dict list)
+        :param schema: table schema(None: column names of the first row)
+        :return: pyarrow.Table
+        """
+        if schema is None:
+            if not datasets:
+                return pyarrow.table({})
+            schema = cls.schema(list(datasets[0].keys()))
+        return pyarrow.Table.from_arrays(
+            [cls._array([row[field.name] for row in datasets], field.type) for field in schema], schema=schema
+        )
+
+    def open(self):
+        """
+        Open temporary file(opened at the first row group)
+        """
+        self.rows, self.schema, self.sink = [], None, None
+
+    def write_rows(self, datasets):
+        """
+        Append rows(written per row group)
+        :param datasets: rows(dict list)
+        """
+        self.rows.extend(datasets)
+        if len(self.rows) >= self.ROW_GROUP_SIZE:
+            self._flush()
+
+    def _flush(self):
+        """
+        Write buffered rows
+        """
+        table = self.table(self.rows, self.schema)
+        if self.sink is None:
+            self.schema = table.schema
+            self.sink = self._open_sink(table.schema)
+        self.sink.write_table(table)
+        self.rows = []
+
+    def _open_sink(self, schema):
+        """
+        Open file writer
+        :param schema: table schema
+        :return: pyarrow.parquet.ParquetWriter
+        """
+        return pyarrow.parquet.ParquetWriter(self.tmp_path, schema)
+
+    def _close(self):
+        """
+        Flush & close temporary file
+        """
+        if self.rows or self.sink is None:
+            self._flush()
+        self.sink.close()
+
+    def abort(self):
+        """
+        Discard temporary file(the file path is not changed)
+        """
+        self.rows = []
+        if self.sink is not None:
+            super(ParquetWriter, self).abort()
+
+
+class ArrowWriter(ParquetWriter):
+    """
+    Arrow IPC file(typed columns, needs pyarrow)
+    """
+    EXTENSION = 'arrow'
+
+    def _open_sink(self, schema):
+        """
+        Open file writer
+        :param schema: table schema
+        :return: pyarrow.ipc.RecordBatchFileWriter
+        """
+        self.file = pyarrow.OSFile(self.tmp_path, 'wb')
+        return pyarrow.ipc.new_file(self.file, schema)
+
+    def _close(self):
+        """
+        Flush & close temporary file
+        """
+        super(ArrowWriter, self)._close()
+        self.file.close()
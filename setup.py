@@ -42,9 +42,14 @@ setup(
         'click',
         'FormEncode',
         'lxml',
+        'numpy',
         'PyYAML',
         'requests',
     ],
+    extras_require={
+        'asyncio': ['aiohttp'],
+        'parquet': ['pyarrow'],
+    },
     entry_points="""
         [console_scripts]
         pitchpx = pitchpx:main
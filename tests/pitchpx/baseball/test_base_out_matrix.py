@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import os
+import math
+import tempfile
+from unittest import TestCase, main
+from pitchpx.baseball.base_out_matrix import BaseOutMatrix
+
+__author__ = 'Shinichi Nakagawa'
+
+
+def atbat(ab_number, inning_number, bat_home_id, start_base_out_state, end_base_out_state, away, home):
+    """
+    at bat row(matrix fields)
+    """
+    return {
+        'retro_game_id': 'SEA201508120', 'ab_number': ab_number, 'inning_number': inning_number,
+        'bat_home_id': bat_home_id, 'start_base_out_state': start_base_out_state,
+        'end_base_out_state': end_base_out_state, 'away_team_runs': away, 'home_team_runs': home,
+    }
+
+
+class TestBaseOutMatrix(TestCase):
+    """
+    Base-out Matrix Class Test
+    """
+    # top: single, strikeout(runner on 1B stays), two run home run, two outs
+    # bottom: out, home run(game over, one out)
+    GAME = [
+        atbat(1, 1, 0, 0, 1, 0, 0),
+        atbat(2, 1, 0, 1, 9, 0, 0),
+        atbat(3, 1, 0, 9, 8, 2, 0),
+        atbat(4, 1, 0, 8, 16, 2, 0),
+        atbat(5, 1, 0, 16, 24, 2, 0),
+        atbat(6, 1, 1, 0, 8, 2, 0),
+        atbat(7, 1, 1, 8, 8, 2, 1),
+    ]
+
+    def test_add_game(self):
+        """
+        RE24(three out innings only), transitions & win probability
+        """
+        matrix = BaseOutMatrix()
+        matrix.add_game(list(reversed(self.GAME)))
+        matrix.add_game([])
+        self.assertEqual(matrix.games, 1)
+        self.assertEqual(matrix.re_count.tolist(), [1, 1] + [0] * 6 + [1, 1] + [0] * 6 + [1] + [0] * 7)
+        self.assertEqual(matrix.re_runs[[0, 1, 8, 9, 16]].tolist(), [2, 2, 0, 2, 0])
+        expectancy = matrix.run_expectancy()
+        self.assertEqual(expectancy[0], 2.0)
+        self.assertTrue(math.isnan(expectancy[2]))
+        # runner on 1B carried(ab 2: 0 out 1B -> 1 out 1B)
+        self.assertEqual(matrix.transition_count[1, 9], 1)
+        self.assertEqual(matrix.transition_runs[9, 8], 2)
+        self.assertEqual(matrix.transition_runs[8, 8], 1)
+        self.assertEqual(matrix.transition_count.sum(), 7)
+        self.assertEqual(matrix.transition_probability()[8].tolist()[8:17:8], [0.5, 0.5])
+        # away team wins: inning x bat_home_id x state x run differential(+10)
+        self.assertEqual(matrix.wp_count.sum(), 7)
+        self.assertEqual(matrix.wp_wins.sum(), 5)
+        self.assertEqual(matrix.wp_wins[0, 0, 8, 12], 1)
+        self.assertEqual(matrix.wp_count[0, 1, 8, 8], 1)
+        self.assertEqual(matrix.win_probability()[0, 1, 8, 8], 0.0)
+
+    def test_merge_save(self):
+        """
+        merge & npz file
+        """
+        matrix = BaseOutMatrix()
+        matrix.add_game(self.GAME)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'pitchpx_matrix_2015.npz')
+            matrix.save(path)
+            loaded = BaseOutMatrix.load(path)
+        for name, _ in BaseOutMatrix.ARRAYS:
+            self.assertEqual(getattr(loaded, name).tolist(), getattr(matrix, name).tolist())
+        self.assertEqual(loaded.game_ids, {'SEA201508120'})
+        loaded.merge(matrix)
+        self.assertEqual(loaded.games, 2)
+        self.assertEqual(loaded.re_runs[0], 4)
+        self.assertEqual(loaded.run_expectancy()[0], 2.0)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import random
 from unittest import TestCase, main
 from pitchpx.baseball.retrosheet import RetroSheet
 
@@ -291,6 +292,82 @@ class TestRetroSheet(TestCase):
         self.assertEqual(RetroSheet.battedball_cd(0, 'bar', 'hoge picks off'), '')
         self.assertEqual(RetroSheet.battedball_cd(0, 'Runner Out', 'hoge fuga'), '')
 
+    def test_classify(self):
+        """
+        Event code & Battedball code(batch)
+        """
+        event_txs = [
+            'Flyout', 'Forceout', 'Forceout', 'Strikeout', 'Single', 'Home Run', 'Runner Out', 'Runner Out',
+            'hoge interference', 'fuga Error', 'bar', 'Single',
+        ]
+        ab_descs = [
+            'hoge fly out', 'hoge force out grounds', 'hoge force out', 'hoge strike out', 'hoge on a line drive',
+            'hoge fly ball', 'hoge caught stealing', 'hoge picks off', 'hoge interference', 'fuga error',
+            'hoge', 'hoge Ground ball',
+        ]
+        event_cds, battedball_cds = RetroSheet.classify(event_txs, ab_descs)
+        self.assertEqual(event_cds, [2, 2, 2, 3, 20, 23, 6, 8, 17, 18, 0, 20])
+        self.assertEqual(battedball_cds, ['F', 'G', '', '', 'L', 'F', '', '', '', '', '', 'G'])
+        for event_tx, ab_des, event_cd, battedball_cd in zip(event_txs, ab_descs, event_cds, battedball_cds):
+            self.assertEqual(RetroSheet.event_cd(event_tx, ab_des), event_cd)
+            self.assertEqual(RetroSheet.battedball_cd(event_cd, event_tx, ab_des), battedball_cd)
+        self.assertEqual(RetroSheet.classify([], []), ([], []))
+
+    def test_base_out_state(self):
+        """
+        Base-out state
+        """
+        self.assertEqual(RetroSheet.base_out_state(0, 0), 0)
+        self.assertEqual(RetroSheet.base_out_state(1, 2), 10)
+        self.assertEqual(RetroSheet.base_out_state(2, 7), 23)
+        self.assertEqual(RetroSheet.base_out_state(3, 1), 24)
+
+    def test_carry_bases(self):
+        """
+        occupied bases(runner elements: moving runners only)
+        """
+        # runner on 1B stays, batter out
+        self.assertEqual(RetroSheet.carry_bases(1, 0, 0), (1, 1))
+        # runner on 1B to 3B, batter to 1B, runner on 2B stays
+        self.assertEqual(RetroSheet.carry_bases(3, 1, 5), (3, 7))
+        # runner on 2B scores
+        self.assertEqual(RetroSheet.carry_bases(2, 2, 0), (2, 0))
+        self.assertEqual(RetroSheet.BASES[5], '1_3')
+
+    def test_count_states(self):
+        """
+        Ball/Strike count & PA terminal(batch)
+        """
+        pitch_res = ['B', 'F', 'F', 'F', 'S', 'B', 'B', 'B', 'B', 'C', 'X', 'B', 'S', 'S', 'F', 'C', 'F']
+        ab_ids = [1, 1, 1, 1, 1, 2, 2, 2, 2, 3, 3, 4, 4, 4, 4, 4, 4]
+        event_cds = [3, 3, 3, 3, 3, 14, 14, 14, 14, 20, 20, 3, 3, 3, 3, 3, 3]
+        ball_ct, strike_ct, terminal = RetroSheet.count_states(pitch_res, ab_ids, event_cds)
+        self.assertEqual(ball_ct.tolist(), [0, 1, 1, 1, 1, 0, 1, 2, 3, 0, 0, 0, 1, 1, 1, 1, 1])
+        self.assertEqual(strike_ct.tolist(), [0, 0, 1, 2, 2, 0, 0, 0, 0, 0, 1, 0, 0, 1, 2, 2, 3])
+        self.assertEqual(terminal.tolist(), [
+            False, False, False, False, True, False, False, False, True, False, True,
+            False, False, False, False, True, False,
+        ])
+        # same as the scalar functions(random pitches)
+        rand = random.Random(0)
+        pitch_res, ab_ids, event_cds = [], [], []
+        for ab_id in range(500):
+            event_cd = rand.choice((2, 3, 14, 15, 20))
+            for _ in range(rand.randint(1, 12)):
+                pitch_res.append(rand.choice(('B', 'S', 'C', 'F', 'X', 'H', '')))
+                ab_ids.append(ab_id)
+                event_cds.append(event_cd)
+        ball_ct, strike_ct, terminal = RetroSheet.count_states(pitch_res, ab_ids, event_cds)
+        b, s = 0, 0
+        for i, (res, event_cd) in enumerate(zip(pitch_res, event_cds)):
+            if i > 0 and ab_ids[i] != ab_ids[i - 1]:
+                b, s = 0, 0
+            self.assertEqual((ball_ct[i], strike_ct[i]), (b, s))
+            self.assertEqual(terminal[i], RetroSheet.is_pa_terminal(b, s, res, event_cd))
+            b, s = RetroSheet.ball_count(b, s, res)
+        self.assertEqual([len(a) for a in RetroSheet.count_states([], [], [])], [0, 0, 0])
+        self.assertRaises(ValueError, RetroSheet.count_states, ['B'], [1, 1], [3])
+
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -186,43 +186,47 @@ class TestGame(TestCase):
         """
         Team attributes Data
         """
-        self.assertEqual(Game._get_team_attribute(self.game, 'home', 'code'), 'sea')
-        self.assertEqual(Game._get_team_attribute(self.game, 'away', 'code'), 'bal')
-        self.assertEqual(Game._get_team_attribute(self.game, 'home', 'league'), 'AL')
-        self.assertEqual(Game._get_team_attribute(self.game, 'away', 'league'), 'AL')
-        self.assertEqual(Game._get_team_attribute(self.game, 'home', 'name'), 'Seattle')
-        self.assertEqual(Game._get_team_attribute(self.game, 'away', 'name'), 'Baltimore')
-        self.assertEqual(Game._get_team_attribute(self.game, 'home', 'name_full'), 'Seattle Mariners')
-        self.assertEqual(Game._get_team_attribute(self.game, 'away', 'name_full'), 'Baltimore Orioles')
+        game = Game._generate_game_object(self.game, dt.strptime('2015-08-12', '%Y-%m-%d'), 1)
+        self.assertEqual(game.home_team_id, 'sea')
+        self.assertEqual(game.away_team_id, 'bal')
+        self.assertEqual(game.home_team_lg, 'AL')
+        self.assertEqual(game.away_team_lg, 'AL')
+        self.assertEqual(game.home_team_name, 'Seattle')
+        self.assertEqual(game.away_team_name, 'Baltimore')
+        self.assertEqual(game.home_team_name_full, 'Seattle Mariners')
+        self.assertEqual(game.away_team_name_full, 'Baltimore Orioles')
 
     def test_team_stadium_exists(self):
         """
         Stadium Data
         """
-        self.assertEqual(Game._get_stadium_attribute(self.game, 'id'), '680')
-        self.assertEqual(Game._get_stadium_attribute(self.game, 'name'), 'Safeco Field')
-        self.assertEqual(Game._get_stadium_attribute(self.game, 'location'), 'Seattle, WA')
+        game = Game._generate_game_object(self.game, dt.strptime('2015-08-12', '%Y-%m-%d'), 1)
+        self.assertEqual(game.park_id, '680')
+        self.assertEqual(game.park_name, 'Safeco Field')
+        self.assertEqual(game.park_loc, 'Seattle, WA')
 
     def test_team_attributes_not_exists(self):
         """
         Team attributes Data(not exists)
         """
-        self.assertEqual(Game._get_team_attribute(self.dummy, 'home', 'code'), 'Unknown')
-        self.assertEqual(Game._get_team_attribute(self.dummy, 'away', 'code'), 'Unknown')
-        self.assertEqual(Game._get_team_attribute(self.dummy, 'home', 'league'), 'Unknown')
-        self.assertEqual(Game._get_team_attribute(self.dummy, 'away', 'league'), 'Unknown')
-        self.assertEqual(Game._get_team_attribute(self.dummy, 'home', 'name'), 'Unknown')
-        self.assertEqual(Game._get_team_attribute(self.dummy, 'away', 'name'), 'Unknown')
-        self.assertEqual(Game._get_team_attribute(self.dummy, 'home', 'name_full'), 'Unknown')
-        self.assertEqual(Game._get_team_attribute(self.dummy, 'home', 'name_full'), 'Unknown')
+        game = Game._generate_game_object(self.dummy, dt.strptime('2015-08-12', '%Y-%m-%d'), 1)
+        self.assertEqual(game.home_team_id, 'Unknown')
+        self.assertEqual(game.away_team_id, 'Unknown')
+        self.assertEqual(game.home_team_lg, 'Unknown')
+        self.assertEqual(game.away_team_lg, 'Unknown')
+        self.assertEqual(game.home_team_name, 'Unknown')
+        self.assertEqual(game.away_team_name, 'Unknown')
+        self.assertEqual(game.home_team_name_full, 'Unknown')
+        self.assertEqual(game.away_team_name_full, 'Unknown')
 
     def test_team_stadium_not_exists(self):
         """
         Stadium Data(not exists)
         """
-        self.assertEqual(Game._get_stadium_attribute(self.dummy, 'id'), 'Unknown')
-        self.assertEqual(Game._get_stadium_attribute(self.dummy, 'name'), 'Unknown')
-        self.assertEqual(Game._get_stadium_attribute(self.dummy, 'location'), 'Unknown')
+        game = Game._generate_game_object(self.dummy, dt.strptime('2015-08-12', '%Y-%m-%d'), 1)
+        self.assertEqual(game.park_id, 'Unknown')
+        self.assertEqual(game.park_name, 'Unknown')
+        self.assertEqual(game.park_loc, 'Unknown')
 
     def test_retro_id(self):
         """
@@ -4,7 +4,7 @@
 from datetime import datetime as dt
 from bs4 import BeautifulSoup
 from unittest import TestCase, main
-from pitchpx.game.inning import Inning, AtBat, Pitch
+from pitchpx.game.inning import Inning, AtBat, Pitch, PitchSequence
 from pitchpx.game.game import Game
 from pitchpx.game.players import Players
 
@@ -209,6 +209,39 @@ class TestInning(TestCase):
         self.assertEqual(ab['event_num'], 42)
         self.assertEqual(ab['home_team_runs'], 3)
         self.assertEqual(ab['away_team_runs'], 1)
+        self.assertEqual(ab['start_base_out_state'], 8)
+        self.assertEqual(ab['end_base_out_state'], 10)
+
+    def test_atbat_bases(self):
+        """
+        start & end bases(bit mask)
+        """
+        soup = BeautifulSoup(
+            '<atbat num="1"><runner start="1B" end="3B"/><runner start="2B" end=""/>'
+            '<runner start="" end="1B"/><runner start="3B" end="3B"/></atbat>',
+            'lxml',
+        )
+        self.assertEqual(AtBat._get_bases(soup.atbat), (7, 5))
+        soup = BeautifulSoup('<atbat num="1"></atbat>', 'lxml')
+        self.assertEqual(AtBat._get_bases(soup.atbat), (0, 0))
+
+    def test_atbat_base_out_state(self):
+        """
+        base-out states(bases carried through the half inning)
+        """
+        self.innings._inning_events(self.inning_01.find('bottom'), 1, Inning.INNINGS['bottom'], self.hit_location)
+        # ab 6: runner on 2B is not listed(no runner element)
+        self.assertEqual(
+            [(ab['start_bases'], ab['end_bases']) for ab in self.innings.atbats],
+            [('___', '___'), ('___', '_2_'), ('___', '___'), ('_2_', '___')],
+        )
+        self.assertEqual(
+            [(ab['start_base_out_state'], ab['end_base_out_state']) for ab in self.innings.atbats],
+            [(0, 8), (8, 10), (10, 18), (18, 24)],
+        )
+        # new half inning: empty bases
+        self.innings._inning_events(self.inning_07.find('top'), 7, Inning.INNINGS['top'], self.hit_location)
+        self.assertEqual(self.innings.atbats[4]['start_base_out_state'], 0)
 
     def test_atbat_result(self):
         """
@@ -224,8 +257,9 @@ class TestInning(TestCase):
             1,
             self.hit_location
         )
-        pitches = self.innings._get_pitch(soup,pa)
-        ab = AtBat.result(soup, pa, pitches)
+        sequence = PitchSequence()
+        self.innings._get_pitch(soup, pa, sequence)
+        ab = AtBat.result(soup, pa, sequence)
         self.assertEqual(ab['ball_ct'], 0)
         self.assertEqual(ab['strike_ct'], 2)
         self.assertEqual(ab['pitch_seq'], 'SSSX')
@@ -249,7 +283,7 @@ class TestInning(TestCase):
         pitch = Pitch.row(
             BeautifulSoup(TestInning.XML_PITCH, 'lxml').find('pitch'),
             pa,
-            self.innings._get_pitch(soup, pa)[0:3],
+            PitchSequence.from_rows(self.innings._get_pitch(soup, pa)[0:3]),
             0,
             0,
         )
@@ -416,6 +450,54 @@ class TestInning(TestCase):
         self.assertEqual(actions[2]['player_last_name'], 'Unknown')
         self.assertEqual(actions[2]['player_box_name'], 'Unknown')
 
+    def test_read_inning_iterparse(self):
+        """
+        iterparse backend(same rows as BeautifulSoup)
+        """
+        iterparse = Inning(self.game, self.players)
+        for xml, soup in ((TestInning.XML_INNING_01, self.inning_01), (TestInning.XML_INNING_07, self.inning_07)):
+            inning_number = int(soup.inning['num'])
+            for inning_type in Inning.INNINGS.keys():
+                self.innings._inning_events(
+                    soup.inning.find(inning_type), inning_number, Inning.INNINGS[inning_type], self.hit_location
+                )
+                self.innings._inning_actions(soup.inning.find(inning_type), inning_number, Inning.INNINGS[inning_type])
+            iterparse._read_inning_iterparse(xml.strip().encode('utf-8'), self.hit_location)
+        self.assertEqual(len(iterparse.atbats), 13)
+        self.assertEqual(len(iterparse.pitches), 54)
+        self.assertEqual(len(iterparse.actions), 3)
+        self.assertEqual(iterparse.atbats, self.innings.atbats)
+        self.assertEqual(iterparse.pitches, self.innings.pitches)
+        self.assertEqual(iterparse.actions, self.innings.actions)
+
+    def test_pitch_sequence(self):
+        """
+        pitch sequence(appended per pitch)
+        """
+        sequence = PitchSequence()
+        self.assertEqual(sequence.append('B', 'FF'), ('B', 'FF'))
+        self.assertEqual(sequence.append('S', 'SL'), ('BS', 'FF|SL'))
+        self.assertEqual(sequence.append('X', 'FF'), ('BSX', 'FF|SL|FF'))
+        rows = [{'pitch_res': 'B', 'pitch_type': 'FF'}, {'pitch_res': 'S', 'pitch_type': 'SL'}]
+        self.assertEqual(PitchSequence.from_rows(rows).pitch_type_seq, 'FF|SL')
+        self.assertEqual(PitchSequence().pitch_seq, '')
+
+    def test_pitch_normalized(self):
+        """
+        normalized pitch layout(join rebuilds wide layout)
+        """
+        normalized = Inning(self.game, self.players, Pitch.LAYOUT_NORMALIZED)
+        for soup in (self.inning_01, self.inning_07):
+            self.innings._read_inning(soup, self.hit_location)
+            normalized._read_inning(soup, self.hit_location)
+        self.assertEqual(normalized.atbats, self.innings.atbats)
+        self.assertEqual(list(normalized.pitches[0].keys())[0:3], ['retro_game_id', 'ab_number', 'pa_ball_ct'])
+        self.assertNotIn('park_name', normalized.pitches[0])
+        self.assertNotIn('pa_event_cd', normalized.pitches[0])
+        wide = Pitch.join(normalized.atbats, normalized.pitches)
+        self.assertEqual(len(wide), 54)
+        self.assertEqual([list(pitch.items()) for pitch in wide], [list(pitch.items()) for pitch in self.innings.pitches])
+
 
 if __name__ == '__main__':
     main()
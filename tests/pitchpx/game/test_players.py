@@ -154,6 +154,27 @@ class TestPlayers(TestCase):
         self.assertEqual(row['losses'], 0)
         self.assertEqual(row['era'], 0.0)
 
+    def test_player_batter_slim_row(self):
+        """
+        Player dataset(batter, slim layout & season player table)
+        """
+        soup = BeautifulSoup(TestPlayers.XML_PLAYER_BATTER, 'lxml')
+        player = Players.Player(soup.find('player'), 'SEA201408121')
+        row = player.game_row()
+        self.assertEqual(list(row.keys()), list(Players.Player.GAME_FIELDS))
+        self.assertEqual(row['retro_game_id'], 'SEA201408121')
+        self.assertEqual(row['id'], '572122')
+        self.assertEqual(row['num'], 15)
+        self.assertEqual(row['bat_order'], 2)
+        self.assertEqual(row['avg'], 0.263)
+        self.assertNotIn('first', row)
+        dimension = player.dimension_row()
+        self.assertEqual(
+            list(dimension.items()),
+            [('id', '572122'), ('first', 'Kyle'), ('last', 'Seager'), ('box_name', 'Seager, K'), ('rl', 'R'),
+             ('bats', 'L')],
+        )
+
     def test_player_coach(self):
         """
         Coach data
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pickle
+from collections import OrderedDict
+from unittest import TestCase, main
+from pitchpx.game.record import Record
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class SampleRecord(Record):
+    __slots__ = FIELDS = ('retro_game_id', 'ab_number', 'px')
+
+
+class TestRecord(TestCase):
+    """
+    Compact row Test
+    """
+
+    def setUp(self):
+        self.record = SampleRecord('SEA201508120', 1)
+
+    def tearDown(self):
+        pass
+
+    def test_mapping(self):
+        """
+        read & write like OrderedDict
+        """
+        self.assertEqual(self.record['retro_game_id'], 'SEA201508120')
+        self.assertIsNone(self.record['px'])
+        self.record['px'] = 0.416
+        self.assertEqual(self.record.keys(), ['retro_game_id', 'ab_number', 'px'])
+        self.assertEqual(self.record.values(), ['SEA201508120', 1, 0.416])
+        self.assertEqual(len(self.record), 3)
+        self.assertIn('px', self.record)
+        self.assertNotIn('pz', self.record)
+        self.assertEqual(self.record.get('pz', -1), -1)
+        self.record.update({'ab_number': 2})
+        self.assertEqual(self.record['ab_number'], 2)
+        self.assertEqual(list(self.record), ['retro_game_id', 'ab_number', 'px'])
+
+    def test_fixed_columns(self):
+        """
+        unknown column
+        """
+        self.assertRaises(KeyError, self.record.__getitem__, 'pz')
+        self.assertRaises(KeyError, self.record.__setitem__, 'pz', 0.0)
+        self.assertFalse(hasattr(self.record, '__dict__'))
+
+    def test_not_columns(self):
+        """
+        method & class attribute names are not columns
+        """
+        for key in ('keys', 'FIELDS'):
+            self.assertRaises(KeyError, self.record.__getitem__, key)
+            self.assertRaises(KeyError, self.record.__setitem__, key, None)
+            self.assertEqual(self.record.get(key, 'default'), 'default')
+            self.assertNotIn(key, self.record)
+
+    def test_equal(self):
+        """
+        equal(record & dict)
+        """
+        self.assertEqual(self.record, SampleRecord(retro_game_id='SEA201508120', ab_number=1))
+        self.assertNotEqual(self.record, SampleRecord('SEA201508120', 2))
+        self.assertEqual(self.record, OrderedDict([('retro_game_id', 'SEA201508120'), ('ab_number', 1), ('px', None)]))
+
+    def test_pickle(self):
+        """
+        pickle(worker process to main process)
+        """
+        self.record['px'] = 0.416
+        self.assertEqual(pickle.loads(pickle.dumps(self.record)), self.record)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,15 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import os
+import tempfile
+import yaml
+from collections import OrderedDict
+from datetime import datetime as dt
 from unittest import TestCase, main
-from pitchpx.mlbam import MlbAm
+from pitchpx import mlbam
+from pitchpx.mlbam import MlbAm, MlbAmException, MlbAmBadParameter
+from pitchpx.mlbam_manifest import MlbamManifest
+from pitchpx.mlbam_stats import MlbamStats
 
 __author__ = 'Shinichi Nakagawa'
 
@@ -12,10 +20,11 @@ class TestMlbAm(TestCase):
     """
 
     def setUp(self):
-        pass
+        self.tmp = tempfile.TemporaryDirectory()
+        self.mlb = MlbAm(os.path.dirname(os.path.abspath(mlbam.__file__)), self.tmp.name)
 
     def tearDown(self):
-        pass
+        self.tmp.cleanup()
 
     def test_get_game_number(self):
         """
@@ -26,5 +35,105 @@ class TestMlbAm(TestCase):
         self.assertEqual(MlbAm._get_game_number('gid_2015_05_06_arimlb_colmlb_2/'), 2)
         self.assertEqual(MlbAm._get_game_number('gid_2015_09_12_detmlb_clemlb_1_bak/'), 1)
 
+    def _games(self, *statuses):
+        """
+        game results(gid path, status, datasets, input xml hashes, stats delta)
+        """
+        games = []
+        for i, status in enumerate(statuses):
+            gid_path = 'gid_2015_08_12_balmlb_seamlb_{i}/'.format(i=i)
+            if status != MlbamManifest.GAME_COMPLETE:
+                games.append((gid_path, status, None, {}, {}))
+                continue
+            game = OrderedDict()
+            for filename in MlbAm.DOWNLOAD_FILE_NAMES:
+                game[filename] = [OrderedDict([('retro_game_id', 'SEA20150812{i}'.format(i=i)), ('value', 1)])]
+            games.append((gid_path, status, game, {'{gid}game.xml'.format(gid=gid_path): 'sha1'}, {}))
+        return games
+
+    def test_write_datasets(self):
+        """
+        Gather game datasets into day files
+        """
+        games = self._games(MlbamManifest.GAME_COMPLETE, MlbamManifest.GAME_NOT_FOUND, MlbamManifest.GAME_COMPLETE)
+        MlbamStats.reset()
+        self.mlb._write_datasets(dt(2015, 8, 12), games)
+        for filename in MlbAm.DOWNLOAD_FILE_NAMES:
+            path = os.path.join(self.tmp.name, filename.format(day='20150812', extension='csv'))
+            with open(path) as f:
+                self.assertEqual(f.read().splitlines(), ['retro_game_id,value', 'SEA201508120,1', 'SEA201508122,1'])
+        self.assertFalse(os.path.exists(os.path.join(self.tmp.name, MlbamManifest.FILENAME)))
+        self.assertEqual(MlbamStats.counters['rows_pitch'], 2)
+        self.assertEqual(MlbamStats.counters['games_complete'], 2)
+        self.assertEqual(MlbamStats.counters['games_not_found'], 1)
+
+    def test_write_datasets_error(self):
+        """
+        Error while writing a day(previous day files are not changed)
+        """
+        self.mlb._write_datasets(dt(2015, 8, 12), self._games(MlbamManifest.GAME_COMPLETE))
+
+        def games():
+            yield from self._games(MlbamManifest.GAME_COMPLETE, MlbamManifest.GAME_COMPLETE)[1:]
+            raise MlbAmException('parse error')
+        self.assertRaises(MlbAmException, self.mlb._write_datasets, dt(2015, 8, 12), games())
+        self.assertEqual(len(os.listdir(self.tmp.name)), len(MlbAm.DOWNLOAD_FILE_NAMES))
+        for filename in MlbAm.DOWNLOAD_FILE_NAMES:
+            path = os.path.join(self.tmp.name, filename.format(day='20150812', extension='csv'))
+            with open(path) as f:
+                self.assertEqual(f.read().splitlines(), ['retro_game_id,value', 'SEA201508120,1'])
+
+    def test_write_datasets_manifest(self):
+        """
+        Record written days(failed game: redo on resume)
+        """
+        manifest = MlbamManifest(self.tmp.name)
+        self.mlb._write_datasets(
+            dt(2015, 8, 12), self._games(MlbamManifest.GAME_COMPLETE, MlbamManifest.GAME_NOT_FOUND), manifest
+        )
+        self.mlb._write_datasets(
+            dt(2015, 8, 13), self._games(MlbamManifest.GAME_COMPLETE, MlbamManifest.GAME_FAILED), manifest
+        )
+        manifest = MlbamManifest(self.tmp.name)
+        self.assertTrue(manifest.completed('20150812'))
+        self.assertFalse(manifest.completed('20150813'))
+        self.assertFalse(manifest.completed('20150814'))
+        self.assertEqual(
+            manifest.days['20150812']['games']['gid_2015_08_12_balmlb_seamlb_0/'],
+            {'status': MlbamManifest.GAME_COMPLETE, 'inputs': {'gid_2015_08_12_balmlb_seamlb_0/game.xml': 'sha1'}},
+        )
+        self.assertEqual(len(manifest.days['20150812']['files']), len(MlbAm.DOWNLOAD_FILE_NAMES))
+
+    def test_write_stats(self):
+        """
+        Stats files(relative: output directory, absolute: as given)
+        """
+        prometheus = tempfile.TemporaryDirectory()
+        self.addCleanup(prometheus.cleanup)
+        MlbamStats.reset()
+        self.mlb.stats = {'summary': 'pitchpx_stats.json', 'prometheus': 'pitchpx.prom'}
+        self.mlb._write_stats(1.0)
+        self.assertTrue(os.path.exists(os.path.join(self.tmp.name, 'pitchpx_stats.json')))
+        self.assertTrue(os.path.exists(os.path.join(self.tmp.name, 'pitchpx.prom')))
+        self.mlb.stats = {'summary': None, 'prometheus': os.path.join(prometheus.name, 'pitchpx.prom')}
+        self.mlb._write_stats(1.0)
+        self.assertEqual(os.listdir(prometheus.name), ['pitchpx.prom'])
+
+    def test_slim_player_layout_without_cache(self):
+        """
+        Slim player layout needs a player cache(season player tables of all runs)
+        """
+        with open(os.path.join(os.path.dirname(os.path.abspath(mlbam.__file__)), 'setting.yml')) as f:
+            setting = yaml.safe_load(f)
+        setting['config']['player_layout'] = 'slim'
+        setting['players']['cache'] = None
+        with open(os.path.join(self.tmp.name, 'setting.yml'), mode='w') as f:
+            yaml.safe_dump(setting, f)
+        self.assertRaises(MlbAmBadParameter, MlbAm, self.tmp.name, self.tmp.name)
+        setting['players']['cache'] = 'pitchpx_players.json'
+        with open(os.path.join(self.tmp.name, 'setting.yml'), mode='w') as f:
+            yaml.safe_dump(setting, f)
+        self.assertEqual(MlbAm(self.tmp.name, self.tmp.name).player_layout, 'slim')
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import os
+import asyncio
+import tempfile
+from unittest import TestCase, main, skipIf
+from pitchpx.mlbam_async import MlbamAsyncUtil, aiohttp
+from pitchpx.mlbam_corpus import MlbamStaticServer
+from pitchpx.mlbam_util import MlbAmHttpNotFound
+
+__author__ = 'Shinichi Nakagawa'
+
+
+@skipIf(aiohttp is None, 'aiohttp not installed')
+class TestMlbamAsyncUtil(TestCase):
+    """
+    MLBAM asyncio fetch engine Test
+    """
+
+    XML = '<game type="R" local_game_time="12:40" game_pk="415346"></game>'
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        gid = os.path.join(self.tmp.name, 'gid_2015_08_12_balmlb_seamlb_1')
+        os.makedirs(gid)
+        with open(os.path.join(gid, 'game.xml'), 'w') as f:
+            f.write(self.XML)
+        self.server = MlbamStaticServer(self.tmp.name).start()
+        self.url = self.server.url
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+        self.server.stop()
+        self.tmp.cleanup()
+
+    def _run(self, coroutine):
+        async def run():
+            async with MlbamAsyncUtil(concurrency=4) as fetcher:
+                return await coroutine(fetcher)
+        return self.loop.run_until_complete(run())
+
+    def test_find_xml_all(self):
+        """
+        directory listing
+        """
+        links = self._run(lambda fetcher: fetcher.find_xml_all(self.url, 'lxml', 'a', 'gid_2015_08_12_.*'))
+        self.assertEqual([link.get_text().strip() for link in links], ['gid_2015_08_12_balmlb_seamlb_1/'])
+
+    def test_find_xml(self):
+        """
+        xml(status:200)
+        """
+        url = '/'.join([self.url, 'gid_2015_08_12_balmlb_seamlb_1', 'game.xml'])
+        soup = self._run(lambda fetcher: fetcher.find_xml(url, 'lxml'))
+        self.assertEqual(soup.game['game_pk'], '415346')
+        self.assertEqual(self._run(lambda fetcher: fetcher.find_raw(url)), self.XML.encode('utf-8'))
+
+    def test_find_xml_404(self):
+        """
+        xml(status:404)
+        """
+        url = '/'.join([self.url, 'gid_2015_08_12_balmlb_seamlb_1', 'players.xml'])
+        with self.assertRaises(MlbAmHttpNotFound) as e:
+            self._run(lambda fetcher: fetcher.find_xml(url, 'lxml'))
+        self.assertEqual(e.exception.msg, 'HTTP Error url: {url} status: 404'.format(url=url))
+
+
+if __name__ == '__main__':
+    main()
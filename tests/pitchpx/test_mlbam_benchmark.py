@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import os
+import tempfile
+from bs4 import BeautifulSoup
+from unittest import TestCase, main
+from pitchpx.mlbam_benchmark import MlbamBenchmark
+from pitchpx.mlbam_util import MlbAmBadParameter
+from tests.pitchpx.game import test_inning
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class TestMlbamBenchmark(TestCase):
+    """
+    MLBAM Benchmark Class Test
+    """
+    GID_PATH = 'gid_2015_08_12_balmlb_seamlb_1'
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        day = os.path.join(self.tmp.name, 'year_2015', 'month_08', 'day_12')
+        os.makedirs(os.path.join(day, self.GID_PATH, 'inning'))
+        xmls = {
+            'game.xml': test_inning.TestInning.XML_GAME,
+            'players.xml': test_inning.TestInning.XML_PLAYERS,
+            'boxscore.xml': self._boxscore(test_inning.TestInning.XML_PLAYERS),
+            'inning/inning_hit.xml': test_inning.TestInning.XML_INNING_HIT,
+            'inning/inning_1.xml': test_inning.TestInning.XML_INNING_01,
+            'inning/inning_7.xml': test_inning.TestInning.XML_INNING_07,
+        }
+        for filename, xml in xmls.items():
+            with open(os.path.join(day, self.GID_PATH, filename), 'w', encoding='utf-8') as f:
+                f.write(xml.strip())
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    @classmethod
+    def _boxscore(cls, players_xml):
+        """
+        boxscore.xml(players.xml rosters)
+        :param players_xml: players.xml
+        :return: boxscore.xml
+        """
+        xml = ['<boxscore>']
+        for team in BeautifulSoup(players_xml, 'lxml').find_all('team'):
+            ids = [player['id'] for player in team.find_all('player')]
+            xml.append('<batting team_flag="{flag}">'.format(flag=team['type']))
+            xml.extend(['<batter id="{id}" pos="P" bo="{bo}00"/>'.format(id=id, bo=bo) for bo, id in enumerate(ids[:9], 1)])
+            xml.append('</batting><pitching team_flag="{flag}">'.format(flag=team['type']))
+            xml.extend(['<pitcher id="{id}" pos="P" out="3" bf="4"/>'.format(id=id) for id in ids[9:11]])
+            xml.append('</pitching>')
+        xml.append('</boxscore>')
+        return ''.join(xml)
+
+    def test_run(self):
+        """
+        games/sec, pitches/sec, peak RSS & stage time
+        """
+        report = MlbamBenchmark('20150812', '20150812', corpus=self.tmp.name, config={'workers': 1}).run()
+        self.assertEqual(len(report['runs']), 1)
+        self.assertEqual(report['counters']['games_complete'], 1)
+        self.assertEqual(report['counters']['rows_pitch'], 54)
+        self.assertGreater(report['pitches_per_sec'], 0)
+        self.assertGreater(report['peak_rss_mb']['main'], 0)
+        self.assertIn('parse', report['stages'])
+
+    def test_bad_parameter(self):
+        """
+        corpus, cache or synthetic corpus(one of them)
+        """
+        self.assertRaises(MlbAmBadParameter, MlbamBenchmark, '20150812', '20150812')
+        self.assertRaises(MlbAmBadParameter, MlbamBenchmark, '20150812', '20150812', 'corpus', 'cache')
+        self.assertRaises(MlbAmBadParameter, MlbamBenchmark, '20150813', '20150812', corpus='corpus')
+        self.assertRaises(MlbAmBadParameter, MlbamBenchmark, '20150812', '20150812', 'corpus', synthetic={})
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import os
+import tempfile
+from unittest import TestCase, main
+from requests.models import Response
+from pitchpx.mlbam_cache import MlbamCache
+from pitchpx.mlbam_session import MlbamSession
+from pitchpx.mlbam_util import MlbamUtil, MlbAmCacheMiss
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class TestMlbamCache(TestCase):
+    """
+    MLBAM Raw XML Cache Class Test
+    """
+
+    URL = 'http://gd2.mlb.com/components/game/mlb/year_2015/month_08/day_12/gid_2015_08_12_balmlb_seamlb_1/game.xml'
+    XML = '<game type="R" local_game_time="12:40" game_pk="415346"></game>'
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        MlbamCache.configure(directory=self.tmp.name)
+
+    def tearDown(self):
+        MlbamCache.configure()
+        self.tmp.cleanup()
+
+    def _response(self, body, status_code=200):
+        response = Response()
+        response.status_code = status_code
+        response.headers['Content-Type'] = 'text/xml'
+        response.encoding = 'utf-8'
+        response._content = body.encode('utf-8')
+        return response
+
+    def test_put_get(self):
+        """
+        Store & replay a raw response
+        """
+        self.assertIsNone(MlbamCache.get(self.URL))
+        MlbamCache.put(self.URL, self._response(self.XML))
+        cached = MlbamCache.get(self.URL)
+        self.assertEqual(cached.status_code, 200)
+        self.assertEqual(cached.headers['content-type'], 'text/xml')
+        self.assertEqual(cached.url, self.URL)
+        self.assertEqual(cached.content, self.XML.encode('utf-8'))
+        self.assertEqual(cached.text, self.XML)
+
+    def test_evict(self):
+        """
+        LRU eviction over max size
+        """
+        MlbamCache.configure(directory=self.tmp.name, max_size=350)
+        urls = ['{url}?{i}'.format(url=self.URL, i=i) for i in range(3)]
+        for i, url in enumerate(urls):
+            MlbamCache.put(url, self._response('x' * 100))
+            body = MlbamCache._path(MlbamCache.key(url), MlbamCache.BODY_EXTENSION)
+            os.utime(body, (i, i))
+        # first entry used recently
+        self.assertIsNotNone(MlbamCache.get(urls[0]))
+        MlbamCache.put(self.URL, self._response('x' * 100))
+        self.assertIsNotNone(MlbamCache.get(urls[0]))
+        self.assertIsNone(MlbamCache.get(urls[1]))
+        self.assertIsNotNone(MlbamCache.get(urls[2]))
+        self.assertIsNotNone(MlbamCache.get(self.URL))
+
+    def test_offline(self):
+        """
+        Offline replay(hit & miss)
+        """
+        MlbamCache.put(self.URL, self._response(self.XML))
+        MlbamCache.configure(directory=self.tmp.name, offline=True)
+        soup = MlbamUtil.find_xml(self.URL, 'lxml')
+        self.assertEqual(soup.game['game_pk'], '415346')
+        with self.assertRaises(MlbAmCacheMiss):
+            MlbamUtil.find_xml(self.URL.replace('game.xml', 'players.xml'), 'lxml')
+
+    def test_revalidate(self):
+        """
+        Conditional request(304: cached response, 200: updated)
+        """
+        cached = self._response(self.XML)
+        cached.headers['ETag'] = '"v1"'
+        cached.headers['Last-Modified'] = 'Wed, 12 Aug 2015 23:00:00 GMT'
+        MlbamCache.put(self.URL, cached)
+        requests = []
+
+        class Session(object):
+            def __init__(self, responses):
+                self.responses = responses
+
+            def get(self, url, headers=None, timeout=None):
+                requests.append(headers)
+                return self.responses.pop(0)
+
+        not_modified = self._response('', status_code=304)
+        not_modified.headers['ETag'] = '"v2"'
+        session = Session([not_modified, self._response(self.XML.replace('415346', '415347'))])
+        get_session = MlbamSession.__dict__['get_session']
+        MlbamSession.get_session = classmethod(lambda cls: session)
+        try:
+            # revalidate off: no request
+            self.assertEqual(MlbamUtil.find_xml(self.URL, 'lxml').game['game_pk'], '415346')
+            self.assertEqual(requests, [])
+            MlbamCache.configure(directory=self.tmp.name, revalidate=True)
+            self.assertEqual(MlbamUtil.find_xml(self.URL, 'lxml').game['game_pk'], '415346')
+            self.assertEqual(requests[0]['If-None-Match'], '"v1"')
+            self.assertEqual(requests[0]['If-Modified-Since'], 'Wed, 12 Aug 2015 23:00:00 GMT')
+            self.assertEqual(MlbamCache.get(self.URL).headers['ETag'], '"v2"')
+            self.assertEqual(MlbamUtil.find_xml(self.URL, 'lxml').game['game_pk'], '415347')
+            self.assertEqual(requests[1]['If-None-Match'], '"v2"')
+            self.assertEqual(MlbamCache.get(self.URL).content, self.XML.replace('415346', '415347').encode('utf-8'))
+        finally:
+            MlbamSession.get_session = get_session
+
+
+if __name__ == '__main__':
+    main()
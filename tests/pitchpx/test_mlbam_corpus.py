@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import os
+import tempfile
+import requests
+from datetime import datetime as dt
+from unittest import TestCase, main
+from pitchpx.mlbam import MlbAm
+from pitchpx.mlbam_corpus import MlbamCorpus, MlbamStaticServer
+from pitchpx.mlbam_util import MlbAmBadParameter
+from pitchpx.game.players import Players
+from pitchpx.game.inning import AtBat, Pitch, InningAction
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class TestMlbamCorpus(TestCase):
+    """
+    MLBAM Synthetic Corpus Class Test
+    """
+    DAY = 'year_2015/month_08/day_12'
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.corpus = MlbamCorpus(self.tmp.name, games=2, innings=3, atbats=3, pitches=4, seed=1)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _read(self, gid_dir, filename):
+        with open(os.path.join(gid_dir, filename), encoding='utf-8') as f:
+            return f.read()
+
+    def test_generate(self):
+        """
+        gid directories(configured games, innings, at bats & pitches)
+        """
+        total = self.corpus.generate(dt(2015, 8, 12), dt(2015, 8, 13))
+        self.assertEqual(total, {'days': 2, 'games': 4, 'atbats': 72, 'pitches': 288})
+        gid_paths = sorted(os.listdir(os.path.join(self.tmp.name, *self.DAY.split('/'))))
+        self.assertEqual(len(gid_paths), 2)
+        self.assertRegex(gid_paths[0], r'^gid_2015_08_12_[a-z]{3}mlb_[a-z]{3}mlb_1$')
+        gid_dir = os.path.join(self.tmp.name, *self.DAY.split('/'), gid_paths[0])
+        self.assertEqual(
+            sorted(os.listdir(os.path.join(gid_dir, 'inning'))),
+            ['inning_1.xml', 'inning_2.xml', 'inning_3.xml', 'inning_hit.xml'],
+        )
+        # same seed, same corpus
+        with tempfile.TemporaryDirectory() as other:
+            corpus = MlbamCorpus(other, games=2, innings=3, atbats=3, pitches=4, seed=1)
+            corpus.generate(dt(2015, 8, 12), dt(2015, 8, 12))
+            self.assertEqual(
+                self._read(gid_dir, 'inning/inning_2.xml'),
+                self._read(os.path.join(other, *self.DAY.split('/'), gid_paths[0]), 'inning/inning_2.xml'),
+            )
+
+    def test_parse(self):
+        """
+        parsed by Game, Players, Inning & BoxScore
+        """
+        self.corpus.generate(dt(2015, 8, 12), dt(2015, 8, 12))
+        gid_path = sorted(os.listdir(os.path.join(self.tmp.name, *self.DAY.split('/'))))[0]
+        gid_dir = os.path.join(self.tmp.name, *self.DAY.split('/'), gid_path)
+        datasets = MlbAm._parse_game(
+            'lxml', Pitch.LAYOUT_WIDE, dt(2015, 8, 12), gid_path + '/',
+            self._read(gid_dir, 'game.xml'), self._read(gid_dir, 'players.xml'), self._read(gid_dir, 'boxscore.xml'),
+            self._read(gid_dir, 'inning/inning_hit.xml'),
+            [self._read(gid_dir, 'inning/inning_{number}.xml'.format(number=number)) for number in (1, 2, 3)],
+        )
+        atbats = datasets[AtBat.DOWNLOAD_FILE_NAME]
+        self.assertEqual(len(atbats), 18)
+        self.assertEqual(len(datasets[Pitch.DOWNLOAD_FILE_NAME]), 72)
+        self.assertEqual([atbat['event_outs_ct'] for atbat in atbats[:3]], [1, 2, 3])
+        self.assertNotIn('Unknown', [atbat['bat_last_name'] for atbat in atbats])
+        self.assertNotIn('Unknown', [atbat['pit_last_name'] for atbat in atbats])
+        # pitching change(the 2/3 of innings)
+        self.assertEqual(
+            [(action['inning_number'], action['event']) for action in datasets[InningAction.DOWNLOAD_FILE_NAME]],
+            [(3, 'Pitching Substitution'), (3, 'Pitching Substitution')],
+        )
+        # in play at bats: hit chart location
+        for atbat in atbats:
+            if atbat['pitch_seq'].endswith('X'):
+                self.assertIsNotNone(atbat['hit_x'])
+        self.assertEqual(len(datasets[Players.Player.DOWNLOAD_FILE_NAME]), 50)
+
+    def test_static_server(self):
+        """
+        corpus files & directory listing(gid & inning anchors)
+        """
+        self.corpus.generate(dt(2015, 8, 12), dt(2015, 8, 12))
+        gid_path = sorted(os.listdir(os.path.join(self.tmp.name, *self.DAY.split('/'))))[0]
+        with MlbamStaticServer(self.tmp.name) as server:
+            listing = requests.get('/'.join([server.url, self.DAY, '']))
+            self.assertIn('href="{gid_path}/"'.format(gid_path=gid_path), listing.text)
+            innings = requests.get('/'.join([server.url, self.DAY, gid_path, 'inning', '']))
+            self.assertIn('href="inning_3.xml"', innings.text)
+            game = requests.get('/'.join([server.url, self.DAY, gid_path, 'game.xml']))
+            self.assertTrue(game.text.startswith('<game type="R"'))
+            self.assertEqual(requests.get('/'.join([server.url, 'year_2015/month_08/day_13/'])).status_code, 404)
+
+    def test_bad_parameter(self):
+        """
+        a half inning needs 3 outs
+        """
+        self.assertRaises(MlbAmBadParameter, MlbamCorpus, self.tmp.name, atbats=2)
+        self.assertRaises(MlbAmBadParameter, MlbamCorpus, self.tmp.name, pitches=0)
+
+
+if __name__ == '__main__':
+    main()
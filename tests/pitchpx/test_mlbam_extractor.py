@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from unittest import TestCase, main
+from bs4 import BeautifulSoup
+from pitchpx.mlbam_util import MlbamUtil, MlbamConst
+from pitchpx.mlbam_extractor import MlbamField, MlbamExtractor
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class Row(object):
+    pass
+
+
+class TestMlbamExtractor(TestCase):
+    """
+    MLBAM Extractor Class Test
+    """
+    XML = '<pitch des="Ball" id="3" x="" y="placeholder" start_speed="None" sv_id="Unknown" spin_rate="1.5"/>'
+
+    def setUp(self):
+        self.soup = BeautifulSoup(self.XML, 'lxml').find('pitch')
+        self.fields = (
+            MlbamField('des'),
+            MlbamField('pitch_id', 'id', int, MlbamConst.UNKNOWN_SHORT),
+            MlbamField('x', data_type=float),
+            MlbamField('y', data_type=float),
+            MlbamField('start_speed', data_type=float, unknown=MlbamConst.UNKNOWN_FULL),
+            MlbamField('sv_id', data_type=int, unknown=MlbamConst.UNKNOWN_FULL),
+            MlbamField('spin_rate', data_type=float),
+            MlbamField('zone', data_type=int, unknown=MlbamConst.UNKNOWN_SHORT),
+            MlbamField('nasty', data_type=None, unknown=MlbamConst.UNKNOWN_SHORT),
+        )
+
+    def test_compile(self):
+        """
+        same values as MlbamUtil.get_attribute_stats
+        """
+        row = Row()
+        MlbamExtractor.compile(self.fields, 'pitch')(self.soup.attrs, row)
+        for field in self.fields[:-1]:
+            self.assertEqual(
+                getattr(row, field.name),
+                MlbamUtil.get_attribute_stats(self.soup, field.source, field.data_type, field.unknown),
+                field.name,
+            )
+        self.assertEqual(row.pitch_id, 3)
+        self.assertIsNone(row.x)
+        self.assertEqual(row.sv_id, MlbamConst.UNKNOWN_FULL)
+        self.assertEqual(row.spin_rate, 1.5)
+        self.assertEqual(row.nasty, MlbamConst.UNKNOWN_SHORT)
+
+    def test_compile_raw(self):
+        """
+        data type None(raw value)
+        """
+        row = Row()
+        extract = MlbamExtractor.compile((MlbamField('x', data_type=None), MlbamField('y', data_type=None)))
+        extract(self.soup.attrs, row)
+        self.assertEqual(row.x, '')
+        self.assertEqual(row.y, 'placeholder')
+        self.assertIn('def extract(attrs, row):', extract.source)
+
+    def test_compile_illegal_name(self):
+        """
+        illegal field name
+        """
+        self.assertRaises(ValueError, MlbamExtractor.compile, (MlbamField('row.x = 1; y'),))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import os
+import tempfile
+from collections import OrderedDict
+from datetime import datetime as dt
+from unittest import TestCase, main
+from bs4 import BeautifulSoup
+from requests.models import Response
+from pitchpx import mlbam
+from pitchpx.mlbam import MlbAm
+from pitchpx.mlbam_live import MlbamLive
+from pitchpx.mlbam_manifest import MlbamManifest
+from pitchpx.mlbam_util import MlbamUtil, MlbAmHttpError
+from pitchpx.game.inning import AtBat, Pitch, InningAction
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class Innings(object):
+    pass
+
+
+class TestMlbamLive(TestCase):
+    """
+    MLBAM Live polling Class Test
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.mlb = MlbAm(os.path.dirname(os.path.abspath(mlbam.__file__)), self.tmp.name)
+        self.innings = Innings()
+        self.innings.atbats = [
+            OrderedDict([('ab_number', 1), ('event_num', 7)]),
+            OrderedDict([('ab_number', 2), ('event_num', 14)]),
+            OrderedDict([('ab_number', 3), ('event_num', 21)]),
+        ]
+        self.innings.pitches = [
+            OrderedDict([('ab_number', ab_number), ('pitch_seq', seq)])
+            for ab_number, seq in ((1, 'B'), (1, 'BX'), (2, 'S'), (3, 'X'))
+        ]
+        self.innings.actions = [OrderedDict([('event_num', 10)]), OrderedDict([('event_num', 18)])]
+
+        self.find_xml_all = MlbamUtil.__dict__['find_xml_all']
+        self.find_content = MlbamUtil.__dict__['_find_content']
+        self.urls = []
+
+    def tearDown(self):
+        MlbamUtil.find_xml_all = self.find_xml_all
+        MlbamUtil._find_content = self.find_content
+        self.tmp.cleanup()
+
+    def test_new_rows(self):
+        """
+        rows after the last event_num(pitches: new at bats)
+        """
+        rows = MlbamLive.new_rows(self.innings, -1)
+        self.assertEqual(len(rows[AtBat.DOWNLOAD_FILE_NAME]), 3)
+        self.assertEqual(len(rows[Pitch.DOWNLOAD_FILE_NAME]), 4)
+        self.assertEqual(len(rows[InningAction.DOWNLOAD_FILE_NAME]), 2)
+        rows = MlbamLive.new_rows(self.innings, 14)
+        self.assertEqual([row['ab_number'] for row in rows[AtBat.DOWNLOAD_FILE_NAME]], [3])
+        self.assertEqual([row['pitch_seq'] for row in rows[Pitch.DOWNLOAD_FILE_NAME]], ['X'])
+        self.assertEqual([row['event_num'] for row in rows[InningAction.DOWNLOAD_FILE_NAME]], [18])
+        rows = MlbamLive.new_rows(self.innings, 21)
+        self.assertEqual([len(datasets) for datasets in rows.values()], [0, 0, 0])
+
+    def test_state(self):
+        """
+        games state(same game day only)
+        """
+        live = MlbamLive(self.mlb, dt(2015, 8, 12))
+        game = MlbamLive.LiveGame('gid_2015_08_12_balmlb_seamlb_1/', 'http://example.com/')
+        game.event_num, game.inning = 427, 7
+        live.games[game.gid_path] = game
+        live._save_state()
+        self.assertEqual(
+            MlbamLive(self.mlb, dt(2015, 8, 12))._load_state(),
+            {'gid_2015_08_12_balmlb_seamlb_1/': {'event_num': 427, 'inning': 7, 'final': False}},
+        )
+        self.assertEqual(MlbamLive(self.mlb, dt(2015, 8, 13))._load_state(), {})
+        restored = MlbamLive.LiveGame(game.gid_path, game.gid_url, game.state())
+        self.assertEqual((restored.event_num, restored.inning, restored.final), (427, 7, False))
+
+    def test_poll_find_games_error(self):
+        """
+        game day page error: the session goes on(known games only)
+        """
+        live = MlbamLive(self.mlb, dt(2015, 8, 12))
+
+        def _find_games(timestamp):
+            raise MlbAmHttpError('HTTP Error(give up)')
+        self.mlb._find_games = _find_games
+        rows = live.poll()
+        self.assertEqual([len(datasets) for datasets in rows.values()], [0, 0, 0])
+        self.assertEqual(live.games, OrderedDict())
+        game = MlbamLive.LiveGame('gid_2015_08_12_balmlb_seamlb_1/', 'http://example.com/')
+        game.final = True
+        live.games[game.gid_path] = game
+        live.poll()
+        self.assertEqual(MlbamLive(self.mlb, dt(2015, 8, 12))._load_state()[game.gid_path]['final'], True)
+
+    def _mock(self, content):
+        """
+        replace MlbamUtil inning list & content(requested urls: self.urls)
+        """
+        def find_xml_all(url, markup, tag, pattern):
+            return BeautifulSoup('<a>inning_1.xml</a>', 'lxml').find_all('a')
+
+        def _find_content(url):
+            self.urls.append(url)
+            req = Response()
+            req.status_code = 200
+            req._content = content
+            return req
+        MlbamUtil.find_xml_all = staticmethod(find_xml_all)
+        MlbamUtil._find_content = staticmethod(_find_content)
+
+    def test_poll_game_unchanged(self):
+        """
+        unchanged innings: not parsed & the hit chart is not fetched
+        """
+        content = b'<inning num="1" away_team="bal" home_team="sea" next="Y"/>'
+        self._mock(content)
+        live = MlbamLive(self.mlb, dt(2015, 8, 12))
+        game = MlbamLive.LiveGame('gid_2015_08_12_balmlb_seamlb_1/', 'http://example.com/')
+        game.game = object()
+        game.digest = MlbamManifest.digest(MlbamManifest.digest(content).encode('utf-8'))
+        self.assertEqual(live._poll_game(game), {})
+        self.assertEqual(self.urls, ['http://example.com/inning/inning_1.xml'])
+        self.assertFalse(game.final)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import os
+import tempfile
+from unittest import TestCase, main
+from pitchpx.mlbam_manifest import MlbamManifest
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class TestMlbamManifest(TestCase):
+    """
+    MLBAM Manifest Class Test
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        for filename in ('game_20150812.csv', 'pitch_20150812.csv'):
+            with open(os.path.join(self.tmp.name, filename), mode='w') as f:
+                f.write('retro_game_id\nSEA201508120\n')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_digest(self):
+        """
+        content & file hash
+        """
+        path = os.path.join(self.tmp.name, 'game_20150812.csv')
+        self.assertEqual(MlbamManifest.digest_file(path), MlbamManifest.digest(b'retro_game_id\nSEA201508120\n'))
+        self.assertIsNone(MlbamManifest.digest_file(os.path.join(self.tmp.name, 'not_found.csv')))
+
+    def test_record(self):
+        """
+        record & reload
+        """
+        manifest = MlbamManifest(self.tmp.name)
+        games = {'gid_2015_08_12_balmlb_seamlb_1/': {'status': MlbamManifest.GAME_COMPLETE, 'inputs': {}}}
+        manifest.record('20150812', ['game_20150812.csv', 'pitch_20150812.csv'], games)
+        manifest = MlbamManifest(self.tmp.name)
+        self.assertTrue(manifest.completed('20150812'))
+        self.assertEqual(manifest.days['20150812']['games'], games)
+        self.assertEqual(os.listdir(self.tmp.name).count(MlbamManifest.FILENAME), 1)
+
+    def test_changed_file(self):
+        """
+        output file changed or removed after record(partial day)
+        """
+        manifest = MlbamManifest(self.tmp.name)
+        manifest.record('20150812', ['game_20150812.csv', 'pitch_20150812.csv'], {})
+        with open(os.path.join(self.tmp.name, 'pitch_20150812.csv'), mode='a') as f:
+            f.write('SEA2015081')
+        self.assertFalse(manifest.completed('20150812'))
+        manifest.record('20150812', ['game_20150812.csv', 'pitch_20150812.csv'], {})
+        os.remove(os.path.join(self.tmp.name, 'game_20150812.csv'))
+        self.assertFalse(manifest.completed('20150812'))
+
+    def test_broken_manifest(self):
+        """
+        broken manifest(nothing completed)
+        """
+        with open(os.path.join(self.tmp.name, MlbamManifest.FILENAME), mode='w') as f:
+            f.write('{"version": 1, "days": {')
+        self.assertEqual(MlbamManifest(self.tmp.name).days, {})
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import os
+import tempfile
+from unittest import TestCase, main
+from pitchpx.mlbam_matrix import MlbamMatrix
+from pitchpx.baseball.base_out_matrix import BaseOutMatrix
+from tests.pitchpx.baseball.test_base_out_matrix import TestBaseOutMatrix
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class TestMlbamMatrix(TestCase):
+    """
+    MLBAM Matrix Class Test
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'pitchpx_matrix_{season}.npz')
+
+    def tearDown(self):
+        MlbamMatrix.configure()
+        self.tmp.cleanup()
+
+    def test_off(self):
+        """
+        no file: not aggregated
+        """
+        MlbamMatrix.configure()
+        MlbamMatrix.update(2015, TestBaseOutMatrix.GAME)
+        MlbamMatrix.save()
+        self.assertEqual(MlbamMatrix.seasons, {})
+
+    def test_save(self):
+        """
+        a npz file per season(resume: added to the saved matrix)
+        """
+        MlbamMatrix.configure(self.path)
+        MlbamMatrix.update(2015, TestBaseOutMatrix.GAME)
+        MlbamMatrix.update(2014, TestBaseOutMatrix.GAME)
+        MlbamMatrix.update(2015, [])
+        self.assertEqual(MlbamMatrix.updated, {'2014', '2015'})
+        MlbamMatrix.save()
+        self.assertEqual(MlbamMatrix.updated, set())
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ['pitchpx_matrix_2014.npz', 'pitchpx_matrix_2015.npz'])
+        game = [dict(atbat, retro_game_id='SEA201508130') for atbat in TestBaseOutMatrix.GAME]
+        for resume, games in ((True, 2), (False, 1)):
+            MlbamMatrix.configure(self.path, resume)
+            MlbamMatrix.update(2015, game)
+            MlbamMatrix.save()
+            self.assertEqual(BaseOutMatrix.load(self.path.format(season=2015)).games, games)
+
+    def test_resume_counted_game(self):
+        """
+        resume: a game already in the saved matrix is not counted again
+        """
+        MlbamMatrix.configure(self.path)
+        MlbamMatrix.update(2015, TestBaseOutMatrix.GAME)
+        MlbamMatrix.save()
+        MlbamMatrix.configure(self.path, True)
+        MlbamMatrix.update(2015, TestBaseOutMatrix.GAME)
+        self.assertEqual(MlbamMatrix.updated, set())
+        MlbamMatrix.save()
+        matrix = BaseOutMatrix.load(self.path.format(season=2015))
+        self.assertEqual(matrix.games, 1)
+        self.assertEqual(matrix.game_ids, {'SEA201508120'})
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import os
+import math
+import tempfile
+from unittest import TestCase, main
+from pitchpx.mlbam_pitch_store import MlbamPitchStore
+from pitchpx.mlbam_util import MlbAmBadParameter
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class TestMlbamPitchStore(TestCase):
+    """
+    MLBAM Pitch Store Class Test
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmp.name, 'pitch_store')
+
+    def tearDown(self):
+        MlbamPitchStore.configure()
+        self.tmp.cleanup()
+
+    @classmethod
+    def _pitches(cls, retro_game_id, count, px=0.5):
+        """
+        pitch rows(PITCHf/x & id fields)
+        """
+        pitches = []
+        for i in range(count):
+            pitch = {name: float(i) for name in MlbamPitchStore.COLUMNS}
+            pitch.update({'retro_game_id': retro_game_id, 'ab_number': i // 2 + 1, 'pitch_id': i + 3, 'px': px})
+            pitches.append(pitch)
+        return pitches
+
+    def test_append_read(self):
+        """
+        append games & read a season(memory-mapped, unknown: nan & -1)
+        """
+        MlbamPitchStore.configure(self.directory, 'float64')
+        MlbamPitchStore.append(2015, self._pitches('SEA201508120', 3, px=-0.131))
+        game = self._pitches('SEA201508130', 2, px=None)
+        game[1]['pitch_id'] = None
+        MlbamPitchStore.append(2015, game)
+        MlbamPitchStore.append(2015, [])
+        MlbamPitchStore.save()
+        store = MlbamPitchStore.read(self.directory, 2015)
+        self.assertEqual(list(store['columns'].keys()), list(MlbamPitchStore.COLUMNS))
+        self.assertEqual(store['columns']['px'].dtype.str, '<f8')
+        self.assertEqual(store['columns']['px'][0], -0.131)
+        self.assertTrue(math.isnan(store['columns']['px'][4]))
+        self.assertEqual(store['columns']['spin_rate'].tolist(), [0.0, 1.0, 2.0, 0.0, 1.0])
+        self.assertEqual(store['game_index'].tolist(), [0, 0, 0, 1, 1])
+        self.assertEqual(store['ab_number'].tolist(), [1, 1, 2, 1, 1])
+        self.assertEqual(store['pitch_id'].tolist(), [3, 4, 5, 3, -1])
+        self.assertEqual(list(store['games'].items()), [
+            ('SEA201508120', slice(0, 3)), ('SEA201508130', slice(3, 5)),
+        ])
+
+    def test_commit(self):
+        """
+        the header is the commit point(unsaved rows are discarded, stored games are skipped)
+        """
+        MlbamPitchStore.configure(self.directory)
+        MlbamPitchStore.append(2015, self._pitches('SEA201508120', 3))
+        MlbamPitchStore.save()
+        MlbamPitchStore.append(2015, self._pitches('SEA201508130', 2))
+        MlbamPitchStore.configure(self.directory)
+        MlbamPitchStore.append(2015, self._pitches('SEA201508120', 3))
+        MlbamPitchStore.append(2015, self._pitches('SEA201508140', 4, px=1.5))
+        MlbamPitchStore.save()
+        store = MlbamPitchStore.read(self.directory, '2015')
+        self.assertEqual(list(store['games'].keys()), ['SEA201508120', 'SEA201508140'])
+        self.assertEqual(store['columns']['px'].dtype.str, '<f4')
+        self.assertEqual(store['columns']['px'].tolist(), [0.5] * 3 + [1.5] * 4)
+        self.assertEqual(os.path.getsize(os.path.join(self.directory, '2015', 'px.bin')), 7 * 4)
+
+    def test_bad_parameter(self):
+        """
+        dtype & season not found
+        """
+        self.assertRaises(MlbAmBadParameter, MlbamPitchStore.configure, self.directory, 'int8')
+        MlbamPitchStore.configure(self.directory)
+        MlbamPitchStore.append(2015, self._pitches('SEA201508120', 1))
+        MlbamPitchStore.save()
+        MlbamPitchStore.configure(self.directory, 'float64')
+        self.assertRaises(MlbAmBadParameter, MlbamPitchStore.append, 2015, self._pitches('SEA201508130', 1))
+        self.assertRaises(MlbAmBadParameter, MlbamPitchStore.read, self.directory, 2014)
+
+
+if __name__ == '__main__':
+    main()
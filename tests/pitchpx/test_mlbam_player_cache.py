@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import os
+import tempfile
+from collections import OrderedDict
+from unittest import TestCase, main
+from pitchpx.mlbam_player_cache import MlbamPlayerCache
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class TestMlbamPlayerCache(TestCase):
+    """
+    MLBAM Player Cache Class Test
+    """
+    SEAGER = OrderedDict([
+        ('id', '572122'), ('first', 'Kyle'), ('last', 'Seager'), ('box_name', 'Seager, K'), ('rl', 'R'), ('bats', 'L'),
+    ])
+    IWAKUMA = OrderedDict([
+        ('id', '547874'), ('first', 'Hisashi'), ('last', 'Iwakuma'), ('box_name', 'Iwakuma'), ('rl', 'R'), ('bats', 'R'),
+    ])
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'pitchpx_players.json')
+
+    def tearDown(self):
+        MlbamPlayerCache.configure()
+        self.tmp.cleanup()
+
+    def test_update(self):
+        """
+        dedupe players(key: season & player id)
+        """
+        MlbamPlayerCache.configure()
+        MlbamPlayerCache.update(2015, [self.SEAGER, self.IWAKUMA])
+        MlbamPlayerCache.update(2015, [OrderedDict(self.SEAGER), OrderedDict(self.IWAKUMA)])
+        MlbamPlayerCache.update(2014, [self.SEAGER])
+        self.assertEqual(MlbamPlayerCache.rows(2015), [self.IWAKUMA, self.SEAGER])
+        self.assertEqual(MlbamPlayerCache.rows('2014'), [self.SEAGER])
+        self.assertEqual(MlbamPlayerCache.rows(2013), [])
+        self.assertEqual(MlbamPlayerCache.updated, {'2014', '2015'})
+        # interned values
+        self.assertIs(MlbamPlayerCache.seasons['2015']['572122'][1], MlbamPlayerCache.seasons['2014']['572122'][1])
+
+    def test_save(self):
+        """
+        on disk cache(merged by the next run)
+        """
+        MlbamPlayerCache.configure(self.path)
+        MlbamPlayerCache.update(2015, [self.SEAGER])
+        MlbamPlayerCache.save()
+        MlbamPlayerCache.configure(self.path)
+        self.assertEqual(MlbamPlayerCache.updated, set())
+        MlbamPlayerCache.update(2015, [self.SEAGER, self.IWAKUMA])
+        self.assertEqual(MlbamPlayerCache.updated, {'2015'})
+        self.assertEqual(MlbamPlayerCache.rows(2015), [self.IWAKUMA, self.SEAGER])
+
+    def test_memory_only(self):
+        """
+        no cache file
+        """
+        MlbamPlayerCache.configure()
+        MlbamPlayerCache.update(2015, [self.SEAGER])
+        MlbamPlayerCache.save()
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import multiprocessing
+from unittest import TestCase, main
+from pitchpx.mlbam_rate_limit import MlbamRateLimiter
+
+__author__ = 'Shinichi Nakagawa'
+
+
+def _reserve(state, count):
+    MlbamRateLimiter.configure(rate=1.0, burst=2, state=state)
+    for _ in range(count):
+        MlbamRateLimiter.reserve()
+
+
+class TestMlbamRateLimiter(TestCase):
+    """
+    MLBAM Rate Limiter Class Test
+    """
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        MlbamRateLimiter.configure()
+
+    def test_unlimited(self):
+        """
+        rate:0(unlimited)
+        """
+        MlbamRateLimiter.configure()
+        for _ in range(100):
+            self.assertEqual(MlbamRateLimiter.reserve(), 0.0)
+
+    def test_burst(self):
+        """
+        burst & wait
+        """
+        MlbamRateLimiter.configure(rate=1.0, burst=3)
+        for _ in range(3):
+            self.assertEqual(MlbamRateLimiter.reserve(), 0.0)
+        self.assertAlmostEqual(MlbamRateLimiter.reserve(), 1.0, places=1)
+        self.assertAlmostEqual(MlbamRateLimiter.reserve(), 2.0, places=1)
+
+    def test_shared_state(self):
+        """
+        state shared by worker processes
+        """
+        state = MlbamRateLimiter.create_state(2)
+        worker = multiprocessing.get_context('fork').Process(target=_reserve, args=(state, 2))
+        worker.start()
+        worker.join()
+        MlbamRateLimiter.configure(rate=1.0, burst=2, state=state)
+        self.assertAlmostEqual(MlbamRateLimiter.reserve(), 1.0, places=1)
+
+
+if __name__ == '__main__':
+    main()
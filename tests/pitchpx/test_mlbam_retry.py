@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import requests
+from unittest import TestCase, main
+from requests.models import Response
+from pitchpx.mlbam_util import MlbamUtil, MlbAmHttpError, MlbAmHttpNotFound
+from pitchpx.mlbam_retry import MlbamRetry
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class TestMlbamRetry(TestCase):
+    """
+    MLBAM Retry Class Test
+    """
+
+    def setUp(self):
+        MlbamRetry.configure(max_attempts=3, backoff=0.0, max_backoff=0.0)
+        MlbamRetry.reset_counters()
+        self.get_content = MlbamUtil.__dict__['_get_content']
+        self.responses = []
+
+    def tearDown(self):
+        MlbamUtil._get_content = self.get_content
+        MlbamRetry.configure()
+        MlbamRetry.reset_counters()
+
+    def _mock(self, *responses):
+        """
+        replace MlbamUtil._get_content(status code or exception)
+        """
+        self.responses = list(responses)
+
+        def _get_content(url, headers=MlbamUtil.HTTP_HEADERS):
+            status = self.responses.pop(0)
+            if isinstance(status, Exception):
+                raise status
+            req = Response()
+            req.url = url
+            req.status_code = status
+            req._content = b'<game/>'
+            return req
+        MlbamUtil._get_content = staticmethod(_get_content)
+
+    def test_backoff(self):
+        """
+        exponential backoff(max backoff, jitter)
+        """
+        MlbamRetry.configure(backoff=0.5, max_backoff=3.0, jitter=False)
+        self.assertEqual(MlbamRetry.retry(1), 0.5)
+        self.assertEqual(MlbamRetry.retry(2), 1.0)
+        self.assertEqual(MlbamRetry.retry(3), 2.0)
+        self.assertEqual(MlbamRetry.retry(4), 3.0)
+        MlbamRetry.configure(backoff=0.5, max_backoff=3.0, jitter=True)
+        for attempt in range(1, 10):
+            self.assertTrue(0.0 <= MlbamRetry.retry(attempt) <= 3.0)
+
+    def test_retry_status(self):
+        """
+        5xx & connection error are retried
+        """
+        self._mock(503, requests.ConnectionError('reset'), 200)
+        req = MlbamUtil._find_content('http://example.com/game.xml')
+        self.assertEqual(req.status_code, 200)
+        self.assertEqual(MlbamRetry.counters(), {'retries': 2, 'give_ups': 0})
+
+    def test_not_found(self):
+        """
+        404 is not retried
+        """
+        self._mock(404, 200)
+        self.assertRaises(MlbAmHttpNotFound, MlbamUtil._find_content, 'http://example.com/game.xml')
+        self.assertEqual(MlbamRetry.counters(), {'retries': 0, 'give_ups': 0})
+
+    def test_give_up(self):
+        """
+        give up after max attempts
+        """
+        self._mock(500, 502, 504, 200)
+        with self.assertRaises(MlbAmHttpError) as cm:
+            MlbamUtil._find_content('http://example.com/game.xml')
+        self.assertNotIsInstance(cm.exception, MlbAmHttpNotFound)
+        self.assertEqual(cm.exception.msg,
+                         'HTTP Error(give up) url: http://example.com/game.xml status: 504 attempts: 3')
+        self.assertEqual(MlbamRetry.counters(), {'retries': 2, 'give_ups': 1})
+        self.assertEqual(self.responses, [200])
+
+    def test_attempt(self):
+        """
+        attempt result(done, not found, retry & give up)
+        """
+        MlbamRetry.configure(max_attempts=2, backoff=0.5, jitter=False)
+        url = 'http://example.com/game.xml'
+        self.assertEqual(MlbamRetry.attempt(url, 1, 200), (MlbamRetry.DONE, None))
+        self.assertEqual(
+            MlbamRetry.attempt(url, 1, 404), (MlbamRetry.NOT_FOUND, 'HTTP Error url: {url} status: 404'.format(url=url))
+        )
+        self.assertEqual(MlbamRetry.attempt(url, 1, 503), (MlbamRetry.RETRY, 0.5))
+        self.assertEqual(MlbamRetry.attempt(url, 2, error=requests.Timeout()), (
+            MlbamRetry.GIVE_UP, 'HTTP Error(give up) url: {url} status: Timeout attempts: 2'.format(url=url)
+        ))
+        self.assertEqual(MlbamRetry.counters(), {'retries': 1, 'give_ups': 1})
+
+
+if __name__ == '__main__':
+    main()
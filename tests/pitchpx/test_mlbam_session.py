@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+from unittest import TestCase, main
+from pitchpx.mlbam_session import MlbamSession
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class TestMlbamSession(TestCase):
+    """
+    MLBAM Session Class Test
+    """
+
+    def setUp(self):
+        MlbamSession.configure()
+
+    def tearDown(self):
+        MlbamSession.configure()
+
+    def test_get_session_shared(self):
+        """
+        Same session in process
+        """
+        session = MlbamSession.get_session()
+        self.assertIs(MlbamSession.get_session(), session)
+
+    def test_get_session_other_process(self):
+        """
+        New session in forked process
+        """
+        session = MlbamSession.get_session()
+        MlbamSession._pid = -1
+        self.assertIsNot(MlbamSession.get_session(), session)
+
+    def test_configure(self):
+        """
+        Pool size & keep alive setting
+        """
+        session = MlbamSession.get_session()
+        MlbamSession.configure(pool_connections=4, pool_maxsize=8, pool_block=True, keep_alive=False)
+        configured = MlbamSession.get_session()
+        self.assertIsNot(configured, session)
+        for scheme in MlbamSession.SCHEMES:
+            adapter = configured.get_adapter(scheme)
+            self.assertEqual(adapter._pool_connections, 4)
+            self.assertEqual(adapter._pool_maxsize, 8)
+            self.assertTrue(adapter._pool_block)
+        self.assertEqual(configured.headers['Connection'], 'close')
+
+    def test_keep_alive(self):
+        """
+        Keep alive(default)
+        """
+        self.assertEqual(MlbamSession.get_session().headers['Connection'], 'keep-alive')
+
+
+if __name__ == '__main__':
+    main()
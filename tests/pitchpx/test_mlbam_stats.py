@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import time
+from unittest import TestCase, main
+from pitchpx.mlbam_retry import MlbamRetry
+from pitchpx.mlbam_stats import MlbamStats
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class TestMlbamStats(TestCase):
+    """
+    MLBAM Stats Class Test
+    """
+
+    def setUp(self):
+        MlbamStats.reset()
+
+    def tearDown(self):
+        MlbamStats.reset()
+
+    def test_timer(self):
+        """
+        nested timers are exclusive
+        """
+        with MlbamStats.timer(MlbamStats.STAGE_ROWS):
+            with MlbamStats.timer(MlbamStats.STAGE_FETCH):
+                time.sleep(0.05)
+            with MlbamStats.timer(MlbamStats.STAGE_PARSE):
+                time.sleep(0.02)
+        self.assertGreaterEqual(MlbamStats.timers[MlbamStats.STAGE_FETCH], 0.05)
+        self.assertGreaterEqual(MlbamStats.timers[MlbamStats.STAGE_PARSE], 0.02)
+        self.assertLess(MlbamStats.timers[MlbamStats.STAGE_ROWS], 0.02)
+        self.assertEqual(MlbamStats._stack, [])
+
+    def test_pop_merge(self):
+        """
+        worker delta(with retry counters) merged by the main process
+        """
+        MlbamStats.count('http_requests', 3)
+        MlbamStats.add(MlbamStats.STAGE_FETCH, 1.5)
+        MlbamRetry.retry(1)
+        delta = MlbamStats.pop()
+        self.assertEqual(delta, {'timers': {'fetch': 1.5}, 'counters': {'http_requests': 3, 'retries': 1}})
+        self.assertEqual(MlbamStats.pop(), {'timers': {}, 'counters': {}})
+        MlbamStats.merge(delta)
+        MlbamStats.merge(delta)
+        MlbamStats.merge({})
+        MlbamStats.count('games_complete', 4)
+        summary = MlbamStats.summary(2.0)
+        self.assertEqual(summary['stages'], {'fetch': 3.0})
+        self.assertEqual(summary['counters'], {'games_complete': 4, 'http_requests': 6, 'retries': 2})
+        self.assertEqual(summary['games_per_sec'], 2.0)
+
+    def test_prometheus(self):
+        """
+        Prometheus text
+        """
+        MlbamStats.add(MlbamStats.STAGE_WRITE, 0.25)
+        MlbamStats.count('rows_pitch', 54)
+        text = MlbamStats.prometheus(MlbamStats.summary(1.0))
+        self.assertIn('pitchpx_stage_seconds_total{stage="write"} 0.25\n', text)
+        self.assertIn('# TYPE pitchpx_rows_pitch_total counter\npitchpx_rows_pitch_total 54\n', text)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import os
+import tempfile
+from collections import OrderedDict
+from unittest import TestCase, main, skipIf
+from pitchpx.mlbam_util import MlbAmBadParameter
+from pitchpx.mlbam_writer import MlbamWriter, CsvWriter, ParquetWriter, ArrowWriter, pyarrow
+
+__author__ = 'Shinichi Nakagawa'
+
+
+class TestMlbamWriter(TestCase):
+    """
+    MLBAM Output sink Class Test
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.datasets = [
+            OrderedDict([
+                ('retro_game_id', 'SEA201508120'), ('home_team_id', 'sea'), ('pitch_id', 3),
+                ('px', 0.416), ('spin_rate', None), ('sv_id', None),
+            ]),
+            OrderedDict([
+                ('retro_game_id', 'SEA201508120'), ('home_team_id', 'sea'), ('pitch_id', None),
+                ('px', None), ('spin_rate', None), ('sv_id', None),
+            ]),
+        ]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_get_writer(self):
+        """
+        extension to sink
+        """
+        self.assertEqual(MlbamWriter.get_writer('csv'), CsvWriter)
+        self.assertRaises(MlbAmBadParameter, MlbamWriter.get_writer, 'xlsx')
+
+    def test_abstract(self):
+        """
+        incomplete sink: error on create
+        """
+        class NoCloseWriter(MlbamWriter):
+            def open(self):
+                pass
+
+            def write_rows(self, datasets):
+                pass
+        path = os.path.join(self.tmp.name, 'mlbam_pitch_20150812.csv')
+        self.assertRaises(TypeError, MlbamWriter, path, 'utf-8')
+        self.assertRaises(TypeError, NoCloseWriter, path, 'utf-8')
+        self.assertIsInstance(CsvWriter(path, 'utf-8'), MlbamWriter)
+
+    def test_csv(self):
+        """
+        csv
+        """
+        path = os.path.join(self.tmp.name, 'mlbam_pitch_20150812.csv')
+        CsvWriter.write(path, self.datasets, 'utf-8')
+        with open(path) as f:
+            self.assertEqual(f.read().splitlines(), [
+                'retro_game_id,home_team_id,pitch_id,px,spin_rate,sv_id',
+                'SEA201508120,sea,3,0.416,,',
+                'SEA201508120,sea,,,,',
+            ])
+
+    def test_csv_append(self):
+        """
+        csv(append-only, header at the first rows)
+        """
+        path = os.path.join(self.tmp.name, 'mlbam_live_pitch_20150812.csv')
+        CsvWriter.append(path, self.datasets[:1], 'utf-8')
+        CsvWriter.append(path, [], 'utf-8')
+        CsvWriter.append(path, self.datasets[1:], 'utf-8')
+        with open(path) as f:
+            self.assertEqual(f.read().splitlines(), [
+                'retro_game_id,home_team_id,pitch_id,px,spin_rate,sv_id',
+                'SEA201508120,sea,3,0.416,,',
+                'SEA201508120,sea,,,,',
+            ])
+
+    def test_csv_incremental(self):
+        """
+        csv(append per game, rename at close)
+        """
+        path = os.path.join(self.tmp.name, 'mlbam_pitch_20150812.csv')
+        writer = CsvWriter(path, 'utf-8')
+        writer.open()
+        writer.write_rows([])
+        writer.write_rows(self.datasets[0:1])
+        self.assertFalse(os.path.exists(path))
+        writer.write_rows(self.datasets[1:2])
+        writer.close()
+        self.assertEqual(os.listdir(self.tmp.name), ['mlbam_pitch_20150812.csv'])
+        with open(path) as f:
+            self.assertEqual(len(f.read().splitlines()), 3)
+
+    def test_abort(self):
+        """
+        abort(previous file is not changed)
+        """
+        path = os.path.join(self.tmp.name, 'mlbam_pitch_20150812.csv')
+        CsvWriter.write(path, self.datasets, 'utf-8')
+        writer = CsvWriter(path, 'utf-8')
+        writer.open()
+        writer.write_rows(self.datasets[0:1])
+        writer.abort()
+        self.assertEqual(os.listdir(self.tmp.name), ['mlbam_pitch_20150812.csv'])
+        with open(path) as f:
+            self.assertEqual(len(f.read().splitlines()), 3)
+
+    @skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_parquet_row_groups(self):
+        """
+        parquet(row groups share the column types)
+        """
+        path = os.path.join(self.tmp.name, 'mlbam_pitch_20150812.parquet')
+        writer = ParquetWriter(path, 'utf-8')
+        writer.ROW_GROUP_SIZE = 1
+        writer.open()
+        writer.write_rows(self.datasets[1:2])
+        writer.write_rows(self.datasets[0:1])
+        writer.close()
+        parquet = pyarrow.parquet.ParquetFile(path)
+        self.assertEqual(parquet.metadata.num_row_groups, 2)
+        table = parquet.read()
+        self.assertEqual(table.column('pitch_id').to_pylist(), [None, 3])
+        self.assertEqual(table.column('px').to_pylist(), [None, 0.416])
+
+    @skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_parquet_row_groups_unknown(self):
+        """
+        parquet(unknown values in a typed column of a later row group: null)
+        """
+        path = os.path.join(self.tmp.name, 'mlbam_player_20150812.parquet')
+        writer = ParquetWriter(path, 'utf-8')
+        writer.ROW_GROUP_SIZE = 2
+        writer.open()
+        writer.write_rows([OrderedDict([('num', 1)]), OrderedDict([('num', 2)])])
+        writer.write_rows([OrderedDict([('num', 'U')]), OrderedDict([('num', 3)])])
+        writer.write_rows([OrderedDict([('num', 'Unknown')]), OrderedDict([('num', 4)])])
+        writer.close()
+        parquet = pyarrow.parquet.ParquetFile(path)
+        self.assertEqual(parquet.metadata.num_row_groups, 3)
+        self.assertEqual(parquet.schema_arrow.field('num').type, pyarrow.int64())
+        self.assertEqual(parquet.read().column('num').to_pylist(), [1, 2, None, 3, None, 4])
+
+    @skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_parquet_days_schema(self):
+        """
+        parquet(the same schema every day, unknown values or not)
+        """
+        days = (
+            [OrderedDict([('retro_game_id', 'SEA201508120'), ('num', 15), ('avg', 0.25), ('bat_order', 1),
+                          ('game_position', 'SS'), ('status', 'A')])],
+            [OrderedDict([('retro_game_id', 'SEA201508130'), ('num', 'U'), ('avg', 'U'), ('bat_order', 'U'),
+                          ('game_position', 'U'), ('status', 'Unknown')])],
+        )
+        schemas = []
+        for day, datasets in zip(('20150812', '20150813'), days):
+            path = os.path.join(self.tmp.name, 'mlbam_player_{day}.parquet'.format(day=day))
+            ParquetWriter.write(path, datasets, 'utf-8')
+            schemas.append(pyarrow.parquet.read_schema(path))
+        self.assertTrue(schemas[0].equals(schemas[1]))
+        self.assertEqual(schemas[0].field('num').type, pyarrow.int64())
+        self.assertEqual(schemas[0].field('avg').type, pyarrow.float64())
+        self.assertEqual(schemas[0].field('bat_order').type, pyarrow.int64())
+        self.assertEqual(schemas[0].field('game_position').type, pyarrow.string())
+        table = pyarrow.parquet.read_table(os.path.join(self.tmp.name, 'mlbam_player_20150813.parquet'))
+        self.assertEqual(table.to_pylist(), [{
+            'retro_game_id': 'SEA201508130', 'num': None, 'avg': None, 'bat_order': None,
+            'game_position': 'U', 'status': 'Unknown',
+        }])
+
+    @skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_parquet(self):
+        """
+        parquet(typed & dictionary encoded)
+        """
+        path = os.path.join(self.tmp.name, 'mlbam_pitch_20150812.parquet')
+        MlbamWriter.get_writer('parquet').write(path, self.datasets, 'utf-8')
+        table = pyarrow.parquet.read_table(path)
+        self.assertEqual(table.column_names, list(self.datasets[0].keys()))
+        self.assertEqual(table.schema.field('px').type, pyarrow.float64())
+        self.assertEqual(table.schema.field('spin_rate').type, pyarrow.float64())
+        self.assertEqual(table.schema.field('pitch_id').type, pyarrow.int64())
+        self.assertEqual(table.schema.field('sv_id').type, pyarrow.string())
+        self.assertTrue(pyarrow.types.is_dictionary(table.schema.field('home_team_id').type))
+        self.assertEqual(table.column('px').to_pylist(), [0.416, None])
+        self.assertEqual(table.column('home_team_id').to_pylist(), ['sea', 'sea'])
+
+    @skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_arrow(self):
+        """
+        arrow ipc file
+        """
+        path = os.path.join(self.tmp.name, 'mlbam_pitch_20150812.arrow')
+        ArrowWriter.write(path, self.datasets, 'utf-8')
+        with pyarrow.OSFile(path, 'rb') as source:
+            table = pyarrow.ipc.open_file(source).read_all()
+        self.assertEqual(table.to_pylist(), [dict(row) for row in self.datasets])
+        self.assertTrue(pyarrow.types.is_dictionary(table.schema.field('home_team_id').type))
+
+    @skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_empty(self):
+        """
+        no rows
+        """
+        path = os.path.join(self.tmp.name, 'mlbam_pitch_20150812.parquet')
+        ParquetWriter.write(path, [], 'utf-8')
+        self.assertEqual(pyarrow.parquet.read_table(path).num_rows, 0)
+
+
+if __name__ == '__main__':
+    main()